@@ -0,0 +1,282 @@
+import time
+
+from depth_limited_minimax import evaluate
+from game_state import GameState
+from symmetry import from_canonical, to_canonical
+from transposition_table import EXACT, LOWER, UPPER, TranspositionTable
+
+ORDERINGS = ("tt", "history", "center")  # Every move ordering, in the order they take priority
+DEFAULT_ORDERING = ("tt", "center")  # History cutoffs on a 3x3 board are mostly immediate wins, so it is off
+CHECK_EVERY = 64  # Nodes between two looks at the clock
+CELL_SCORE = [[1, 0, 1],  # Corners are tried before edges
+              [0, 2, 0],  # And the center before everything
+              [1, 0, 1]]
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search once the deadline has passed."""
+
+
+class AlphaBeta:
+    """Alpha-beta search over tic-tac-toe boards with configurable move ordering, played in place on a GameState."""
+
+    def __init__(self, ordering=DEFAULT_ORDERING, depth=None, evaluate=evaluate, table=None, deadline=None):
+        """
+        Initialize the search.
+
+        :param ordering: move orderings to use, any of "tt" (the transposition table's best move first),
+                         "history" (moves that caused cutoffs before first) and "center"
+                         (center, then corners, then edges), empty for row-major order
+        :type ordering: tuple
+        :param depth: plies to search before calling evaluate, None to search to the end of the game
+        :type depth: int
+        :param evaluate: function returning the estimated value of a board at the depth limit
+        :type evaluate: function
+        :param table: transposition table to use, a new one is made if None
+        :type table: TranspositionTable
+        :param deadline: time.perf_counter() value after which the search raises SearchTimeout, None for no limit
+        :type deadline: float
+        :raises ValueError: if an ordering is not known
+        """
+        for name in ordering:  # Check every ordering
+            if name not in ORDERINGS:  # Unknown name
+                raise ValueError(f"unknown move ordering {name!r}, expected one of {ORDERINGS}")
+        self.ordering = tuple(ordering)  # Move orderings in use
+        self.depth = depth  # Depth limit
+        self.evaluate = evaluate  # Leaf evaluation at the depth limit
+        self.table = table if table is not None else TranspositionTable()  # Searched positions
+        self.deadline = deadline  # When to give up
+        self.history = {}  # (player, action) -> how much it caused cutoffs
+        self.nodes = 0  # Number of max_value and min_value calls
+        self.cutoffs = 0  # Number of branches pruned
+
+    def order(self, s, moves, key, k):
+        """
+        Sort the moves so the ones most likely to be best are tried first.
+
+        :param s: state
+        :type s: GameState
+        :param moves: legal actions in row-major order
+        :type moves: list
+        :param key: transposition table key of the state
+        :type key: tuple
+        :param k: symmetry from the state to its canonical board
+        :type k: int
+        :return: the same actions, best candidates first, ties kept in row-major order
+        :rtype: list
+        """
+        if not self.ordering:  # No ordering wanted
+            return moves  # Keep row-major order
+
+        stored = self.table.best_move(key) if "tt" in self.ordering else None  # Canonical best move
+        tt_move = from_canonical(stored, k) if stored is not None else None  # Back in this board's orientation
+        player = s.players()  # Player to move, history is kept per player
+        use_history = "history" in self.ordering  # Whether to look at the history
+        use_center = "center" in self.ordering  # Whether to look at the cell scores
+
+        def score(a):  # Larger is tried earlier, in the priority of ORDERINGS
+            return (a == tt_move,
+                    self.history.get((player, a), 0) if use_history else 0,
+                    CELL_SCORE[a[0]][a[1]] if use_center else 0)
+
+        return sorted(moves, key=score, reverse=True)  # Sort is stable, so ties stay in row-major order
+
+    def cutoff(self, s, a, depth):
+        """
+        Record that an action pruned the remaining branches.
+
+        :param s: state the action was played in
+        :type s: GameState
+        :param a: action that caused the cutoff
+        :type a: tuple
+        :param depth: plies that were left to search
+        :type depth: int
+        """
+        self.cutoffs += 1  # Count the cutoff
+        key = (s.players(), a)  # History is kept per player
+        self.history[key] = self.history.get(key, 0) + depth * depth  # Cutoffs high in the tree count more
+
+    def max_value(self, s, alpha, beta, depth):
+        """
+        This function returns the maximum value achievable using alpha-beta pruning
+
+        :param s: state, changed during the search and restored before returning
+        :type s: GameState
+        :param alpha: best value maximizer can guarantee
+        :type alpha: int
+        :param beta: best value minimizer can guarantee
+        :type beta: int
+        :param depth: plies left before evaluating
+        :type depth: int
+        :return: maximum value achievable, a bound if it is outside (alpha, beta)
+        :rtype: int
+        """
+        self.nodes += 1  # Count the node
+        if self.deadline is not None and self.nodes % CHECK_EVERY == 0 and time.perf_counter() > self.deadline:
+            raise SearchTimeout  # Out of time, nothing of this node has been stored
+        if s.terminal():  # Check if game is over
+            return s.utility()  # Return final game value
+        if depth == 0:  # Check if depth limit reached
+            return self.evaluate(s.board)  # Return game value based on heuristic
+
+        canonical, k = s.canonical_form()  # Same board up to symmetry and move order shares the key
+        key = ("max", canonical)  # Position key
+        cached = self.table.probe(key, depth, alpha, beta)  # Value from an earlier search
+        if cached is not None:  # Already settled
+            return cached  # Reuse it
+
+        start_alpha = alpha  # Window the search started with
+        v = -2  # Initialize with worst possible value for maximizer
+        best = None  # Action that gave v
+        for a in self.order(s, s.actions(), key, k):  # Try each possible action, best candidates first
+            s.push(a)  # Play it in place
+            child = self.min_value(s, alpha, beta, depth - 1)  # Get value from minimizer's response
+            s.pop()  # Take it back
+            if child > v:  # Better action
+                v, best = child, a  # Remember it
+            alpha = max(alpha, v)  # Update maximizer's guarantee
+            if alpha >= beta:  # Check if pruning is possible
+                self.cutoff(s, a, depth)  # Record the cutoff
+                break  # Prune remaining branches
+
+        bound = LOWER if v >= beta else UPPER if v <= start_alpha else EXACT  # What v tells about the true value
+        self.table.store(key, v, bound, depth, to_canonical(best, k))  # Best move in canonical orientation
+        return v  # Return best value achievable
+
+    def min_value(self, s, alpha, beta, depth):
+        """
+        This function returns the minimum value achievable using alpha-beta pruning
+
+        :param s: state, changed during the search and restored before returning
+        :type s: GameState
+        :param alpha: best value maximizer can guarantee
+        :type alpha: int
+        :param beta: best value minimizer can guarantee
+        :type beta: int
+        :param depth: plies left before evaluating
+        :type depth: int
+        :return: minimum value achievable, a bound if it is outside (alpha, beta)
+        :rtype: int
+        """
+        self.nodes += 1  # Count the node
+        if self.deadline is not None and self.nodes % CHECK_EVERY == 0 and time.perf_counter() > self.deadline:
+            raise SearchTimeout  # Out of time, nothing of this node has been stored
+        if s.terminal():  # Check if game is over
+            return s.utility()  # Return final game value
+        if depth == 0:  # Check if depth limit reached
+            return self.evaluate(s.board)  # Return game value based on heuristic
+
+        canonical, k = s.canonical_form()  # Same board up to symmetry and move order shares the key
+        key = ("min", canonical)  # Position key
+        cached = self.table.probe(key, depth, alpha, beta)  # Value from an earlier search
+        if cached is not None:  # Already settled
+            return cached  # Reuse it
+
+        start_beta = beta  # Window the search started with
+        v = 2  # Initialize with worst possible value for minimizer
+        best = None  # Action that gave v
+        for a in self.order(s, s.actions(), key, k):  # Try each possible action, best candidates first
+            s.push(a)  # Play it in place
+            child = self.max_value(s, alpha, beta, depth - 1)  # Get value from maximizer's response
+            s.pop()  # Take it back
+            if child < v:  # Better action
+                v, best = child, a  # Remember it
+            beta = min(beta, v)  # Update minimizer's guarantee
+            if alpha >= beta:  # Check if pruning is possible
+                self.cutoff(s, a, depth)  # Record the cutoff
+                break  # Prune remaining branches
+
+        bound = UPPER if v <= alpha else LOWER if v >= start_beta else EXACT  # What v tells about the true value
+        self.table.store(key, v, bound, depth, to_canonical(best, k))  # Best move in canonical orientation
+        return v  # Return best value achievable
+
+    def root_depth(self, s):
+        """
+        Return the plies left below the root.
+
+        :param s: state
+        :type s: GameState
+        :return: the depth limit, or the number of empty cells if there is none
+        :rtype: int
+        """
+        empty = len(s.actions())  # The game ends after at most this many plies
+        return empty if self.depth is None else min(self.depth, empty)  # Searching past the end changes nothing
+
+    def minimax_for_max(self, s):
+        """
+        This function returns the best action for the maximizer
+
+        The root is searched in row-major order like minimax.minimax_for_max so
+        ties go to the same action: actions before the current best are
+        searched with a window one below the best value, so an equal value is
+        still recognized, and actions after it only have to beat it.
+
+        :param s: state
+        :type s: list
+        :return: best action for the maximizer
+        :rtype: tuple
+        """
+        state = GameState(s)  # Searched in place, s is left as it is
+        depth = self.root_depth(state)  # Plies to search
+        best_action = None  # Initialize best action found
+        best_value = -2  # Start with worst possible value for maximizer
+        moves = state.actions()  # Root actions in row-major order
+        key, k = state.canonical_form()  # Root position key
+        for a in self.order(state, moves, ("max", key), k):  # Best candidates first, to raise best_value early
+            earlier = best_action is not None and moves.index(a) < moves.index(best_action)  # Wins ties
+            alpha = best_value - 1 if earlier else best_value  # Window that still decides this action
+            state.push(a)  # Play it
+            action_value = self.min_value(state, alpha, 2, depth - 1)  # Value after opponent responds
+            state.pop()  # Take it back
+            if action_value > best_value or (earlier and action_value == best_value):  # Better, or as good and earlier
+                best_value = action_value  # Update best value found
+                best_action = a  # Remember this action
+
+        if best_action is not None:  # Keep the root result, later searches try this move first
+            self.table.store(("max", key), best_value, EXACT, depth, to_canonical(best_action, k))
+        return best_action  # Return the optimal action
+
+    def minimax_for_min(self, s):
+        """
+        This function returns the best action for the minimizer
+
+        Ties go to the same action as minimax.minimax_for_min, see minimax_for_max.
+
+        :param s: state
+        :type s: list
+        :return: best action for the minimizer
+        :rtype: tuple
+        """
+        state = GameState(s)  # Searched in place, s is left as it is
+        depth = self.root_depth(state)  # Plies to search
+        best_action = None  # Initialize best action found
+        best_value = 2  # Start with worst possible value for minimizer
+        moves = state.actions()  # Root actions in row-major order
+        key, k = state.canonical_form()  # Root position key
+        for a in self.order(state, moves, ("min", key), k):  # Best candidates first, to lower best_value early
+            earlier = best_action is not None and moves.index(a) < moves.index(best_action)  # Wins ties
+            beta = best_value + 1 if earlier else best_value  # Window that still decides this action
+            state.push(a)  # Play it
+            action_value = self.max_value(state, -2, beta, depth - 1)  # Value after opponent responds
+            state.pop()  # Take it back
+            if action_value < best_value or (earlier and action_value == best_value):  # Better, or as good and earlier
+                best_value = action_value  # Update best value found
+                best_action = a  # Remember this action
+
+        if best_action is not None:  # Keep the root result, later searches try this move first
+            self.table.store(("min", key), best_value, EXACT, depth, to_canonical(best_action, k))
+        return best_action  # Return the optimal action
+
+
+def main():
+    starting_state = [[" ", " ", " "], [" ", " ", " "], [" ", " ", " "]]
+
+    for ordering in [(), ("center",), DEFAULT_ORDERING, ORDERINGS]:
+        search = AlphaBeta(ordering)
+        print(ordering, search.minimax_for_max(starting_state), search.nodes, search.cutoffs)
+    search = AlphaBeta(depth=3)
+    print("depth 3", search.minimax_for_max(starting_state), search.nodes, search.cutoffs)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
+from game_state import GameState
+
+
 def minimax_for_min(s, depth=3):
     """
      This function returns the best action for the minimizer
@@ -13,8 +16,12 @@ def minimax_for_min(s, depth=3):
     best_action = None  # Initialize best action found
     best_value = 2  # Start with the worst possible value for minimizer
 
-    for a in actions(s):  # Try each possible action
-        action_value = limited_max_value(result(s, a), depth - 1)  # Get value after opponent responds optimally
+    state = GameState(s)  # Searched in place, s is left as it is
+
+    for a in state.actions():  # Try each possible action
+        state.push(a)  # Play it
+        action_value = limited_max_value(state, depth - 1)  # Get value after opponent responds optimally
+        state.pop()  # Take it back
 
         if action_value < best_value:  # Check if this action is better for minimizer
             best_value = action_value  # Update best value found
@@ -38,8 +45,12 @@ def minimax_for_max(s, depth=3):
     best_action = None  # Initialize best action found
     best_value = -2  # Start with the worst possible value for maximizer
 
-    for a in actions(s):  # Try each possible action
-        action_value = limited_min_value(result(s, a), depth - 1)  # Get value after opponent responds optimally
+    state = GameState(s)  # Searched in place, s is left as it is
+
+    for a in state.actions():  # Try each possible action
+        state.push(a)  # Play it
+        action_value = limited_min_value(state, depth - 1)  # Get value after opponent responds optimally
+        state.pop()  # Take it back
 
         if action_value > best_value:  # Check if this action is better for maximizer
             best_value = action_value  # Update best value found
@@ -156,9 +167,9 @@ def utility(s):
 
     if (s[0][0] == s[1][1] == s[2][2] and s[0][0] != " ") or (
             s[0][2] == s[1][1] == s[2][0] and s[0][2] != " "):  # Check diagonals
-        if s[0][0] == "X" or s[0][2] == "X":  # X wins on diagonal
+        if s[1][1] == "X":  # X wins on diagonal, the center is on both of them
             return 1  # Return positive utility
-        elif s[0][0] == "O" or s[0][2] == "O":  # O wins on diagonal
+        elif s[1][1] == "O":  # O wins on diagonal
             return -1  # Return negative utility
 
     return 0  # No winner, return neutral utility
@@ -168,24 +179,29 @@ def limited_max_value(s, depth=3):
     """
     This function returns the maximum value achievable
 
-    :param s: state
-    :type s: list
+    :param s: state, a list board is copied into a GameState first
+    :type s: list or GameState
     :param depth: depth
     :type depth: int
     :return: maximum value achievable
     :rtype: int
     """
 
+    if not isinstance(s, GameState):  # Called with a list board
+        s = GameState(s)  # Search on a copy that is changed in place
+
     v = -2  # Initialize with the worst possible value for maximizer
-    if terminal(s):  # Check if game is over
-        return utility(s)  # Return final game value
+    if s.terminal():  # Check if game is over
+        return s.utility()  # Return final game value
 
     if depth == 0:  # Check if depth limit reached
-        return evaluate(s) # Return final game value based on heuristic
+        return evaluate(s.board) # Return final game value based on heuristic
 
     else :
-        for a in actions(s):  # Try each possible action
-            v = max(v, limited_min_value(result(s, a), depth -1))  # Get maximum value from minimizer's response
+        for a in s.actions():  # Try each possible action
+            s.push(a)  # Play it in place
+            v = max(v, limited_min_value(s, depth -1))  # Get maximum value from minimizer's response
+            s.pop()  # Take it back
 
     return v  # Return best value achievable
 
@@ -194,24 +210,29 @@ def limited_min_value(s, depth=3):
     """
     This function returns the minimum value achievable
 
-    :param s: state
-    :type s: list
+    :param s: state, a list board is copied into a GameState first
+    :type s: list or GameState
     :param depth: depth
     :type depth: int
     :return: minimum value achievable
     :rtype: int
     """
 
+    if not isinstance(s, GameState):  # Called with a list board
+        s = GameState(s)  # Search on a copy that is changed in place
+
     v = 2  # Initialize with the worst possible value for minimizer
-    if terminal(s):  # Check if game is over
-        return utility(s)  # Return final game value
+    if s.terminal():  # Check if game is over
+        return s.utility()  # Return final game value
 
     if depth == 0:  # Check if depth limit reached
-        return evaluate(s) # Return final game value based on heuristic
+        return evaluate(s.board) # Return final game value based on heuristic
 
     else:
-        for a in actions(s):  # Try each possible action
-            v = min(v, limited_max_value(result(s, a), depth - 1))  # Get minimum value from maximizer's response
+        for a in s.actions():  # Try each possible action
+            s.push(a)  # Play it in place
+            v = min(v, limited_max_value(s, depth - 1))  # Get minimum value from maximizer's response
+            s.pop()  # Take it back
 
     return v  # Return best value achievable
 
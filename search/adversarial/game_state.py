@@ -0,0 +1,166 @@
+import random
+
+from symmetry import SYMMETRIES
+
+SIZE = 3  # Board side
+MARKS = ["X", "O"]  # Players, X moves first
+LINES = ([[(i, j) for j in range(SIZE)] for i in range(SIZE)] +  # Rows
+         [[(i, j) for i in range(SIZE)] for j in range(SIZE)] +  # Columns
+         [[(i, i) for i in range(SIZE)], [(i, SIZE - 1 - i) for i in range(SIZE)]])  # Diagonals
+LINES_THROUGH = {(i, j): [line for line in LINES if (i, j) in line]  # Lines a cell is part of
+                 for i in range(SIZE) for j in range(SIZE)}
+
+_rng = random.Random(0)  # Fixed seed so hashes are the same in every run
+ZOBRIST = {(mark, i, j): _rng.getrandbits(64)  # Random key for every mark on every cell
+           for mark in MARKS for i in range(SIZE) for j in range(SIZE)}
+BITS = 64  # Width of one hash
+MASK = (1 << BITS) - 1  # Keeps one hash
+SHIFTS = [k * BITS for k in range(len(SYMMETRIES))]  # Where the hash of every symmetric board sits
+PACKED_KEYS = {(mark, i, j): sum(ZOBRIST[(mark,) + symmetry(i, j)] << shift  # Key of the mark on every
+                                 for symmetry, shift in zip(SYMMETRIES, SHIFTS))  # symmetric board, side by side
+               for mark in MARKS for i in range(SIZE) for j in range(SIZE)}
+
+
+class GameState:
+    """Tic-tac-toe position changed in place with push and pop instead of copied for every move."""
+
+    def __init__(self, s=None):
+        """
+        Initialize the state from a list board.
+
+        Besides the board it keeps the number of marks, the winner and one
+        zobrist hash per board symmetry: bits 64k to 64k+63 of hashes are the
+        hash of the board turned by SYMMETRIES[k], so the smallest of them is
+        the same for all 8 symmetric boards and serves as a canonical key.
+        Packing them into one int updates all 8 with a single XOR.
+
+        :param s: state to copy, an empty board if None
+        :type s: list
+        """
+        self.board = [[cell if cell.isalpha() else " " for cell in row] for row in s] if s else \
+            [[" "] * SIZE for _ in range(SIZE)]  # Own copy, the caller's board is never changed
+        self.count = 0  # Number of marks
+        self.hashes = 0  # Zobrist hash of every symmetric board, packed
+        self.winner = None  # Mark that completed a line, None if nobody did
+        self.stack = []  # (action, winner before it) of every push, to undo them
+
+        for i in range(SIZE):  # Count the marks already on the board
+            for j in range(SIZE):
+                if self.board[i][j] != " ":
+                    self.count += 1  # One more mark
+                    self.toggle(self.board[i][j], i, j)  # Add it to the hashes
+        for line in LINES:  # Find a winner already on the board
+            first = self.board[line[0][0]][line[0][1]]  # First cell of the line
+            if first != " " and all(self.board[i][j] == first for i, j in line):  # Three identical marks
+                self.winner = first
+
+    def toggle(self, mark, i, j):
+        """
+        Add a mark to the hashes, or remove it again (XOR undoes itself).
+
+        :param mark: "X" or "O"
+        :type mark: str
+        :param i: row of the cell
+        :type i: int
+        :param j: column of the cell
+        :type j: int
+        """
+        self.hashes ^= PACKED_KEYS[mark, i, j]  # All 8 boards at once
+
+    def players(self):
+        """
+        This function returns the player who should move next
+
+        :return: the player who should move next
+        :rtype: str
+        """
+        return MARKS[self.count % 2]  # Even number of moves means X's turn
+
+    def actions(self):
+        """
+        This function returns a list of all possible actions
+
+        :return: all empty cells in row-major order
+        :rtype: list
+        """
+        return [(i, j) for i in range(SIZE) for j in range(SIZE) if self.board[i][j] == " "]  # Empty cells
+
+    def push(self, a):
+        """
+        Play an action for the player to move, in place.
+
+        :param a: (row, column) of an empty cell
+        :type a: tuple
+        """
+        mark = self.players()  # Player to move
+        i, j = a  # Cell
+        self.stack.append((a, self.winner))  # Remember how to undo it
+        self.board[i][j] = mark  # Place the mark
+        self.count += 1  # One more mark
+        self.toggle(mark, i, j)  # Update the hashes
+        if self.winner is None:  # Only lines through the new mark can be new
+            board = self.board  # Local name, this runs for every node
+            for (r1, c1), (r2, c2), (r3, c3) in LINES_THROUGH[a]:  # Every line through the cell
+                if board[r1][c1] == board[r2][c2] == board[r3][c3]:  # Line complete, the new mark is on it
+                    self.winner = mark
+                    break
+
+    def pop(self):
+        """
+        Take back the last pushed action.
+
+        :return: the action taken back
+        :rtype: tuple
+        """
+        a, self.winner = self.stack.pop()  # Last action and the winner before it
+        i, j = a  # Cell
+        self.toggle(self.board[i][j], i, j)  # XOR removes the mark from the hashes
+        self.board[i][j] = " "  # Empty the cell
+        self.count -= 1  # One mark less
+        return a  # Return the action
+
+    def terminal(self):
+        """
+        This function returns True if the game is over
+
+        :return: True if the game is over else False
+        :rtype: bool
+        """
+        return self.winner is not None or self.count == SIZE * SIZE  # Someone won or the board is full
+
+    def utility(self):
+        """
+        This function returns the utility of the state
+
+        :return: 1 if X won, -1 if O won, 0 otherwise
+        :rtype: int
+        """
+        return 1 if self.winner == "X" else -1 if self.winner == "O" else 0  # X is the maximizer
+
+    def key(self):
+        """
+        Return the zobrist hash of the board as it is.
+
+        :return: 64-bit hash
+        :rtype: int
+        """
+        return self.hashes & MASK  # The identity symmetry comes first
+
+    def canonical_form(self):
+        """
+        Return the canonical key of the board and the symmetry that leads to it.
+
+        :return: (smallest symmetric hash, index k of its symmetry), a cell a of the board is cell
+                 SYMMETRIES[k](*a) of the canonical board
+        :rtype: tuple
+        """
+        return min((self.hashes >> shift & MASK, k) for k, shift in enumerate(SHIFTS))  # Same for all 8 boards
+
+    def canonical_key(self):
+        """
+        Return the same key for all the boards that are rotations or mirrors of each other.
+
+        :return: smallest symmetric hash
+        :rtype: int
+        """
+        return min(self.hashes >> shift & MASK for shift in SHIFTS)  # Smallest symmetric hash
@@ -0,0 +1,60 @@
+import time
+
+from board_alpha_beta import DEFAULT_ORDERING, AlphaBeta, SearchTimeout
+from depth_limited_minimax import evaluate
+from minimax import actions, players
+
+
+def iterative_deepening(s, time_limit=1.0, max_depth=None, evaluate=evaluate, ordering=DEFAULT_ORDERING):
+    """
+    This function searches depth 1, 2, 3, ... until the time runs out and returns the deepest finished answer.
+
+    All iterations share one transposition table. Every finished iteration
+    leaves the best move of each position in it, the root included, so with
+    "tt" ordering the next iteration tries the previous principal variation
+    first and prunes far more than a search from scratch would. An
+    iteration that is cut by the deadline is thrown away.
+
+    :param s: state
+    :type s: list
+    :param time_limit: seconds the search may take
+    :type time_limit: float
+    :param max_depth: deepest iteration to run, up to the end of the game if None
+    :type max_depth: int
+    :param evaluate: function returning the estimated value of a board at the depth limit
+    :type evaluate: function
+    :param ordering: move orderings passed to AlphaBeta
+    :type ordering: tuple
+    :return: (best action, depth of the last finished iteration), the first legal action and 0 if none finished
+    :rtype: tuple
+    """
+    deadline = time.perf_counter() + time_limit  # When to stop
+    moves = actions(s)  # Root actions
+    if not moves:  # Game is over
+        return None, 0  # Nothing to play
+
+    search = AlphaBeta(ordering, evaluate=evaluate, deadline=deadline)  # Shared table and history
+    find = search.minimax_for_max if players(s) == "X" else search.minimax_for_min  # Root for the side to move
+    limit = len(moves) if max_depth is None else min(max_depth, len(moves))  # Deeper than the game changes nothing
+    best_action, finished = moves[0], 0  # Some legal action, in case not even depth 1 finishes
+
+    for depth in range(1, limit + 1):  # Deepen one ply at a time
+        search.depth = depth  # Depth of this iteration
+        try:
+            best_action = find(s)  # Search it
+        except SearchTimeout:  # Out of time
+            break  # Keep the last finished answer
+        finished = depth  # Iteration done
+
+    return best_action, finished  # Return the best action found
+
+
+def main():
+    starting_state = [[" ", " ", " "], [" ", " ", " "], [" ", " ", " "]]
+
+    print(iterative_deepening(starting_state, time_limit=0.5))
+    print(iterative_deepening(starting_state, time_limit=0.001))
+
+
+if __name__ == "__main__":
+    main()
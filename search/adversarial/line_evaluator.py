@@ -0,0 +1,227 @@
+import random
+import time
+
+from mnk_game import MNKGame, best_action
+from transposition_table import TranspositionTable
+
+BASE = 4  # A line with one more mark is worth BASE times as much
+
+TIC_TAC_TOE_LINES = ([[(i, j) for j in range(3)] for i in range(3)] +  # Rows
+                     [[(i, j) for i in range(3)] for j in range(3)] +  # Columns
+                     [[(i, i) for i in range(3)], [(i, 2 - i) for i in range(3)]])  # Diagonals
+
+
+def line_value(x, o):
+    """
+    This function scores one line from the marks each player has on it
+
+    :param x: number of X marks on the line
+    :type x: int
+    :param o: number of O marks on the line
+    :type o: int
+    :return: BASE ** x if only X can still complete it, -BASE ** o if only O can, 0 otherwise
+    :rtype: int
+    """
+    if x and o:  # Blocked for both players
+        return 0
+    if x:  # Open for X
+        return BASE ** x
+    if o:  # Open for O
+        return -BASE ** o
+    return 0  # Empty line, the same for both
+
+
+def evaluate_lines(s):
+    """
+    This function returns the evaluation of a tic-tac-toe state from its open lines
+
+    It can replace depth_limited_minimax.evaluate: the value stays strictly
+    between -1 and 1, so a real win is always worth more.
+
+    :param s: state
+    :type s: list
+    :return: evaluation of the state, positive if X has more and longer open lines
+    :rtype: float
+    """
+    score = 0  # Sum of every line's value
+    for line in TIC_TAC_TOE_LINES:  # Every line
+        marks = [s[i][j] for i, j in line]  # Its cells
+        score += line_value(marks.count("X"), marks.count("O"))  # Its value
+    return score / (len(TIC_TAC_TOE_LINES) * BASE ** 3 + 1)  # Scale into (-1, 1)
+
+
+class LineEvaluator:
+    """Evaluation of an MNKGame from its open lines, kept up to date on every place and unplace."""
+
+    def __init__(self, game):
+        """
+        Attach the evaluator to a game.
+
+        Every window of k cells in a row, column or diagonal is a line. The
+        evaluator keeps how many marks each player has on every line and the
+        sum of their values, so a move only touches the lines through its cell
+        and reading the evaluation is O(1).
+
+        :param game: the game to follow, its current marks are counted first
+        :type game: MNKGame
+        """
+        self.game = game  # Game being followed
+        self.lines_of = {}  # Bit index -> ids of the lines through that cell
+        count = 0  # Number of lines
+        for row in range(game.m):  # Every start cell
+            for col in range(game.n):
+                for dr, dc in [(0, 1), (1, 0), (1, 1), (1, -1)]:  # Every direction
+                    end_row, end_col = row + dr * (game.k - 1), col + dc * (game.k - 1)  # Last cell of the window
+                    if not (0 <= end_row < game.m and 0 <= end_col < game.n):  # Window leaves the board
+                        continue  # Go to next iteration
+                    for step in range(game.k):  # Every cell of the window
+                        index = (row + dr * step) * game.width + col + dc * step  # Its bit index
+                        self.lines_of.setdefault(index, []).append(count)
+                    count += 1  # Next line id
+
+        self.counts = [[0, 0] for _ in range(count)]  # Marks of X and O on every line
+        self.score = 0  # Sum of every line's value
+        self.scale = count * BASE ** game.k + 1  # Larger than any possible score
+        for turn, index in enumerate(game.history):  # Count the marks already on the board
+            self.place(index, turn % 2)
+        game.observers.append(self)  # Follow every later move
+
+    def place(self, index, player):
+        """
+        Count a new mark.
+
+        :param index: bit index of the cell
+        :type index: int
+        :param player: 0 for X, 1 for O
+        :type player: int
+        """
+        for line in self.lines_of.get(index, ()):  # Only the lines through the cell change
+            counts = self.counts[line]  # Marks on the line
+            self.score -= line_value(counts[0], counts[1])  # Remove its old value
+            counts[player] += 1  # Add the mark
+            self.score += line_value(counts[0], counts[1])  # Add its new value
+
+    def unplace(self, index, player):
+        """
+        Forget a mark that was taken back.
+
+        :param index: bit index of the cell
+        :type index: int
+        :param player: 0 for X, 1 for O
+        :type player: int
+        """
+        for line in self.lines_of.get(index, ()):  # Only the lines through the cell change
+            counts = self.counts[line]  # Marks on the line
+            self.score -= line_value(counts[0], counts[1])  # Remove its old value
+            counts[player] -= 1  # Remove the mark
+            self.score += line_value(counts[0], counts[1])  # Add its new value
+
+    def __call__(self, game=None):
+        """
+        Return the evaluation, so the evaluator can be passed wherever an evaluate function is expected.
+
+        :param game: ignored, the evaluator always reads the game it follows
+        :type game: MNKGame
+        :return: evaluation for X, strictly between -1 and 1
+        :rtype: float
+        """
+        return self.score / self.scale  # Scale into (-1, 1)
+
+
+def center_evaluate(game):
+    """
+    This function evaluates an MNKGame like depth_limited_minimax.evaluate does: only the center cell counts
+
+    :param game: the game
+    :type game: MNKGame
+    :return: 0.5 if X has the center, -0.5 if O has it, 0 otherwise
+    :rtype: float
+    """
+    mark = game.mark(game.m // 2, game.n // 2)  # Center cell
+    return 0.5 if mark == "X" else -0.5 if mark == "O" else 0  # Stays below a win
+
+
+def play(m, n, k, first, second, depth, near, rng):
+    """
+    This function plays one game between two evaluation functions
+
+    :param m: number of rows
+    :type m: int
+    :param n: number of columns
+    :type n: int
+    :param k: marks in a row needed to win
+    :type k: int
+    :param first: "lines" or "center", evaluation used by X
+    :type first: str
+    :param second: "lines" or "center", evaluation used by O
+    :type second: str
+    :param depth: plies searched per move
+    :type depth: int
+    :param near: only try cells within this many steps of a mark
+    :type near: int
+    :param rng: random generator for the two opening moves
+    :type rng: random.Random
+    :return: (utility of the final position, seconds spent by X, seconds spent by O)
+    :rtype: tuple
+    """
+    game = MNKGame(m, n, k)  # Empty board
+    lines = LineEvaluator(game)  # Follows the game from the start
+    evaluators = [lines if name == "lines" else center_evaluate for name in (first, second)]  # Per player
+    tables = [TranspositionTable(), TranspositionTable()]  # Each player keeps its own table
+    spent = [0.0, 0.0]  # Thinking time per player
+
+    for _ in range(2):  # Random opening so the games differ
+        game.place(rng.choice(game.actions(near)))
+    while not game.terminal():  # Until someone wins or the board is full
+        player = len(game.history) % 2  # Player to move
+        started = time.perf_counter()  # Start the clock
+        a, _, _ = best_action(game, depth, tables[player], near, evaluators[player])  # Pick the move
+        spent[player] += time.perf_counter() - started  # Stop the clock
+        game.place(a)  # Play it
+
+    return game.utility(), spent[0], spent[1]  # Return the result
+
+
+def benchmark(m=7, n=7, k=4, depth=2, games=10, near=1, seed=0):
+    """
+    This function plays the line evaluator against the center-only evaluation, both colors in turn
+
+    :param m: number of rows
+    :type m: int
+    :param n: number of columns
+    :type n: int
+    :param k: marks in a row needed to win
+    :type k: int
+    :param depth: plies searched per move
+    :type depth: int
+    :param games: number of games
+    :type games: int
+    :param near: only try cells within this many steps of a mark
+    :type near: int
+    :param seed: random seed for the openings
+    :type seed: int
+    :return: wins, draws and losses of the line evaluator and the thinking time of each evaluation
+    :rtype: dict
+    """
+    rng = random.Random(seed)  # Own generator so the games only depend on the seed
+    report = {"wins": 0, "draws": 0, "losses": 0, "lines_time": 0.0, "center_time": 0.0}
+    for i in range(games):  # Every game
+        lines_first = i % 2 == 0  # Alternate colors
+        value, x_time, o_time = play(m, n, k, *(("lines", "center") if lines_first else ("center", "lines")),
+                                     depth, near, rng)
+        lines_value = value if lines_first else -value  # Result seen from the line evaluator
+        report["wins" if lines_value > 0 else "losses" if lines_value < 0 else "draws"] += 1
+        report["lines_time"] += x_time if lines_first else o_time
+        report["center_time"] += o_time if lines_first else x_time
+    return report  # Return the report
+
+
+def main():
+    s = [["X", " ", " "], [" ", "O", " "], [" ", " ", "X"]]
+    print(evaluate_lines(s))
+
+    print(benchmark())
+
+
+if __name__ == "__main__":
+    main()
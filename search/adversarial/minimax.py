@@ -1,47 +1,38 @@
+from game_state import GameState
+from mnk_game import MNKGame, best_action
+from transposition_table import EXACT, TranspositionTable
+
+table = TranspositionTable()  # Positions already searched, shared by every search in the process
+
+
 def minimax_for_min(s):
     """
      This function returns the best action for the minimizer
 
+     The board is searched as the 3,3,3 configuration of mnk_game.MNKGame.
+
      :param s: state
      :type s: list
      :return: best action for the minimizer
      :rtype: str
      """
 
-    best_action = None  # Initialize best action found
-    best_value = 2  # Start with worst possible value for minimizer
-
-    for a in actions(s):  # Try each possible action
-        action_value = max_value(result(s, a))  # Get value after opponent responds optimally
-
-        if action_value < best_value:  # Check if this action is better for minimizer
-            best_value = action_value  # Update best value found
-            best_action = a  # Remember this action
-
-    return best_action  # Return the optimal action
+    return best_action(MNKGame.from_board(s), table=table)[0]  # Only the action
 
 
 def minimax_for_max(s):
     """
     This function returns the best action for the maximizer
 
+    The board is searched as the 3,3,3 configuration of mnk_game.MNKGame.
+
     :param s: state
     :type s: list
     :return: best action for the maximizer
     :rtype: str
     """
 
-    best_action = None  # Initialize best action found
-    best_value = -2  # Start with worst possible value for maximizer
-
-    for a in actions(s):  # Try each possible action
-        action_value = min_value(result(s, a))  # Get value after opponent responds optimally
-
-        if action_value > best_value:  # Check if this action is better for maximizer
-            best_value = action_value  # Update best value found
-            best_action = a  # Remember this action
-
-    return best_action  # Return the optimal action
+    return best_action(MNKGame.from_board(s), table=table)[0]  # Only the action
 
 
 def players(s):
@@ -152,9 +143,9 @@ def utility(s):
 
     if (s[0][0] == s[1][1] == s[2][2] and s[0][0] != " ") or (
             s[0][2] == s[1][1] == s[2][0] and s[0][2] != " "):  # Check diagonals
-        if s[0][0] == "X" or s[0][2] == "X":  # X wins on diagonal
+        if s[1][1] == "X":  # X wins on diagonal, the center is on both of them
             return 1  # Return positive utility
-        elif s[0][0] == "O" or s[0][2] == "O":  # O wins on diagonal
+        elif s[1][1] == "O":  # O wins on diagonal
             return -1  # Return negative utility
 
     return 0  # No winner, return neutral utility
@@ -164,19 +155,31 @@ def max_value(s):
     """
     This function returns the maximum value achievable
 
-    :param s: state
-    :type s: list
+    :param s: state, a list board is copied into a GameState first
+    :type s: list or GameState
     :return: maximum value achievable
     :rtype: int
     """
 
+    if not isinstance(s, GameState):  # Called with a list board
+        s = GameState(s)  # Search on a copy that is changed in place
+
     v = -2  # Initialize with worst possible value for maximizer
-    if terminal(s):  # Check if game is over
-        return utility(s)  # Return final game value
+    if s.terminal():  # Check if game is over
+        return s.utility()  # Return final game value
+
+    key = ("max", s.canonical_key())  # Same board up to symmetry and move order shares the key
+    moves = s.actions()  # Remaining moves, also the depth of a full search
+    cached = table.probe(key, len(moves))  # Value from an earlier search
+    if cached is not None:  # Already searched
+        return cached  # Reuse it
 
-    for a in actions(s):  # Try each possible action
-        v = max(v, min_value(result(s, a)))  # Get maximum value from minimizer's response
+    for a in moves:  # Try each possible action
+        s.push(a)  # Play it in place
+        v = max(v, min_value(s))  # Get maximum value from minimizer's response
+        s.pop()  # Take it back
 
+    table.store(key, v, EXACT, len(moves))  # Remember the value for other move orders
     return v  # Return best value achievable
 
 
@@ -184,19 +187,31 @@ def min_value(s):
     """
     This function returns the minimum value achievable
 
-    :param s: state
-    :type s: list
+    :param s: state, a list board is copied into a GameState first
+    :type s: list or GameState
     :return: minimum value achievable
     :rtype: int
     """
 
+    if not isinstance(s, GameState):  # Called with a list board
+        s = GameState(s)  # Search on a copy that is changed in place
+
     v = 2  # Initialize with worst possible value for minimizer
-    if terminal(s):  # Check if game is over
-        return utility(s)  # Return final game value
+    if s.terminal():  # Check if game is over
+        return s.utility()  # Return final game value
+
+    key = ("min", s.canonical_key())  # Same board up to symmetry and move order shares the key
+    moves = s.actions()  # Remaining moves, also the depth of a full search
+    cached = table.probe(key, len(moves))  # Value from an earlier search
+    if cached is not None:  # Already searched
+        return cached  # Reuse it
 
-    for a in actions(s):  # Try each possible action
-        v = min(v, max_value(result(s, a)))  # Get minimum value from maximizer's response
+    for a in moves:  # Try each possible action
+        s.push(a)  # Play it in place
+        v = min(v, max_value(s))  # Get minimum value from maximizer's response
+        s.pop()  # Take it back
 
+    table.store(key, v, EXACT, len(moves))  # Remember the value for other move orders
     return v  # Return best value achievable
 
 
@@ -204,6 +219,7 @@ def main():
     starting_state = [[" ", " ", " "], [" ", " ", " "], [" ", " ", " "]]
 
     print(minimax_for_max(starting_state))
+    print(f"{len(table)} positions stored, hit rate {table.hit_rate():.2f}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,371 @@
+import random
+
+from transposition_table import EXACT, LOWER, UPPER, TranspositionTable
+
+PLAYERS = ["X", "O"]  # Marks, X moves first
+
+
+class MNKGame:
+    """m x n board where the first player to get k in a row wins, stored as two bitboards."""
+
+    def __init__(self, m=3, n=3, k=3, gravity=False, seed=0):
+        """
+        Initialize an empty board.
+
+        Cell (row, col) is bit row * (n + 1) + col. The extra column is never
+        set, so shifting a line sideways runs into it instead of wrapping onto
+        the next row.
+
+        :param m: number of rows
+        :type m: int
+        :param n: number of columns
+        :type n: int
+        :param k: marks in a row needed to win
+        :type k: int
+        :param gravity: if True marks drop to the lowest empty cell of their column, like Connect Four
+        :type gravity: bool
+        :param seed: random seed of the zobrist keys
+        :type seed: int
+        :raises ValueError: if k does not fit on the board
+        """
+        if m < 1 or n < 1 or not 1 <= k <= max(m, n):  # No line of k fits
+            raise ValueError("k must be between 1 and the longest side of the board")
+        self.m, self.n, self.k = m, n, k  # Board shape and line length
+        self.gravity = gravity  # Whether marks drop
+        self.width = n + 1  # Bits per row, one padding bit
+        self.directions = [1, self.width, self.width + 1, self.width - 1]  # Row, column and both diagonals
+
+        self.valid = 0  # Every real cell
+        for row in range(m):
+            self.valid |= ((1 << n) - 1) << row * self.width
+        self.bottom = ((1 << n) - 1) << (m - 1) * self.width  # Last row, where dropped marks land first
+
+        self.lines_through = [[] for _ in range(m * self.width)]  # Bit index -> masks of the k-windows through it
+        for row in range(m):  # Every start cell
+            for col in range(n):
+                for dr, dc in [(0, 1), (1, 0), (1, 1), (1, -1)]:  # Row, column and both diagonals
+                    if not (0 <= row + dr * (k - 1) < m and 0 <= col + dc * (k - 1) < n):  # Window leaves the board
+                        continue  # Go to next iteration
+                    cells = [(row + dr * step) * self.width + col + dc * step for step in range(k)]  # Its bits
+                    line = sum(1 << index for index in cells)  # Mask of the window
+                    for index in cells:  # Every cell of the window can complete it
+                        self.lines_through[index].append(line)
+
+        rng = random.Random(seed)  # Own generator so the keys only depend on the seed
+        self.zobrist = [[rng.getrandbits(64) for _ in range(m * self.width)] for _ in PLAYERS]  # Key per mark and cell
+
+        self.masks = [0, 0]  # Cells taken by X and by O
+        self.hash = 0  # XOR of the zobrist keys of every mark
+        self.history = []  # Bits played, in order
+        self.winner = None  # Index of the player who completed a line, None if nobody did
+        self.observers = []  # Objects told about every place and unplace, like incremental evaluators
+
+    @classmethod
+    def from_board(cls, s, k=None, gravity=False):
+        """
+        Build a game from a list board like the ones the tic-tac-toe modules use.
+
+        The marks are replayed X, O, X, ... so the side to move and the hash
+        come out right; the order within each player's marks does not matter.
+
+        :param s: state
+        :type s: list
+        :param k: marks in a row needed to win, the board side if None
+        :type k: int
+        :param gravity: if True marks drop to the lowest empty cell of their column
+        :type gravity: bool
+        :return: the game
+        :rtype: MNKGame
+        :raises ValueError: if the mark counts cannot come from alternating moves
+        """
+        game = cls(len(s), len(s[0]), k or min(len(s), len(s[0])), gravity)  # Empty board of the same shape
+        cells = [[(i, j) for i in range(len(s)) for j in range(len(s[0])) if s[i][j] == mark] for mark in PLAYERS]
+        if not 0 <= len(cells[0]) - len(cells[1]) <= 1:  # X moves first and they alternate
+            raise ValueError("X must have as many marks as O or one more")
+        for turn in range(len(cells[0]) + len(cells[1])):  # Replay the marks
+            game.place(cells[turn % 2][turn // 2])
+        return game  # Return the game
+
+    def to_board(self):
+        """
+        Return the position as a list board.
+
+        :return: state
+        :rtype: list
+        """
+        return [[self.mark(row, col) for col in range(self.n)] for row in range(self.m)]  # One character per cell
+
+    def mark(self, row, col):
+        """
+        Return the mark in a cell.
+
+        :param row: row of the cell
+        :type row: int
+        :param col: column of the cell
+        :type col: int
+        :return: "X", "O" or " "
+        :rtype: str
+        """
+        bit = 1 << row * self.width + col  # Bit of the cell
+        return "X" if self.masks[0] & bit else "O" if self.masks[1] & bit else " "
+
+    def players(self):
+        """
+        Return the player who should move next.
+
+        :return: "X" or "O"
+        :rtype: str
+        """
+        return PLAYERS[len(self.history) % 2]  # Even number of moves means X's turn
+
+    def playable(self):
+        """
+        Return the cells the player to move may take.
+
+        :return: bitboard of the legal cells
+        :rtype: int
+        """
+        taken = self.masks[0] | self.masks[1]  # Occupied cells
+        free = self.valid & ~taken  # Empty cells
+        if self.gravity:  # Only the lowest empty cell of every column
+            free &= self.bottom | (taken >> self.width)  # Resting on the bottom or on a mark
+        return free  # Return the cells
+
+    def actions(self, near=None):
+        """
+        Return every legal action.
+
+        :param near: only return cells within this many steps of a mark, all of them if None;
+                     on an empty board the center is returned
+        :type near: int
+        :return: (row, col) actions in row-major order
+        :rtype: list
+        """
+        free = self.playable()  # Legal cells
+        if near is not None:  # Big boards: only look close to the marks
+            taken = self.masks[0] | self.masks[1]  # Occupied cells
+            if not taken:  # Empty board
+                return [(self.m // 2, self.n // 2)]  # Start in the center
+            area = taken  # Grow the marks one step at a time
+            for _ in range(near):
+                grown = area  # Cells one step from the area
+                for d in self.directions:  # 8 neighbors in 4 directions
+                    grown |= (area << d) | (area >> d)
+                area = grown & self.valid  # Drop the padding and cells past the last row
+            free &= area  # Only cells close to a mark
+
+        moves = []  # Legal actions
+        while free:  # Take the lowest bit each time, which is row-major order
+            low = free & -free  # Lowest set bit
+            moves.append(divmod(low.bit_length() - 1, self.width))  # Its (row, col)
+            free ^= low  # Remove it
+        return moves  # Return the actions
+
+    def place(self, a):
+        """
+        Play an action for the player to move, updating the win state and the hash in place.
+
+        :param a: (row, col) of an empty cell
+        :type a: tuple
+        """
+        player = len(self.history) % 2  # Index of the player to move
+        index = a[0] * self.width + a[1]  # Bit index of the cell
+        self.masks[player] |= 1 << index  # One OR places the mark
+        self.hash ^= self.zobrist[player][index]  # Add the mark to the hash
+        self.history.append(index)  # Remember it for unplace
+        if self.completes_line(self.masks[player], index):  # Only lines through the new mark can be new
+            self.winner = player  # The game is over
+        for observer in self.observers:  # Let them update too
+            observer.place(index, player)
+
+    def unplace(self):
+        """
+        Take back the last action.
+        """
+        index = self.history.pop()  # Last bit played
+        player = len(self.history) % 2  # Who played it
+        self.masks[player] &= ~(1 << index)  # Remove the mark
+        self.hash ^= self.zobrist[player][index]  # XOR removes its key again
+        self.winner = None  # Nobody had won before the last move, or the game would have stopped
+        for observer in self.observers:  # Let them update too
+            observer.unplace(index, player)
+
+    def completes_line(self, mask, index):
+        """
+        Check if the mark at index is part of k in a row.
+
+        Every window of k cells through every cell is precomputed as a mask,
+        so a line is complete when one AND gives the whole window back; only
+        the windows through the new mark are tried.
+
+        :param mask: cells of the player who just moved
+        :type mask: int
+        :param index: bit index of the new mark
+        :type index: int
+        :return: True if the player has k in a row through the mark
+        :rtype: bool
+        """
+        for line in self.lines_through[index]:  # Every window through the mark
+            if mask & line == line:  # Every cell of the window is taken
+                return True  # Line complete
+        return False  # No line complete
+
+    def terminal(self):
+        """
+        Return True if the game is over.
+
+        :return: True if someone won or no move is left
+        :rtype: bool
+        """
+        return self.winner is not None or not self.playable()  # Won or full
+
+    def utility(self):
+        """
+        Return the utility of the position.
+
+        :return: 1 if X won, -1 if O won, 0 otherwise
+        :rtype: int
+        """
+        if self.winner is None:  # Nobody won
+            return 0  # Return neutral utility
+        return 1 if self.winner == 0 else -1  # X is the maximizer
+
+    def result(self, a):
+        """
+        Return a new game with the action played, leaving this one unchanged.
+
+        :param a: (row, col) action
+        :type a: tuple
+        :return: the new game
+        :rtype: MNKGame
+        """
+        game = MNKGame.__new__(MNKGame)  # Skip __init__, the zobrist keys are shared
+        game.__dict__.update(self.__dict__)  # Same shape and keys
+        game.masks = self.masks[:]  # Own marks
+        game.history = self.history[:]  # Own move list
+        game.observers = []  # Observers follow one game, not its copies
+        game.place(a)  # Play the action
+        return game  # Return the new game
+
+
+def negamax(game, depth, alpha, beta, table, stats, near=None, evaluate=None):
+    """
+    This function returns the value of a position for the player to move using alpha-beta pruning
+
+    :param game: the game, played and taken back in place
+    :type game: MNKGame
+    :param depth: plies left before evaluating
+    :type depth: int
+    :param alpha: best value the player to move can guarantee
+    :type alpha: float
+    :param beta: best value the opponent can guarantee
+    :type beta: float
+    :param table: transposition table keyed by the zobrist hash
+    :type table: TranspositionTable
+    :param stats: counters, "nodes" is increased for every call
+    :type stats: dict
+    :param near: only try cells within this many steps of a mark, all of them if None
+    :type near: int
+    :param evaluate: function estimating a position for X between -1 and 1 at the depth limit, 0 if None
+    :type evaluate: function
+    :return: value for the player to move, a bound if it is outside (alpha, beta)
+    :rtype: float
+    """
+    stats["nodes"] += 1  # Count the node
+    sign = 1 if len(game.history) % 2 == 0 else -1  # X maximizes, O minimizes
+    if game.terminal():  # Check if game is over
+        return sign * game.utility()  # Return final game value for the player to move
+    if depth == 0:  # Check if depth limit reached
+        return sign * evaluate(game) if evaluate else 0  # Return game value based on heuristic
+
+    cached = table.probe(game.hash, depth, alpha, beta)  # Value from an earlier search
+    if cached is not None:  # Already settled
+        return cached  # Reuse it
+
+    start_alpha = alpha  # Window the search started with
+    moves = game.actions(near)  # Legal actions
+    stored = table.best_move(game.hash)  # Best move of an earlier search
+    if stored in moves:  # Try it first
+        moves.remove(stored)
+        moves.insert(0, stored)
+
+    v = -2  # Initialize with worst possible value
+    best = None  # Action that gave v
+    for a in moves:  # Try each possible action
+        game.place(a)  # Play it in place
+        child = -negamax(game, depth - 1, -beta, -alpha, table, stats, near, evaluate)  # Opponent's value, negated
+        game.unplace()  # Take it back
+        if child > v:  # Better action
+            v, best = child, a  # Remember it
+        alpha = max(alpha, v)  # Update the guarantee
+        if alpha >= beta:  # Check if pruning is possible
+            break  # Prune remaining branches
+
+    bound = LOWER if v >= beta else UPPER if v <= start_alpha else EXACT  # What v tells about the true value
+    table.store(game.hash, v, bound, depth, best)  # Remember the result
+    return v  # Return best value achievable
+
+
+def best_action(game, depth=None, table=None, near=None, evaluate=None):
+    """
+    This function returns the best action for the player to move
+
+    Root actions are tried in row-major order and only a strictly better
+    value replaces the best one, so ties go to the same action as
+    minimax.minimax_for_max and minimax.minimax_for_min on 3 x 3 boards.
+
+    :param game: the game
+    :type game: MNKGame
+    :param depth: plies to search, to the end of the game if None
+    :type depth: int
+    :param table: transposition table to reuse between calls, a new one is made if None
+    :type table: TranspositionTable
+    :param near: only try cells within this many steps of a mark, all of them if None
+    :type near: int
+    :param evaluate: function estimating a position for X between -1 and 1 at the depth limit, 0 if None
+    :type evaluate: function
+    :return: (best action, its value for the player to move, nodes searched)
+    :rtype: tuple
+    """
+    table = table if table is not None else TranspositionTable()  # Searched positions
+    cells = game.m * game.n - len(game.history)  # The game ends after at most this many plies
+    depth = cells if depth is None else min(depth, cells)  # Searching past the end changes nothing
+    stats = {"nodes": 0}  # Counters
+    best, best_value = None, -2  # Start with worst possible value
+    for a in game.actions(near):  # Try each possible action
+        game.place(a)  # Play it in place
+        value = -negamax(game, depth - 1, -2, -best_value, table, stats, near, evaluate)  # Only has to beat the best
+        game.unplace()  # Take it back
+        if value > best_value:  # Check if this action is better
+            best, best_value = a, value  # Remember this action
+    return best, best_value, stats["nodes"]  # Return the result
+
+
+def tic_tac_toe():
+    """
+    This function returns an empty tic-tac-toe board, the 3,3,3 game
+
+    :return: the game
+    :rtype: MNKGame
+    """
+    return MNKGame(3, 3, 3)  # 3 x 3, three in a row
+
+
+def main():
+    game = tic_tac_toe()
+    print(best_action(game))
+
+    game = MNKGame.from_board([["X", "O", " "], [" ", "X", " "], [" ", " ", "O"]])
+    print(game.players(), best_action(game))
+
+    connect_four = MNKGame(6, 7, 4, gravity=True)
+    print(connect_four.actions(), best_action(connect_four, depth=6))
+
+    gomoku = MNKGame(15, 15, 5)
+    for move in [(7, 7), (7, 8), (8, 7), (8, 8), (6, 7), (6, 8)]:
+        gomoku.place(move)
+    print(gomoku.players(), best_action(gomoku, depth=2, near=1))
+
+
+if __name__ == "__main__":
+    main()
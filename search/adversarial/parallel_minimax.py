@@ -0,0 +1,204 @@
+import math
+import multiprocessing
+import os
+import time
+
+from mnk_game import MNKGame, best_action, negamax
+from transposition_table import TranspositionTable
+
+_worker = {}  # Search settings of the current worker process, set by init_worker
+
+
+def init_worker(game, shared, depth, near, evaluate):
+    """
+    This function stores the search settings in a worker process, it runs once per process
+
+    :param game: the game at the root, every worker plays on its own copy
+    :type game: MNKGame
+    :param shared: [best root value so far, index of its action] in shared memory
+    :type shared: multiprocessing.Array
+    :param depth: plies to search below the root
+    :type depth: int
+    :param near: only try cells within this many steps of a mark, all of them if None
+    :type near: int
+    :param evaluate: function estimating a position for X between -1 and 1 at the depth limit, 0 if None
+    :type evaluate: function
+    """
+    _worker.update(game=game, shared=shared, depth=depth, near=near, evaluate=evaluate)
+    _worker["table"] = TranspositionTable()  # One table for every root action this process searches
+
+
+def threshold(shared, index):
+    """
+    This function returns the root alpha a worker may prune with
+
+    An action after the best one in row-major order has to beat it, so it
+    is pruned as soon as it can only tie. An action before it wins a tie,
+    so the alpha sits just below the best value and a tie is still
+    searched exactly. This keeps the tie-break of mnk_game.best_action.
+
+    :param shared: [best root value so far, index of its action]
+    :type shared: multiprocessing.Array
+    :param index: position of the action being searched among the root actions
+    :type index: int
+    :return: value the action has to exceed to matter
+    :rtype: float
+    """
+    with shared.get_lock():  # Read the pair together
+        best, best_index = shared[0], shared[1]
+    return best if best_index < index else math.nextafter(best, -math.inf)  # Ties only matter before the best
+
+
+def search_root_move(task):
+    """
+    This function returns the value of one root action, searched in a worker
+
+    The opponent's replies are looped over here instead of inside negamax so
+    the shared bound can be read again before each of them: once another
+    worker has found a better root move, the remaining replies are pruned.
+    All positions below one root are the same number of plies deep, so the
+    worker's transposition table only ever holds entries of the depth they
+    are probed at and the exact values it returns do not depend on which
+    tasks the worker ran before.
+
+    :param task: (index among the root actions, action)
+    :type task: tuple
+    :return: (action, its value for the player to move at the root, exact if it matters for the result, nodes)
+    :rtype: tuple
+    """
+    index, a = task  # Root action and its position
+    game, shared, depth = _worker["game"], _worker["shared"], _worker["depth"]  # Settings of this process
+    near, evaluate, table = _worker["near"], _worker["evaluate"], _worker["table"]
+    stats = {"nodes": 0}  # Counters
+
+    game.place(a)  # Play the root action
+    replies = [] if game.terminal() or depth == 1 else game.actions(near)  # Split one ply deeper when possible
+    if not replies:  # Leaf right below the root
+        value = -negamax(game, depth - 1, -2, 2, table, stats, near, evaluate)  # Opponent's value, negated
+    else:
+        stats["nodes"] += 1  # Count the opponent's node
+        value = 1  # Nothing is worth more than a win, every reply can only lower it
+        for b in replies:  # Every reply of the opponent
+            alpha = threshold(shared, index)  # What the action has to exceed
+            if value <= alpha:  # Cannot matter anymore
+                break  # Prune remaining replies
+            game.place(b)  # Play the reply
+            child = negamax(game, depth - 2, alpha, value, table, stats, near, evaluate)  # Root player to move again
+            game.unplace()  # Take it back
+            value = min(value, child)  # Opponent picks the smallest
+    game.unplace()  # Take back the root action
+
+    with shared.get_lock():  # Other workers update it too
+        if value > shared[0] or (value == shared[0] and index < shared[1]):  # Better, or as good and earlier
+            shared[0], shared[1] = value, index  # Let every worker prune with it
+    return a, value, stats["nodes"]  # Return the result
+
+
+def parallel_best_action(game, depth=None, near=None, evaluate=None, workers=None):
+    """
+    This function returns the best action for the player to move, searching the root actions in parallel
+
+    Every root action is a task for a process pool. The best value found so
+    far and its action live in shared memory and every worker prunes
+    against them, so a strong move found by one worker cuts the search of
+    the others short. Values that decide the result are always exact and
+    ties go to the first action in row-major order, so the answer is the
+    same as mnk_game.best_action for any number of workers and any timing.
+
+    :param game: the game, it is left unchanged
+    :type game: MNKGame
+    :param depth: plies to search, to the end of the game if None
+    :type depth: int
+    :param near: only try cells within this many steps of a mark, all of them if None
+    :type near: int
+    :param evaluate: function estimating a position for X between -1 and 1 at the depth limit, 0 if None;
+                     it must be picklable, e.g. a module-level function
+    :type evaluate: function
+    :param workers: number of processes, os.cpu_count() if None, 1 searches in this process
+    :type workers: int
+    :return: (best action, its value for the player to move, nodes searched)
+    :rtype: tuple
+    :raises ValueError: if workers is less than 1
+    """
+    workers = (os.cpu_count() or 1) if workers is None else workers  # One process per core by default
+    if workers < 1:  # Nobody to search
+        raise ValueError("workers must be at least 1")
+    moves = game.actions(near)  # Root actions in row-major order
+    if not moves:  # Board is full
+        return None, -2, 0  # Nothing to play, like best_action
+
+    cells = game.m * game.n - len(game.history)  # The game ends after at most this many plies
+    depth = cells if depth is None else min(depth, cells)  # Searching past the end changes nothing
+    shared = multiprocessing.Array("d", [-2.0, len(moves)])  # Worst possible value, held by no action yet
+    settings = (game, shared, depth, near, evaluate)  # What every worker needs
+    tasks = list(enumerate(moves))  # Root actions with their position
+
+    if workers == 1:  # No pool, same search in this process
+        init_worker(*settings)
+        results = [search_root_move(task) for task in tasks]
+    else:
+        with multiprocessing.Pool(min(workers, len(moves)), init_worker, settings) as pool:
+            results = pool.map(search_root_move, tasks, chunksize=1)  # One root action at a time, in move order
+
+    best, best_value = None, -2  # Start with worst possible value
+    for a, value, _ in results:  # Row-major order, like best_action
+        if value > best_value:  # Only a strictly better value replaces the best
+            best, best_value = a, value  # Remember this action
+    return best, best_value, sum(nodes for _, _, nodes in results)  # Return the result
+
+
+def parallel_best_move(s, workers=None):
+    """
+    This function returns the best action for the player to move on a tic-tac-toe list board, searched in parallel
+
+    :param s: state
+    :type s: list
+    :param workers: number of processes, os.cpu_count() if None
+    :type workers: int
+    :return: the same action as minimax.minimax_for_max if X is to move and minimax.minimax_for_min if O is
+    :rtype: tuple
+    """
+    return parallel_best_action(MNKGame.from_board(s), workers=workers)[0]  # Only the action
+
+
+def benchmark(m=4, n=4, k=4, depth=None, near=None, workers=(1, 2, 4)):
+    """
+    This function times the sequential search against the parallel one for several pool sizes
+
+    :param m: number of rows
+    :type m: int
+    :param n: number of columns
+    :type n: int
+    :param k: marks in a row needed to win
+    :type k: int
+    :param depth: plies to search, to the end of the game if None
+    :type depth: int
+    :param near: only try cells within this many steps of a mark, all of them if None
+    :type near: int
+    :param workers: pool sizes to try
+    :type workers: tuple
+    :return: (name, action, value, nodes, seconds) of every run
+    :rtype: list
+    """
+    game = MNKGame(m, n, k)  # Empty board
+    runs = []  # Results
+    started = time.perf_counter()  # Start the clock
+    a, value, nodes = best_action(game, depth, near=near)  # Sequential reference
+    runs.append(("sequential", a, value, nodes, time.perf_counter() - started))
+    for count in workers:  # Every pool size
+        started = time.perf_counter()  # Start the clock
+        a, value, nodes = parallel_best_action(game, depth, near, workers=count)  # Same search, split at the root
+        runs.append((f"{count} workers", a, value, nodes, time.perf_counter() - started))
+    return runs  # Return the timings
+
+
+def main():
+    starting_state = [[" ", " ", " "], [" ", " ", " "], [" ", " ", " "]]
+    print(parallel_best_move(starting_state))
+
+    for run in benchmark():
+        print(run)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+from transposition_table import board_key
+
+SIZE = 3  # Board side
+
+SYMMETRIES = [lambda i, j: (i, j),  # Identity
+              lambda i, j: (j, SIZE - 1 - i),  # Rotate 90 degrees clockwise
+              lambda i, j: (SIZE - 1 - i, SIZE - 1 - j),  # Rotate 180 degrees
+              lambda i, j: (SIZE - 1 - j, i),  # Rotate 270 degrees clockwise
+              lambda i, j: (i, SIZE - 1 - j),  # Mirror left to right
+              lambda i, j: (SIZE - 1 - i, j),  # Mirror top to bottom
+              lambda i, j: (j, i),  # Mirror on the main diagonal
+              lambda i, j: (SIZE - 1 - j, SIZE - 1 - i)]  # Mirror on the other diagonal
+
+SOURCES = []  # SOURCES[k][c] is the cell that symmetry k moves onto cell c
+for symmetry in SYMMETRIES:  # Precompute every symmetry as a permutation of the 9 cells
+    source = [0] * (SIZE * SIZE)
+    for i in range(SIZE):
+        for j in range(SIZE):
+            new_i, new_j = symmetry(i, j)  # Where cell (i, j) goes
+            source[SIZE * new_i + new_j] = SIZE * i + j  # So it comes from (i, j)
+    SOURCES.append(source)
+
+INVERSE = [next(m for m in range(len(SYMMETRIES))  # INVERSE[k] is the symmetry that undoes symmetry k
+                if all(SYMMETRIES[m](*symmetry(i, j)) == (i, j) for i in range(SIZE) for j in range(SIZE)))
+           for symmetry in SYMMETRIES]
+
+
+def transform_key(key, k):
+    """
+    This function applies one of the 8 symmetries to a board key
+
+    :param key: board key from board_key
+    :type key: str
+    :param k: index of the symmetry in SYMMETRIES
+    :type k: int
+    :return: key of the rotated or mirrored board
+    :rtype: str
+    """
+    return "".join([key[c] for c in SOURCES[k]])  # Pick every cell from where it came from
+
+
+def canonical_form(s):
+    """
+    This function finds the symmetry that turns a board into its canonical representative
+
+    :param s: state
+    :type s: list
+    :return: (canonical key, index k of the symmetry), a cell a of s is cell SYMMETRIES[k](*a) of the canonical board
+    :rtype: tuple
+    """
+    key = board_key(s)  # Key of the board as it is
+    return min((transform_key(key, k), k) for k in range(len(SYMMETRIES)))  # Smallest representative
+
+
+def canonical_key(s):
+    """
+    This function returns the same key for all the boards that are rotations or mirrors of each other
+
+    :param s: state
+    :type s: list
+    :return: the smallest key among the 8 symmetric boards
+    :rtype: str
+    """
+    return canonical_form(s)[0]  # Only the key
+
+
+def to_canonical(a, k):
+    """
+    This function maps an action into the orientation of the canonical board
+
+    :param a: action on the real board
+    :type a: tuple
+    :param k: symmetry returned by canonical_form
+    :type k: int
+    :return: the same action on the canonical board
+    :rtype: tuple
+    """
+    return SYMMETRIES[k](*a)  # Apply the symmetry
+
+
+def from_canonical(a, k):
+    """
+    This function maps an action on the canonical board back to the real board orientation
+
+    :param a: action on the canonical board
+    :type a: tuple
+    :param k: symmetry returned by canonical_form
+    :type k: int
+    :return: the same action on the real board
+    :rtype: tuple
+    """
+    return SYMMETRIES[INVERSE[k]](*a)  # Undo the symmetry
+
+
+def stabilizer(s):
+    """
+    This function returns the symmetries that leave a board unchanged
+
+    :param s: state
+    :type s: list
+    :return: indices of the symmetries in SYMMETRIES, the identity always included
+    :rtype: list
+    """
+    key = board_key(s)  # Key of the board as it is
+    return [k for k in range(len(SYMMETRIES)) if transform_key(key, k) == key]  # Same board after the symmetry
+
+
+def unique_actions(s):
+    """
+    This function groups the actions that lead to symmetric boards
+
+    Two actions are equivalent when a symmetry that leaves the board
+    unchanged moves one onto the other, so only one action of every group
+    has to be searched.
+
+    :param s: state
+    :type s: list
+    :return: dictionary mapping every empty cell to the representative of its group
+    :rtype: dict
+    """
+    symmetries = [SYMMETRIES[k] for k in stabilizer(s)]  # Symmetries of this board
+    return {(i, j): min([symmetry(i, j) for symmetry in symmetries])  # Smallest equivalent cell
+            for i in range(SIZE) for j in range(SIZE) if not s[i][j].isalpha()}
@@ -0,0 +1,142 @@
+from collections import OrderedDict
+
+EXACT = 0  # Stored value is the exact minimax value
+LOWER = 1  # Search failed high, the true value is at least the stored value
+UPPER = 2  # Search failed low, the true value is at most the stored value
+
+
+def board_key(s):
+    """
+    This function returns the key of a board in the transposition table
+
+    Empty cells are written as spaces whatever they hold, so two boards with
+    the same marks always share a key. The side to move follows from the
+    number of marks, so it does not need to be part of the key.
+
+    :param s: state
+    :type s: list
+    :return: the 9 cells row by row
+    :rtype: str
+    """
+    return "".join(cell if cell.isalpha() else " " for row in s for cell in row)  # One character per cell
+
+
+class TranspositionTable:
+    """Bounded cache of searched positions shared by every search in the process."""
+
+    def __init__(self, max_size=100000):
+        """
+        Initialize an empty table.
+
+        :param max_size: most entries kept, the least recently used entry is replaced once full
+        :type max_size: int
+        :raises ValueError: if max_size is not positive
+        """
+        if max_size < 1:  # Nothing could be stored
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size  # Entry cap
+        self.entries = OrderedDict()  # Key -> (value, bound, depth, best move), least recently used first
+        self.probes = 0  # Number of lookups
+        self.hits = 0  # Lookups that returned a usable value
+        self.stores = 0  # Number of entries written
+        self.replacements = 0  # Entries dropped to make room
+
+    def probe(self, key, depth=0, alpha=-2, beta=2):
+        """
+        Look a position up.
+
+        An entry is only used if it was searched at least depth plies deep and
+        its bound settles the value inside the (alpha, beta) window: an exact
+        value always does, a lower bound does if it is at least beta and an
+        upper bound does if it is at most alpha.
+
+        :param key: position key
+        :type key: hashable
+        :param depth: plies the caller still wants searched below the position
+        :type depth: int
+        :param alpha: best value the maximizer can already guarantee
+        :type alpha: int
+        :param beta: best value the minimizer can already guarantee
+        :type beta: int
+        :return: the stored value if it can be used, None otherwise
+        :rtype: int
+        """
+        self.probes += 1  # Count the lookup
+        entry = self.entries.get(key)  # Stored entry
+        if entry is None:  # Never searched
+            return None  # Nothing usable
+        self.entries.move_to_end(key)  # Mark as recently used
+
+        value, bound, entry_depth, _ = entry  # Unpack the entry
+        if entry_depth < depth:  # Searched too shallow
+            return None  # Nothing usable
+        if bound == EXACT or (bound == LOWER and value >= beta) or (bound == UPPER and value <= alpha):
+            self.hits += 1  # Count the hit
+            return value  # Value is settled
+        return None  # Bound does not decide the window
+
+    def best_move(self, key):
+        """
+        Return the best move stored for a position, for move ordering.
+
+        :param key: position key
+        :type key: hashable
+        :return: the stored best move, None if there is none
+        :rtype: tuple
+        """
+        entry = self.entries.get(key)  # Stored entry
+        return None if entry is None else entry[3]  # Best move if present
+
+    def store(self, key, value, bound=EXACT, depth=0, best_move=None):
+        """
+        Store the result of searching a position.
+
+        A deeper entry for the same position is kept over a shallower one.
+
+        :param key: position key
+        :type key: hashable
+        :param value: value found by the search
+        :type value: int
+        :param bound: EXACT, LOWER or UPPER
+        :type bound: int
+        :param depth: plies searched below the position
+        :type depth: int
+        :param best_move: move that gave the value, None if unknown
+        :type best_move: tuple
+        """
+        old = self.entries.get(key)  # Entry being overwritten
+        if old is not None and old[2] > depth:  # Existing entry is deeper
+            self.entries.move_to_end(key)  # Still recently used
+            return  # Keep it
+
+        self.stores += 1  # Count the store
+        self.entries[key] = (value, bound, depth, best_move)  # Write the entry
+        self.entries.move_to_end(key)  # Most recently used
+        if len(self.entries) > self.max_size:  # Over the cap
+            self.entries.popitem(last=False)  # Replace the least recently used entry
+            self.replacements += 1  # Count the replacement
+
+    def hit_rate(self):
+        """
+        Return the fraction of lookups that returned a usable value.
+
+        :return: hits / probes, 0 before the first probe
+        :rtype: float
+        """
+        return self.hits / self.probes if self.probes else 0.0  # Avoid dividing by zero
+
+    def clear(self):
+        """
+        Remove every entry and reset the counters.
+        """
+        self.entries.clear()  # Drop the entries
+        self.probes = self.hits = self.stores = self.replacements = 0  # Reset the counters
+
+    def __len__(self):
+        """
+        Return the number of stored entries.
+
+        :return: number of entries
+        :rtype: int
+        """
+        return len(self.entries)  # Entries kept
@@ -0,0 +1,200 @@
+import random
+
+WALL = '*'  # Wall cell, the same marker the maze solvers check for
+OPEN = ' '  # Open cell
+
+
+def random_grid(rows, cols, wall_ratio=0.3, seed=0):
+    """
+    This function generates a grid with randomly placed walls
+
+    :param rows: number of rows
+    :type rows: int
+    :param cols: number of columns
+    :type cols: int
+    :param wall_ratio: chance of each cell being a wall
+    :type wall_ratio: float
+    :param seed: random seed
+    :type seed: int
+    :return: (maze, start, end) with the top-left and bottom-right corners kept open
+    :rtype: tuple
+    """
+    rng = random.Random(seed)  # Own generator so the grid only depends on the seed
+    maze = [[WALL if rng.random() < wall_ratio else OPEN for _ in range(cols)] for _ in range(rows)]
+    maze[0][0] = maze[rows - 1][cols - 1] = OPEN  # Start and end are always open
+    return maze, (0, 0), (rows - 1, cols - 1)  # Return the grid and its endpoints
+
+
+def perfect_maze(rows, cols, seed=0):
+    """
+    This function generates a perfect maze, exactly one path joins any two open cells
+
+    Cells on even rows and columns are rooms and the walls between them are
+    knocked down by a randomized depth first search, so odd sizes leave no
+    unused border.
+
+    :param rows: number of rows
+    :type rows: int
+    :param cols: number of columns
+    :type cols: int
+    :param seed: random seed
+    :type seed: int
+    :return: (maze, start, end) with the end at the last room
+    :rtype: tuple
+    """
+    rng = random.Random(seed)  # Own generator so the maze only depends on the seed
+    maze = [[WALL] * cols for _ in range(rows)]  # Start with walls everywhere
+    maze[0][0] = OPEN  # First room
+    stack = [(0, 0)]  # Rooms whose walls may still be knocked down
+
+    while stack:  # Continue until every room was carved
+        row, col = stack[-1]  # Deepest room
+        options = [(row + dr, col + dc) for dr, dc in [(0, 2), (2, 0), (0, -2), (-2, 0)]
+                   if 0 <= row + dr < rows and 0 <= col + dc < cols and maze[row + dr][col + dc] == WALL]
+        if not options:  # Every neighboring room was carved
+            stack.pop()  # Go back
+            continue  # Go to next iteration
+        new_row, new_col = rng.choice(options)  # Random unvisited room
+        maze[(row + new_row) // 2][(col + new_col) // 2] = OPEN  # Knock down the wall between them
+        maze[new_row][new_col] = OPEN  # Carve the room
+        stack.append((new_row, new_col))  # Continue from it
+
+    end = ((rows - 1) // 2 * 2, (cols - 1) // 2 * 2)  # Last room
+    return maze, (0, 0), end  # Return the maze and its endpoints
+
+
+def braided_maze(rows, cols, openings=0.05, seed=0):
+    """
+    This function generates a maze with loops by knocking random walls out of a perfect maze
+
+    :param rows: number of rows
+    :type rows: int
+    :param cols: number of columns
+    :type cols: int
+    :param openings: chance of each wall being removed
+    :type openings: float
+    :param seed: random seed
+    :type seed: int
+    :return: (maze, start, end) with the same endpoints as perfect_maze
+    :rtype: tuple
+    """
+    maze, start, end = perfect_maze(rows, cols, seed)  # Start from a perfect maze
+    rng = random.Random(seed)  # Own generator so the openings only depend on the seed
+    for row in range(rows):  # Every cell
+        for col in range(cols):
+            if maze[row][col] == WALL and rng.random() < openings:  # Pick a few walls
+                maze[row][col] = OPEN  # Knock them down
+    return maze, start, end  # Return the maze and its endpoints
+
+
+def rooms_and_corridors(rows, cols, rooms=8, max_room=10, seed=0):
+    """
+    This function generates a dungeon-like map of open rooms joined by narrow corridors
+
+    :param rows: number of rows
+    :type rows: int
+    :param cols: number of columns
+    :type cols: int
+    :param rooms: number of rooms to place
+    :type rooms: int
+    :param max_room: largest room side
+    :type max_room: int
+    :param seed: random seed
+    :type seed: int
+    :return: (maze, start, end) with the endpoints in the first and last room
+    :rtype: tuple
+    """
+    rng = random.Random(seed)  # Own generator so the map only depends on the seed
+    maze = [[WALL] * cols for _ in range(rows)]  # Start with walls everywhere
+    centers = []  # Center of every room, in the order they were placed
+
+    for _ in range(rooms):  # Place every room
+        height = rng.randint(3, max(3, min(max_room, rows - 2)))  # Room height
+        width = rng.randint(3, max(3, min(max_room, cols - 2)))  # Room width
+        top = rng.randint(0, max(0, rows - height))  # Top row of the room
+        left = rng.randint(0, max(0, cols - width))  # Left column of the room
+        for row in range(top, min(rows, top + height)):  # Carve the room
+            for col in range(left, min(cols, left + width)):
+                maze[row][col] = OPEN
+        centers.append((min(rows - 1, top + height // 2), min(cols - 1, left + width // 2)))  # Remember its center
+
+    for (row, col), (new_row, new_col) in zip(centers, centers[1:]):  # Join consecutive rooms
+        for c in range(min(col, new_col), max(col, new_col) + 1):  # Horizontal leg
+            maze[row][c] = OPEN
+        for r in range(min(row, new_row), max(row, new_row) + 1):  # Vertical leg
+            maze[r][new_col] = OPEN
+
+    return maze, centers[0], centers[-1]  # Return the map and its endpoints
+
+
+def scale_free_graph(nodes, edges_per_node=2, seed=0):
+    """
+    This function generates a scale-free graph by preferential attachment (Barabasi-Albert)
+
+    Every new node links to edges_per_node existing nodes picked with
+    probability proportional to their degree, which gives a few hubs with
+    very many neighbors like social and web graphs have.
+
+    :param nodes: number of nodes
+    :type nodes: int
+    :param edges_per_node: edges added with every new node
+    :type edges_per_node: int
+    :param seed: random seed
+    :type seed: int
+    :return: (tree, start, goal) where tree maps every node to its neighbor list, like bfs and dfs take
+    :rtype: tuple
+    """
+    if nodes <= edges_per_node:  # Not enough nodes to attach to
+        raise ValueError("nodes must be larger than edges_per_node")
+    rng = random.Random(seed)  # Own generator so the graph only depends on the seed
+    tree = {node: [] for node in range(nodes)}  # Neighbor lists
+    endpoints = list(range(edges_per_node))  # Every edge endpoint so far, picking from it is degree-proportional
+
+    for node in range(edges_per_node, nodes):  # Add the nodes one by one
+        chosen = set()  # Nodes the new one links to
+        while len(chosen) < edges_per_node:  # Pick distinct targets
+            chosen.add(rng.choice(endpoints))
+        for other in sorted(chosen):  # Sorted so the lists only depend on the seed
+            tree[node].append(other)  # Link both ways
+            tree[other].append(node)
+            endpoints.extend((node, other))  # Both endpoints gain a degree
+
+    return tree, nodes - 1, 0  # Return the graph, from the newest node to the oldest
+
+
+def grid_to_graph(maze):
+    """
+    This function turns a grid into neighbor lists so bfs and dfs can search it
+
+    :param maze: a 2D list representing the maze
+    :type maze: list
+    :return: open cell -> list of open cells right, down, left and up of it
+    :rtype: dict
+    """
+    rows, cols = len(maze), len(maze[0])  # Grid size
+    tree = {}  # Neighbor lists
+    for row in range(rows):  # Every cell
+        for col in range(cols):
+            if maze[row][col] == WALL:  # Walls are not nodes
+                continue  # Go to next iteration
+            tree[(row, col)] = [(row + dr, col + dc) for dr, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]
+                                if 0 <= row + dr < rows and 0 <= col + dc < cols
+                                and maze[row + dr][col + dc] != WALL]
+    return tree  # Return the graph
+
+
+GENERATORS = {"random_grid": random_grid, "perfect_maze": perfect_maze, "braided_maze": braided_maze,
+              "rooms_and_corridors": rooms_and_corridors, "scale_free_graph": scale_free_graph}  # Generators by name
+
+
+def main():
+    for generator in [random_grid, perfect_maze, braided_maze, rooms_and_corridors]:
+        maze, start, end = generator(11, 21, seed=1)
+        print(generator.__name__, start, end)
+        print("\n".join("".join(row) for row in maze))
+    tree, start, goal = scale_free_graph(10, seed=1)
+    print(tree, start, goal)
+
+
+if __name__ == "__main__":
+    main()
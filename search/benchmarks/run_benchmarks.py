@@ -0,0 +1,371 @@
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from generators import (braided_maze, grid_to_graph, perfect_maze, random_grid, rooms_and_corridors,
+                        scale_free_graph)
+
+SEARCH_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # The search folder
+TIME_TOLERANCE = 1.25  # Wall time may grow by this factor before it counts as a regression
+NOISE_FLOOR = {"wall_time": 0.002, "peak_memory": 4096}  # Smaller absolute changes are never regressions
+
+SUITES = {  # Workload sizes: grid side and graph node count
+    "small": {"grid": 41, "graph": 2000},
+    "medium": {"grid": 101, "graph": 20000},
+    "large": {"grid": 201, "graph": 200000},
+}
+
+
+def load_module(name, filename):
+    """
+    This function imports a search module from its file, so file names that are not identifiers work too
+
+    :param name: name to give the module
+    :type name: str
+    :param filename: path of the file relative to the search folder
+    :type filename: str
+    :return: the loaded module
+    :rtype: module
+    """
+    path = os.path.join(SEARCH_DIR, filename)  # Full path of the file
+    folder = os.path.dirname(path)  # Its folder, for the sibling imports the modules use
+    if folder not in sys.path:  # Not importable yet
+        sys.path.insert(0, folder)  # Make the siblings importable
+    spec = importlib.util.spec_from_file_location(name, path)  # Describe the module
+    module = importlib.util.module_from_spec(spec)  # Create it
+    spec.loader.exec_module(module)  # Run its code
+    return module  # Return the module
+
+
+BFS = load_module("breadth_first_search", "uninformed/breadth_first_search.py")
+DFS = load_module("depth_first_search", "uninformed/ depth_first_search.py")
+GREEDY = load_module("greedy_first_search", "uninformed/greedy_first_search.py")
+ASTAR = load_module("astar", "informed/astar.py")
+JPS = load_module("jump_point_search", "informed/jump_point_search.py")
+CORRIDOR = load_module("corridor_contraction", "informed/corridor_contraction.py")
+DISTANCE = load_module("distance_field", "informed/distance_field.py")
+try:
+    FLOW = load_module("flow_field", "informed/flow_field.py")
+except ImportError:  # NumPy is not installed
+    FLOW = None  # The flow_field runner is left out
+
+
+class CountingGraph:
+    """Neighbor-list graph that counts how many nodes the search expanded."""
+
+    def __init__(self, tree):
+        """
+        Wrap the graph.
+
+        :param tree: node -> list of neighbor nodes
+        :type tree: dict
+        """
+        self.tree = tree  # The wrapped graph
+        self.expanded = 0  # Number of neighbor lookups, one per expanded node
+
+    def __getitem__(self, node):
+        """
+        Return the neighbors of a node and count the expansion.
+
+        :param node: node to expand
+        :type node: hashable
+        :return: its neighbors
+        :rtype: list
+        """
+        self.expanded += 1  # Count the expansion
+        return self.tree[node]  # Return the neighbors
+
+
+def run_bfs(workload):
+    """
+    This function runs the breadth first search on a workload
+
+    :param workload: the workload
+    :type workload: dict
+    :return: (found, path cost or None, nodes expanded), bfs only reports if a path exists so the cost is None
+    :rtype: tuple
+    """
+    graph = CountingGraph(workload["graph"])  # Count the expansions
+    found = BFS.bfs(graph, workload["start"], workload["goal"])  # Run the search
+    return found, None, graph.expanded  # Return the results
+
+
+def run_dfs(workload):
+    """
+    This function runs the depth first search on a workload
+
+    :param workload: the workload
+    :type workload: dict
+    :return: (found, path cost or None, nodes expanded), dfs only reports if a path exists so the cost is None
+    :rtype: tuple
+    """
+    graph = CountingGraph(workload["graph"])  # Count the expansions
+    found = DFS.dfs(graph, workload["start"], workload["goal"])  # Run the search
+    return found, None, graph.expanded  # Return the results
+
+
+def run_greedy(workload):
+    """
+    This function runs the greedy best-first maze solver on a workload
+
+    :param workload: the workload
+    :type workload: dict
+    :return: (found, path cost or None, nodes expanded)
+    :rtype: tuple
+    """
+    path = GREEDY.solve_maze(workload["maze"], workload["start"], workload["goal"])  # Run the search
+    cost = len(path) - 1 if path else None  # One step per move
+    return bool(path), cost, GREEDY.nodes_expanded  # Return the results
+
+
+def run_astar(workload):
+    """
+    This function runs the A* maze solver on a workload
+
+    :param workload: the workload
+    :type workload: dict
+    :return: (found, path cost or None, nodes expanded)
+    :rtype: tuple
+    """
+    with contextlib.redirect_stdout(io.StringIO()):  # Keep its debug line out of the report
+        found = ASTAR.solve_maze(workload["maze"], workload["start"], workload["goal"])  # Run the search
+    cost = ASTAR.cost_dict.get(workload["goal"]) if found else None  # Cost the search settled on
+    return found, cost, ASTAR.nodes_expanded  # Return the results
+
+
+def run_jps(workload):
+    """
+    This function runs the Jump Point Search maze solver on a workload
+
+    :param workload: the workload
+    :type workload: dict
+    :return: (found, path cost or None, jump points expanded)
+    :rtype: tuple
+    """
+    path = JPS.solve_maze(workload["maze"], workload["start"], workload["goal"])  # Run the search
+    cost = len(path) - 1 if path else None  # One step per move
+    return bool(path), cost, JPS.nodes_expanded  # Return the results
+
+
+def run_corridor(workload):
+    """
+    This function contracts the maze of a workload and answers one query on the junction graph
+
+    The wall time includes building the graph, the cost a single query pays.
+    On a perfect maze pruning leaves only the path, so the query expands
+    next to nothing; the braided and open workloads keep loops and really
+    search the junction graph.
+
+    :param workload: the workload
+    :type workload: dict
+    :return: (found, path cost or None, junctions expanded)
+    :rtype: tuple
+    """
+    path = CORRIDOR.solve_maze(workload["maze"], workload["start"], workload["goal"])  # Build and query
+    cost = len(path) - 1 if path else None  # One step per move
+    return bool(path), cost, CORRIDOR.nodes_expanded  # Return the results
+
+
+def run_distance_field(workload):
+    """
+    This function fills the distance field of the goal with the scalar reverse breadth first search
+
+    :param workload: the workload
+    :type workload: dict
+    :return: (found, distance from start to goal or None, cells reached)
+    :rtype: tuple
+    """
+    maze, (row, col) = workload["maze"], workload["start"]  # Inputs
+    field = DISTANCE.compute_distance_field(maze, workload["goal"])  # Whole field, like the flow field
+    distance = field[row * len(maze[0]) + col]  # Steps from the start
+    reached = len(field) - field.count(DISTANCE.UNREACHABLE)  # Every cell the search expanded
+    found = distance != DISTANCE.UNREACHABLE  # The start can reach the goal
+    return found, distance if found else None, reached  # Return the results
+
+
+def run_flow_field(workload):
+    """
+    This function fills the flow field of the goal with the NumPy wavefront
+
+    It does the same work as run_distance_field, so the two wall times show
+    what the vectorized wavefront saves. The field is paid once for every
+    agent sharing the goal.
+
+    :param workload: the workload
+    :type workload: dict
+    :return: (found, distance from start to goal or None, cells reached)
+    :rtype: tuple
+    """
+    _, distance = FLOW.compute_flow_field(workload["maze"], workload["goal"])  # Directions and distances
+    steps = int(distance[workload["start"]])  # Steps from the start
+    reached = int((distance >= 0).sum())  # Every cell the wavefront reached
+    found = steps >= 0  # The start can reach the goal
+    return found, steps if found else None, reached  # Return the results
+
+
+ALGORITHMS = {"bfs": run_bfs, "dfs": run_dfs, "greedy": run_greedy, "astar": run_astar,
+              "jps": run_jps, "corridor": run_corridor, "distance_field": run_distance_field}  # Runners by name
+GRID_ALGORITHMS = ["bfs", "dfs", "greedy", "astar", "jps", "corridor", "distance_field"]  # Algorithms on grids
+if FLOW is not None:  # NumPy is installed
+    ALGORITHMS["flow_field"] = run_flow_field
+    GRID_ALGORITHMS.append("flow_field")
+GRAPH_ALGORITHMS = ["bfs", "dfs"]  # Algorithms that run on graphs without coordinates
+
+
+def build_workloads(suite, seed):
+    """
+    This function generates every workload of a suite
+
+    :param suite: name of the suite in SUITES
+    :type suite: str
+    :param seed: random seed passed to every generator
+    :type seed: int
+    :return: list of workloads with their name, inputs and the algorithms to run on them
+    :rtype: list
+    """
+    side = SUITES[suite]["grid"]  # Grid side
+    workloads = []  # Every workload
+    for name, (maze, start, goal) in [("random_grid", random_grid(side, side, seed=seed)),
+                                      ("open_field", random_grid(side, side, wall_ratio=0.1, seed=seed)),
+                                      ("perfect_maze", perfect_maze(side, side, seed=seed)),
+                                      ("braided_maze", braided_maze(side, side, openings=0.2, seed=seed)),
+                                      ("rooms_and_corridors", rooms_and_corridors(side, side, rooms=side // 5,
+                                                                                  seed=seed))]:
+        workloads.append({"name": name, "maze": maze, "graph": grid_to_graph(maze),
+                          "start": start, "goal": goal, "algorithms": GRID_ALGORITHMS})
+
+    tree, start, goal = scale_free_graph(SUITES[suite]["graph"], seed=seed)  # Graph workload
+    workloads.append({"name": "scale_free_graph", "graph": tree,
+                      "start": start, "goal": goal, "algorithms": GRAPH_ALGORITHMS})
+    return workloads  # Return the workloads
+
+
+def measure(runner, workload, repeat):
+    """
+    This function measures one algorithm on one workload
+
+    Wall time is the best of repeat runs without tracing, and peak memory is
+    taken from one extra run under tracemalloc, since tracing slows every
+    allocation down.
+
+    :param runner: function that runs the algorithm on a workload
+    :type runner: function
+    :param workload: the workload
+    :type workload: dict
+    :param repeat: number of timed runs
+    :type repeat: int
+    :return: the measurements
+    :rtype: dict
+    """
+    best = float("inf")  # Fastest run so far
+    for _ in range(repeat):  # Timed runs
+        started = time.perf_counter()  # Start the clock
+        found, cost, expanded = runner(workload)  # Run the algorithm
+        best = min(best, time.perf_counter() - started)  # Keep the fastest
+
+    tracemalloc.start()  # Trace allocations for the memory run
+    runner(workload)  # Same run again
+    _, peak = tracemalloc.get_traced_memory()  # Largest traced size during the run
+    tracemalloc.stop()  # Stop tracing
+
+    return {"found": bool(found), "path_cost": cost, "expansions": expanded,
+            "wall_time": round(best, 6), "peak_memory": peak}  # Return the measurements
+
+
+def run_suite(suite="small", seed=0, repeat=3, algorithms=None):
+    """
+    This function runs every algorithm on every workload of a suite
+
+    :param suite: name of the suite in SUITES
+    :type suite: str
+    :param seed: random seed passed to every generator
+    :type seed: int
+    :param repeat: number of timed runs per measurement
+    :type repeat: int
+    :param algorithms: names of the algorithms to run, all of them if None
+    :type algorithms: list
+    :return: report with the settings and a results[workload][algorithm] dictionary of measurements
+    :rtype: dict
+    """
+    results = {}  # Measurements by workload and algorithm
+    for workload in build_workloads(suite, seed):  # Every workload
+        results[workload["name"]] = {}
+        for name in workload["algorithms"]:  # Every algorithm that runs on it
+            if algorithms is None or name in algorithms:  # Selected
+                results[workload["name"]][name] = measure(ALGORITHMS[name], workload, repeat)
+    return {"suite": suite, "seed": seed, "repeat": repeat, "results": results}  # Return the report
+
+
+def compare(report, baseline, tolerance=TIME_TOLERANCE):
+    """
+    This function compares a report with a saved baseline
+
+    Expansions, path cost and whether a path was found are deterministic for
+    a given suite and seed, so any change there is reported. Wall time and
+    peak memory only count when they grow by more than the tolerance factor
+    and by more than their NOISE_FLOOR.
+
+    :param report: the new report
+    :type report: dict
+    :param baseline: the saved report
+    :type baseline: dict
+    :param tolerance: allowed growth factor of wall time and peak memory
+    :type tolerance: float
+    :return: one message per regression, empty if there is none
+    :rtype: list
+    :raises ValueError: if the two reports were made with different settings
+    """
+    if (report["suite"], report["seed"]) != (baseline["suite"], baseline["seed"]):  # Different workloads
+        raise ValueError("report and baseline must use the same suite and seed")
+
+    regressions = []  # Messages for every regression
+    for workload, algorithms in report["results"].items():  # Every workload
+        for name, new in algorithms.items():  # Every algorithm
+            old = baseline["results"].get(workload, {}).get(name)  # Baseline measurement
+            if old is None:  # Not in the baseline
+                continue  # Nothing to compare
+            for key in ["found", "path_cost", "expansions"]:  # Exact measurements
+                if new[key] != old[key]:
+                    regressions.append(f"{workload}/{name}: {key} {old[key]} -> {new[key]}")
+            for key in ["wall_time", "peak_memory"]:  # Noisy measurements
+                if old[key] and new[key] > old[key] * tolerance and new[key] - old[key] > NOISE_FLOOR[key]:
+                    regressions.append(f"{workload}/{name}: {key} {old[key]} -> {new[key]} "
+                                       f"({new[key] / old[key]:.2f}x)")
+    return regressions  # Return the regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the search algorithms on generated workloads.")
+    parser.add_argument("--suite", choices=sorted(SUITES), default="small")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--algorithms", nargs="+", choices=sorted(ALGORITHMS))
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--baseline", help="compare against this saved report")
+    parser.add_argument("--tolerance", type=float, default=TIME_TOLERANCE)
+    args = parser.parse_args()
+
+    report = run_suite(args.suite, args.seed, args.repeat, args.algorithms)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for message in regressions:
+            print("REGRESSION", message, file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
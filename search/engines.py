@@ -0,0 +1,321 @@
+import heapq
+import itertools
+import time
+from collections import deque
+
+from search_problem import GraphProblem, MazeProblem
+
+
+class SearchStats:
+    """Counters and cutoffs shared by every search engine."""
+
+    def __init__(self, max_expansions=None, time_limit=None):
+        """
+        Initialize the counters.
+
+        :param max_expansions: stop after this many expansions, None for no limit
+        :type max_expansions: int
+        :param time_limit: stop after this many seconds, None for no limit
+        :type time_limit: float
+        """
+        self.max_expansions = max_expansions  # Expansion cutoff
+        self.time_limit = time_limit  # Wall-clock cutoff
+        self.expanded = 0  # Number of states expanded
+        self.generated = 0  # Number of successors generated
+        self.max_frontier = 0  # Largest frontier seen
+        self.cut_off = False  # True if a cutoff stopped the search
+        self.started = time.perf_counter()  # When the search started
+
+    def expand(self, frontier_size):
+        """
+        Record one expansion and check the cutoffs.
+
+        :param frontier_size: current size of the frontier
+        :type frontier_size: int
+        :return: True if the search may continue, False if a cutoff was reached
+        :rtype: bool
+        """
+        self.expanded += 1  # Count this expansion
+        self.max_frontier = max(self.max_frontier, frontier_size)  # Track peak frontier size
+        if self.max_expansions is not None and self.expanded > self.max_expansions:  # Too many expansions
+            self.cut_off = True  # Remember why we stopped
+        elif self.time_limit is not None and time.perf_counter() - self.started > self.time_limit:  # Out of time
+            self.cut_off = True  # Remember why we stopped
+        return not self.cut_off  # Continue unless cut off
+
+    def elapsed(self):
+        """
+        Return the seconds since the search started.
+
+        :return: elapsed wall-clock time
+        :rtype: float
+        """
+        return time.perf_counter() - self.started  # Time since creation
+
+
+def build_path(parent, state):
+    """
+    This function rebuilds the path by following the parents back from a state
+
+    :param parent: dictionary mapping each state to the one it was reached from
+    :type parent: dict
+    :param state: last state of the path
+    :type state: hashable
+    :return: every state from the initial state to state
+    :rtype: list
+    """
+    path = []  # States from the end back to the start
+    while state is not None:  # Stop once we passed the initial state
+        path.append(state)  # Add the state
+        state = parent[state]  # Move to the previous state
+    path.reverse()  # Put them in start to end order
+    return path  # Return the path
+
+
+def bfs(problem, stats=None):
+    """
+    This function implements the breadth first search over any search problem
+
+    :param problem: the problem to solve
+    :type problem: SearchProblem
+    :param stats: counters and cutoffs, a new one is used if None
+    :type stats: SearchStats
+    :return: the path with the fewest steps if it exists, False otherwise
+    :rtype: list or bool
+    """
+    stats = stats or SearchStats()  # Counters for this search
+    start = problem.initial_state()  # State the search starts from
+    if problem.is_goal(start):  # Check if the start is already a goal
+        return [start]  # Success
+
+    parent = {start: None}  # Where each state was reached from, also the explored set
+    queue = deque([start])  # FIFO structure for breadth-first exploration
+
+    while queue:  # Continue until no more states to explore
+        if not stats.expand(len(queue)):  # Count the expansion and check the cutoffs
+            return False  # Search was cut off
+        current = queue.popleft()  # Get oldest state (FIFO behavior)
+
+        for neighbor in problem.successors(current):  # Check all adjacent states
+            stats.generated += 1  # Count the generated successor
+            if neighbor not in parent:  # Skip states we already reached
+                parent[neighbor] = current  # Remember where we came from
+                if problem.is_goal(neighbor):  # Goal test on generation, one level earlier
+                    return build_path(parent, neighbor)  # Success - path exists
+                queue.append(neighbor)  # Add to queue for future exploration
+
+    return False  # No path found - goal unreachable
+
+
+def dfs(problem, stats=None, max_depth=None):
+    """
+    This function implements the depth first search over any search problem
+
+    :param problem: the problem to solve
+    :type problem: SearchProblem
+    :param stats: counters and cutoffs, a new one is used if None
+    :type stats: SearchStats
+    :param max_depth: do not go deeper than this many steps, None for no limit
+    :type max_depth: int
+    :return: the path found if it exists, False otherwise
+    :rtype: list or bool
+    """
+    stats = stats or SearchStats()  # Counters for this search
+    start = problem.initial_state()  # State the search starts from
+    parent = {start: None}  # Where each state was reached from, also the explored set
+    depth_of = {start: 0}  # Fewest steps each state was reached with, only needed with a depth limit
+    stack = [(start, 0)]  # LIFO structure of (state, depth) for depth-first exploration
+
+    while stack:  # Continue until no more states to explore
+        current, depth = stack.pop()  # Get most recent state (LIFO behavior)
+        if depth > depth_of[current]:  # Reached with fewer steps since it was pushed
+            continue  # The shallower copy on the stack expands it
+        if problem.is_goal(current):  # Check if we found the target
+            return build_path(parent, current)  # Success - path exists
+        if not stats.expand(len(stack)):  # Count the expansion and check the cutoffs
+            return False  # Search was cut off
+        if max_depth is not None and depth >= max_depth:  # Depth limit reached
+            continue  # Do not go deeper
+
+        for neighbor in problem.successors(current):  # Check all adjacent states
+            stats.generated += 1  # Count the generated successor
+            if neighbor not in parent or (max_depth is not None and depth + 1 < depth_of[neighbor]):
+                # Push states never reached, and with a depth limit also states reached with fewer steps
+                # than before: the deeper visit may have been cut by the limit before reaching the goal
+                parent[neighbor] = current  # Remember where we came from
+                depth_of[neighbor] = depth + 1  # Steps it was reached with
+                stack.append((neighbor, depth + 1))  # Add to stack for future exploration
+
+    return False  # No path found - goal unreachable
+
+
+def iddfs(problem, stats=None, max_depth=50):
+    """
+    This function implements iterative deepening depth first search over any search problem.
+
+    Each iteration is a depth-limited search that only keeps the current path,
+    so memory stays linear in the depth while the path found has the fewest steps.
+
+    :param problem: the problem to solve
+    :type problem: SearchProblem
+    :param stats: counters and cutoffs, a new one is used if None
+    :type stats: SearchStats
+    :param max_depth: deepest limit to try
+    :type max_depth: int
+    :return: the path with the fewest steps if it exists within max_depth, False otherwise
+    :rtype: list or bool
+    """
+    stats = stats or SearchStats()  # Counters for this search
+    start = problem.initial_state()  # State the search starts from
+
+    if problem.is_goal(start):  # Check if the start is already a goal
+        return [start]  # Success
+
+    for limit in range(max_depth + 1):  # Deepen one step at a time
+        path = [start]  # Current path
+        on_path = {start}  # States on the current path, to avoid walking in circles
+        stack = []  # One iterator of untried successors per expanded path state
+        deeper = limit == 0  # True if some branch was cut by the limit, the start itself at limit 0
+
+        if limit > 0:  # The start is only expanded if its successors are within the limit
+            if not stats.expand(len(path)):  # Count the expansion of the start
+                return False  # Search was cut off
+            stack.append(iter(problem.successors(start)))  # Try its successors first
+
+        while stack:  # Continue until every branch within the limit was tried
+            neighbor = next(stack[-1], None)  # Next untried successor of the deepest state
+            if neighbor is None:  # All successors tried
+                stack.pop()  # Drop the finished iterator
+                on_path.discard(path.pop())  # Go back
+                continue  # Go to next iteration
+
+            stats.generated += 1  # Count the generated successor
+            if neighbor in on_path:  # Would walk in a circle
+                continue  # Skip it
+            if problem.is_goal(neighbor):  # Check if we found the target
+                return path + [neighbor]  # Success - path exists
+            if len(path) >= limit:  # Neighbor sits at the depth limit
+                deeper = True  # There may be more below
+                continue  # Do not expand it
+            if not stats.expand(len(path)):  # Count the expansion and check the cutoffs
+                return False  # Search was cut off
+
+            path.append(neighbor)  # Step forward
+            on_path.add(neighbor)  # Remember it is on the current path
+            stack.append(iter(problem.successors(neighbor)))  # Try its successors next
+
+        if not deeper:  # Nothing was cut by the limit, every reachable state was tried
+            return False  # No path found - goal unreachable
+
+    return False  # No path within max_depth
+
+
+def best_first(problem, priority, stats=None):
+    """
+    This function implements the best-first search loop shared by UCS, greedy search and A*
+
+    :param problem: the problem to solve
+    :type problem: SearchProblem
+    :param priority: function (cost so far, state) -> priority, lower is expanded first
+    :type priority: function
+    :param stats: counters and cutoffs, a new one is used if None
+    :type stats: SearchStats
+    :return: the path found if it exists, False otherwise
+    :rtype: list or bool
+    """
+    stats = stats or SearchStats()  # Counters for this search
+    start = problem.initial_state()  # State the search starts from
+    order = itertools.count()  # Insertion counter, ties are taken in the order they were added
+    cost = {start: 0}  # Cheapest known cost to reach each state
+    parent = {start: None}  # Where each state was reached from
+    heap = [(priority(0, start), next(order), start)]  # Open list
+    closed = set()  # States already expanded
+
+    while heap:  # Keep looping while there are states to check
+        _, _, current = heapq.heappop(heap)  # Take the state with the lowest priority
+        if current in closed:  # Skip stale heap entries
+            continue  # Go to next iteration
+        if problem.is_goal(current):  # Check if we found the target
+            return build_path(parent, current)  # Success - path exists
+        if not stats.expand(len(heap)):  # Count the expansion and check the cutoffs
+            return False  # Search was cut off
+        closed.add(current)  # Mark this state as expanded
+
+        for neighbor in problem.successors(current):  # Check all adjacent states
+            stats.generated += 1  # Count the generated successor
+            new_cost = cost[current] + problem.cost(current, neighbor)  # Cost through the current state
+            if neighbor not in closed and new_cost < cost.get(neighbor, float("inf")):  # Found a cheaper way
+                cost[neighbor] = new_cost  # Remember the new cost
+                parent[neighbor] = current  # Remember where we came from
+                heapq.heappush(heap, (priority(new_cost, neighbor), next(order), neighbor))
+
+    return False  # No path found - goal unreachable
+
+
+def ucs(problem, stats=None):
+    """
+    This function implements uniform cost search, it returns the cheapest path
+
+    :param problem: the problem to solve
+    :type problem: SearchProblem
+    :param stats: counters and cutoffs, a new one is used if None
+    :type stats: SearchStats
+    :return: the cheapest path if it exists, False otherwise
+    :rtype: list or bool
+    """
+    return best_first(problem, lambda g, state: g, stats)  # Order by cost so far
+
+
+def greedy(problem, stats=None):
+    """
+    This function implements greedy best-first search, guided only by the heuristic
+
+    :param problem: the problem to solve
+    :type problem: SearchProblem
+    :param stats: counters and cutoffs, a new one is used if None
+    :type stats: SearchStats
+    :return: the path found if it exists, False otherwise
+    :rtype: list or bool
+    """
+    return best_first(problem, lambda g, state: problem.heuristic(state), stats)  # Order by estimate only
+
+
+def astar(problem, stats=None):
+    """
+    This function implements A*, it returns the cheapest path if the heuristic never overestimates
+
+    :param problem: the problem to solve
+    :type problem: SearchProblem
+    :param stats: counters and cutoffs, a new one is used if None
+    :type stats: SearchStats
+    :return: the path found if it exists, False otherwise
+    :rtype: list or bool
+    """
+    return best_first(problem, lambda g, state: g + problem.heuristic(state), stats)  # Order by cost plus estimate
+
+
+ENGINES = {"bfs": bfs, "dfs": dfs, "iddfs": iddfs, "ucs": ucs, "greedy": greedy, "astar": astar}  # Engines by name
+
+
+def main():
+    tree = {'A': ['B', 'C'],
+            'B': ['D', 'E'],
+            'C': ['F'],
+            'D': [],
+            'E': ['F'],
+            'F': []}
+    maze = [list("    *"),
+            list(" ** *"),
+            list("    *"),
+            list("***  "),
+            list("     ")]
+
+    for name, engine in ENGINES.items():
+        stats = SearchStats()
+        print(name, engine(GraphProblem(tree, 'A', 'F'), stats), stats.expanded)
+        stats = SearchStats()
+        print(name, engine(MazeProblem(maze, (0, 0), (4, 4)), stats), stats.expanded)
+
+
+if __name__ == "__main__":
+    main()
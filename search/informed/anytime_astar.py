@@ -0,0 +1,168 @@
+import heapq
+import time
+
+from astar import manhattan, neighbors
+
+nodes_expanded = 0  # Number of positions expanded by the last search (all iterations)
+
+
+def ara_star(maze, start, end, weight=3.0, step=0.5):
+    """
+    This function runs anytime repairing A* (ARA*) and yields better and better paths.
+
+    The first pass is weighted A* with f = g + weight * h, which finds a path
+    quickly but may be up to weight times too long. After each pass the weight
+    is lowered by step and the search continues from where it stopped: only the
+    positions whose cost improved after they were expanded (the inconsistent
+    ones) are put back on the open list, so earlier work is reused instead of
+    starting over. Each yielded bound is a proven limit on how much longer the
+    path is than the optimal one, and the last one is always 1.
+
+    :param maze: a 2D list representing the maze
+    :type maze: list
+    :param start: start position
+    :type start: tuple
+    :param end: end position
+    :type end: tuple
+    :param weight: initial heuristic weight, at least 1
+    :type weight: float
+    :param step: how much the weight is lowered after each pass
+    :type step: float
+    :return: generator of (path, suboptimality bound) pairs, nothing if no path exists
+    :rtype: generator
+    """
+    global nodes_expanded  # This tells Python you want to modify the global variable
+    nodes_expanded = 0  # Reset the expansion counter
+
+    if weight < 1 or step <= 0:  # A weight below 1 or no progress would never reach the optimal path
+        raise ValueError("weight must be at least 1 and step must be positive")
+
+    cost = {start: 0}  # Cheapest known cost to reach each position
+    parent = {start: None}  # Where each position was reached from
+    open_set = {start}  # Positions waiting to be expanded in this pass
+    closed = set()  # Positions expanded in this pass
+    inconsistent = set()  # Closed positions whose cost improved, they are repaired in the next pass
+    best_cost = float("inf")  # Cost of the last path yielded
+    best_bound = float("inf")  # Bound of the last path yielded
+
+    while True:  # One pass per weight
+        heap = [(cost[n] + weight * manhattan(n, end), n) for n in open_set]  # Priorities for the current weight
+        heapq.heapify(heap)  # Turn the list into a heap
+
+        while heap:  # Improve the path until the goal is the best position left
+            f, current = heap[0]  # Look at the most promising entry
+            if current not in open_set or f != cost[current] + weight * manhattan(current, end):  # Stale entry
+                heapq.heappop(heap)  # Drop it
+                continue  # Go to next iteration
+
+            if cost.get(end, float("inf")) <= f:  # No open position can give a better path for this weight
+                break  # This pass is done
+
+            heapq.heappop(heap)  # Take the position off the heap
+            open_set.discard(current)  # It is no longer open
+            closed.add(current)  # Mark this position as expanded
+            nodes_expanded += 1  # Count this expansion
+
+            for neighbor in neighbors(maze, current):  # Check all open positions around the current one
+                new_cost = cost[current] + 1  # Every step costs 1
+                if new_cost < cost.get(neighbor, float("inf")):  # Found a cheaper way to this neighbor
+                    cost[neighbor] = new_cost  # Remember the new cost
+                    parent[neighbor] = current  # Remember where we came from
+                    if neighbor in closed:  # Already expanded in this pass
+                        inconsistent.add(neighbor)  # Repair it in the next pass
+                    else:
+                        open_set.add(neighbor)  # Expand it in this pass
+                        heapq.heappush(heap, (new_cost + weight * manhattan(neighbor, end), neighbor))
+
+        if end not in cost:  # The goal was never reached
+            return  # No path exists
+
+        lower_bound = min((cost[n] + manhattan(n, end) for n in open_set | inconsistent), default=cost[end])  # Cheapest possible path
+        bound = max(1.0, min(weight, cost[end] / lower_bound)) if lower_bound else 1.0  # Proven suboptimality of this path
+
+        if cost[end] < best_cost or bound < best_bound:  # Only report real improvements
+            best_cost = cost[end]  # Remember the new cost
+            best_bound = bound  # Remember the new bound
+            yield build_path(parent, end), bound  # Hand the path to the caller
+
+        if bound <= 1:  # The path is optimal
+            return  # Nothing left to improve
+
+        weight = max(1.0, weight - step)  # Lower the weight for the next pass
+        open_set |= inconsistent  # Positions to repair are expanded again
+        inconsistent = set()  # Nothing is inconsistent any more
+        closed = set()  # Every position may be expanded again
+
+
+def build_path(parent, end):
+    """
+    This function rebuilds the path by following the parents back from the end
+
+    :param parent: dictionary mapping each position to the one it was reached from
+    :type parent: dict
+    :param end: end position
+    :type end: tuple
+    :return: every position from start to end
+    :rtype: list
+    """
+    path = []  # Positions from end back to start
+    current = end  # Start walking back from the end
+    while current is not None:  # Stop once we passed the start
+        path.append(current)  # Add the position
+        current = parent[current]  # Move to the previous position
+    path.reverse()  # Put them in start to end order
+    return path  # Return the path
+
+
+def solve_maze(maze, start, end, time_limit=0.005, weight=3.0, step=0.5):
+    """
+    This function returns the best path ARA* can find before a time limit.
+
+    The first path is always returned even if it takes longer than time_limit,
+    later refinements are only started while time is left.
+
+    :param maze: a 2D list representing the maze
+    :type maze: list
+    :param start: start position
+    :type start: tuple
+    :param end: end position
+    :type end: tuple
+    :param time_limit: seconds to spend refining the path
+    :type time_limit: float
+    :param weight: initial heuristic weight, at least 1
+    :type weight: float
+    :param step: how much the weight is lowered after each pass
+    :type step: float
+    :return: the path from start to end if it exists, False otherwise
+    :rtype: list or bool
+    """
+    deadline = time.perf_counter() + time_limit  # When to stop refining
+    best_path = False  # Best path found so far
+
+    for path, bound in ara_star(maze, start, end, weight, step):  # Every improvement ARA* finds
+        best_path = path  # Keep the newest, it is never worse
+        if time.perf_counter() >= deadline:  # Out of time
+            break  # Stop refining
+
+    return best_path  # Return the best path found
+
+
+def main():
+    maze = []
+    for i in range(10):
+        maze.append(list(input()))
+
+    start = (0, 0)
+    goal_pos = (9, 9)
+
+    found = False
+    for path, bound in ara_star(maze, start, goal_pos):
+        found = True
+        print(f"Path of length {len(path) - 1}, at most {bound:.2f} times the optimal length.")
+
+    if not found:
+        print("Path does not exist.")
+
+
+if __name__ == "__main__":
+    main()
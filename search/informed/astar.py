@@ -1,8 +1,10 @@
 
 cost_dict = {}  # Dictionary to store the cost of each position
 goal = None     # Global variable to store the goal
+nodes_expanded = 0  # Number of positions expanded by the last search
+DIRECTIONS = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # The 4 moves on the grid: right, down, left, up
 
-def solve_maze(maze, start, end):
+def solve_maze(maze, start, end, heuristic=None):
     """
     This function uses A* algorithm to find a path from start to end in a maze.
 
@@ -12,14 +14,21 @@ def solve_maze(maze, start, end):
     :type start: tuple
     :param end: end position
     :type end: tuple
+    :param heuristic: function estimating the distance from a position to end, defaults to h
+    :type heuristic: function
     :return: the path from start to end if it exists, False otherwise
     :rtype: bool
     """
     global cost_dict  # This tells Python you want to modify the global variable
     global goal # This tells Python you want to modify the global variable
+    global nodes_expanded  # This tells Python you want to modify the global variable
     goal = end # Set the goal
+    nodes_expanded = 0  # Reset the expansion counter
     print(f"Debug: goal set to {goal}")
 
+    if heuristic is None:  # No heuristic given
+        heuristic = h  # Use the manhattan distance
+
     cost_dict.clear()  # reset dictionary
 
 
@@ -31,7 +40,7 @@ def solve_maze(maze, start, end):
     while queue:  # Keep looping while there are positions to check
         best = 0  # Initialize best position index to 0
         for i in range(len(queue)):  # Loop through all positions in queue
-            if h(queue[i]) + g(queue[i]) < h(queue[best]) + g(queue[best]):  # If current position is with the sum of cost and distance is the best
+            if heuristic(queue[i]) + g(queue[i]) < heuristic(queue[best]) + g(queue[best]):  # If current position is with the sum of cost and distance is the best
                 best = i  # Update best position index
 
         current = queue.pop(best)  # Take the closest position to end from queue
@@ -45,16 +54,10 @@ def solve_maze(maze, start, end):
             continue  # Go to next iteration of while loop
 
         visited.append(current)  # Mark this position as visited so we don't check it again
-        row, col = current  # Get current row and column from the tuple
-
-        for dr, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:  # Check all 4 directions: right, down, left, up
-            new_row = row + dr  # Calculate new row by adding direction change
-            new_col = col + dc  # Calculate new column by adding direction change
+        nodes_expanded += 1  # Count this expansion
 
-            if (0 <= new_row < len(maze) and  # New row is within maze bounds
-                    0 <= new_col < len(maze[0]) and  # New column is within maze bounds
-                    maze[new_row][new_col] != '*' and  # New position is not a wall
-                    (new_row, new_col) not in visited):  # We haven't been here before
+        for new_row, new_col in neighbors(maze, current):  # Check all open positions around the current one
+            if (new_row, new_col) not in visited:  # We haven't been here before
 
 
                 if (new_row, new_col) not in cost_dict:  # If this position is not in our cost dictionary
@@ -70,6 +73,54 @@ def solve_maze(maze, start, end):
     return False  # If we exit the while loop, queue is empty and we never found end
 
 
+def is_open(maze, row, col):
+    """
+    This function checks if a cell is inside the maze and is not a wall
+
+    :param maze: a 2D list representing the maze
+    :type maze: list
+    :param row: row of the cell
+    :type row: int
+    :param col: column of the cell
+    :type col: int
+    :return: True if the cell can be stepped on, False otherwise
+    :rtype: bool
+    """
+    return (0 <= row < len(maze) and  # Row is within maze bounds
+            0 <= col < len(maze[0]) and  # Column is within maze bounds
+            maze[row][col] != '*')  # Cell is not a wall
+
+
+def neighbors(maze, n):
+    """
+    This function returns the open positions next to a position in the maze
+
+    :param maze: a 2D list representing the maze
+    :type maze: list
+    :param n: our current position
+    :type n: tuple
+    :return: the open positions right, down, left and up of n
+    :rtype: list
+    """
+    row, col = n  # Get current row and column from the tuple
+    return [(row + dr, col + dc) for dr, dc in DIRECTIONS  # Step in all 4 directions
+            if is_open(maze, row + dr, col + dc)]  # Keep only cells we can step on
+
+
+def manhattan(a, b):
+    """
+    This function returns the manhattan distance between two positions
+
+    :param a: first position
+    :type a: tuple
+    :param b: second position
+    :type b: tuple
+    :return: the manhattan distance between a and b
+    :rtype: int
+    """
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])  # Sum of row and column differences
+
+
 def h(n):
     """
     This function returns the manhattan distance between two positions
@@ -79,7 +130,7 @@ def h(n):
     :return: the manhattan distance between two positions
     :rtype: int
     """
-    return abs(n[0] - goal[0]) + abs(n[1] - goal[1])  # Calculate Manhattan distance between two positions
+    return manhattan(n, goal)  # Calculate Manhattan distance between two positions
 
 
 def g(n):
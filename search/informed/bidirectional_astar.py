@@ -0,0 +1,105 @@
+import heapq
+
+from astar import is_open, manhattan, neighbors
+
+nodes_expanded = 0  # Number of positions expanded by the last search (both directions)
+
+
+def solve_maze(maze, start, end):
+    """
+    This function uses bidirectional A* to find a path from start to end in a maze.
+
+    One search grows from start towards end and another from end towards start,
+    each guided by the manhattan distance to its own target. Whenever a position
+    is reached by both, the combined cost is a candidate path. The search stops
+    once the best candidate is no more than the smallest f value on either open
+    list, since that value is a lower bound on every path not yet found, so the
+    returned path is optimal.
+
+    :param maze: a 2D list representing the maze
+    :type maze: list
+    :param start: start position
+    :type start: tuple
+    :param end: end position
+    :type end: tuple
+    :return: the path from start to end if it exists, False otherwise
+    :rtype: list or bool
+    """
+    global nodes_expanded  # This tells Python you want to modify the global variable
+    nodes_expanded = 0  # Reset the expansion counter
+
+    if not is_open(maze, *start) or not is_open(maze, *end):  # A wall or a position outside the maze
+        return False  # No path can start or end there
+
+    if start == end:  # Nothing to search for
+        return [start]  # The path is just the start position
+
+    cost = ({start: 0}, {end: 0})  # Cheapest known cost from start / from end for each position
+    parent = ({start: None}, {end: None})  # Where each position was reached from, per direction
+    target = (end, start)  # Each direction heads to the other one's origin
+    heaps = ([(manhattan(start, end), start)], [(manhattan(end, start), end)])  # Open lists of (f, position)
+    closed = (set(), set())  # Positions already expanded, per direction
+
+    best_cost = float("inf")  # Cost of the best path found so far (mu)
+    meeting = None  # Position where the best forward and backward paths meet
+
+    while heaps[0] and heaps[1]:  # A path can only exist while both sides have positions left
+        if best_cost <= max(heaps[0][0][0], heaps[1][0][0]):  # No open position can lead to a cheaper path
+            break  # The best path found is optimal
+
+        side = 0 if len(heaps[0]) <= len(heaps[1]) else 1  # Grow the side with the smaller open list
+        other = 1 - side  # Index of the opposite direction
+        _, current = heapq.heappop(heaps[side])  # Take the position with the lowest f on that side
+
+        if current in closed[side]:  # Skip stale heap entries
+            continue  # Go to next iteration of while loop
+
+        closed[side].add(current)  # Mark this position as expanded
+        nodes_expanded += 1  # Count this expansion
+
+        for neighbor in neighbors(maze, current):  # Check all open positions around the current one
+            new_cost = cost[side][current] + 1  # Every step costs 1
+            if new_cost < cost[side].get(neighbor, float("inf")):  # Found a cheaper way to this neighbor
+                cost[side][neighbor] = new_cost  # Remember the new cost
+                parent[side][neighbor] = current  # Remember where we came from
+                heapq.heappush(heaps[side], (new_cost + manhattan(neighbor, target[side]), neighbor))
+
+                if neighbor in cost[other] and new_cost + cost[other][neighbor] < best_cost:  # Sides connect here
+                    best_cost = new_cost + cost[other][neighbor]  # Remember the cheaper full path
+                    meeting = neighbor  # Remember where the two halves meet
+
+    if meeting is None:  # The two searches never touched
+        return False  # No path exists
+
+    path = []  # Positions from start to the meeting point
+    current = meeting  # Walk back towards start
+    while current is not None:  # Stop once we passed the start
+        path.append(current)  # Add the position
+        current = parent[0][current]  # Move towards start
+    path.reverse()  # Put them in start to meeting order
+
+    current = parent[1][meeting]  # Walk forward towards end
+    while current is not None:  # Stop once we passed the end
+        path.append(current)  # Add the position
+        current = parent[1][current]  # Move towards end
+
+    return path  # Return the full path
+
+
+def main():
+    maze = []
+    for i in range(10):
+        maze.append(list(input()))
+
+    start = (0, 0)
+    goal_pos = (9, 9)
+
+    path = solve_maze(maze, start, goal_pos)
+    if path:
+        print(f"Path exists! Length {len(path) - 1}, expanded {nodes_expanded} positions.")
+    else:
+        print("Path does not exist.")
+
+
+if __name__ == "__main__":
+    main()
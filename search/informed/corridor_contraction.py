@@ -0,0 +1,246 @@
+import heapq
+from collections import deque
+
+from astar import is_open, manhattan, neighbors
+
+nodes_expanded = 0  # Number of junctions expanded by the last search
+
+
+class CorridorGraph:
+    """Weighted graph of a maze with dead ends pruned and corridors contracted into edges."""
+
+    def __init__(self, maze):
+        """
+        Preprocess the maze once, queries can then be answered with solve.
+
+        First every dead-end branch is pruned: cells with at most one open
+        neighbor are removed over and over, and each removed cell remembers the
+        neighbor it hung from. Of the cells left, the ones that do not have
+        exactly two neighbors are junctions, and every corridor of two-neighbor
+        cells between two junctions becomes one weighted edge.
+
+        :param maze: a 2D list representing the maze
+        :type maze: list
+        """
+        self.maze = maze  # Maze the graph was built for
+        self.hung_from = {}  # Pruned cell -> cell one step closer to the kept part, None for a fully pruned piece
+        self.corridors = []  # Every corridor as the list of its cells, junctions at both ends included
+        self.adjacent = {}  # Junction -> list of (corridor index, True if the corridor starts at this junction)
+        self.corridor_of = {}  # Cell inside a corridor -> (corridor index, position in the corridor)
+        self.walked = set()  # (junction, first cell) pairs of corridors already contracted, from both ends
+
+        self.prune_dead_ends()  # Remove the dead-end branches
+        self.contract_corridors()  # Turn the rest into a weighted graph
+
+    def kept_neighbors(self, n):
+        """
+        Return the open neighbors of a cell that were not pruned.
+
+        :param n: position in the maze
+        :type n: tuple
+        :return: neighbor positions still in the graph
+        :rtype: list
+        """
+        return [neighbor for neighbor in neighbors(self.maze, n) if neighbor not in self.hung_from]  # Skip pruned cells
+
+    def prune_dead_ends(self):
+        """
+        Remove every cell that has at most one kept neighbor, until none is left.
+        """
+        degree = {}  # Number of kept neighbors of each open cell
+        for row in range(len(self.maze)):  # Loop through each row
+            for col in range(len(self.maze[0])):  # Loop through each column
+                if self.maze[row][col] != '*':  # Only open cells are in the graph
+                    degree[(row, col)] = len(neighbors(self.maze, (row, col)))  # Count its open neighbors
+
+        queue = deque(cell for cell, count in degree.items() if count <= 1)  # Dead ends to remove
+        while queue:  # Continue until no more dead ends
+            cell = queue.popleft()  # Get oldest dead end (FIFO behavior)
+            rest = self.kept_neighbors(cell)  # At most one neighbor is still kept
+            self.hung_from[cell] = rest[0] if rest else None  # Remember the way back to the kept part
+            for neighbor in rest:  # The neighbor loses one connection
+                degree[neighbor] -= 1  # Update its degree
+                if degree[neighbor] == 1:  # It just became a dead end itself
+                    queue.append(neighbor)  # Remove it later
+
+    def contract_corridors(self):
+        """
+        Turn every corridor between two junctions into one weighted edge.
+        """
+        kept = [(row, col) for row in range(len(self.maze)) for col in range(len(self.maze[0]))  # Every open cell
+                if self.maze[row][col] != '*' and (row, col) not in self.hung_from]  # That was not pruned
+
+        for cell in kept:  # Junctions are the cells that do not have exactly two kept neighbors
+            if len(self.kept_neighbors(cell)) != 2:  # Branching cell
+                self.add_junction(cell)  # Contract its corridors
+
+        for cell in kept:  # Loops without any junction are left over
+            if cell not in self.adjacent and cell not in self.corridor_of:  # Not part of the graph yet
+                self.add_junction(cell)  # Break the loop at this cell
+
+    def add_junction(self, junction):
+        """
+        Add a junction and walk every corridor leaving it that was not walked yet.
+
+        :param junction: position of the junction
+        :type junction: tuple
+        """
+        self.adjacent.setdefault(junction, [])  # The junction is in the graph even without corridors
+        for first in self.kept_neighbors(junction):  # Every corridor leaving the junction
+            if (junction, first) in self.walked:  # Corridor already walked from the other end
+                continue  # Skip it
+
+            cells = [junction, first]  # Cells of this corridor
+            while cells[-1] not in self.adjacent and len(self.kept_neighbors(cells[-1])) == 2:  # Still in the corridor
+                cells.append(next(n for n in self.kept_neighbors(cells[-1]) if n != cells[-2]))  # Step forward
+            self.adjacent.setdefault(cells[-1], [])  # The junction it ends at is in the graph
+            self.walked.update([(cells[0], cells[1]), (cells[-1], cells[-2])])  # Never walk it again
+
+            index = len(self.corridors)  # Index of the new corridor
+            self.corridors.append(cells)  # Store the corridor
+            self.adjacent[junction].append((index, True))  # It starts at this junction
+            self.adjacent[cells[-1]].append((index, False))  # And ends at the other one
+            for position, cell in enumerate(cells[1:-1], 1):  # Cells inside the corridor
+                self.corridor_of[cell] = (index, position)  # Remember where they are
+
+    def lift(self, n):
+        """
+        Return the cells from a position up its pruned branch to the kept part of the maze.
+
+        :param n: position in the maze
+        :type n: tuple
+        :return: cells from n to the first kept cell, ending in None if the branch is not attached
+        :rtype: list
+        """
+        chain = [n]  # The chain starts at the position itself
+        while chain[-1] is not None and chain[-1] in self.hung_from:  # Still on a pruned branch
+            chain.append(self.hung_from[chain[-1]])  # Step towards the kept part
+        return chain  # Return the chain
+
+    def links(self, n, leaving):
+        """
+        Return the edges connecting a kept cell to the junction graph.
+
+        :param n: kept position in the maze
+        :type n: tuple
+        :param leaving: True for edges leaving n, False for edges arriving at n
+        :type leaving: bool
+        :return: list of (junction, weight, cells from the edge source to its target)
+        :rtype: list
+        """
+        if n not in self.corridor_of:  # n is a junction
+            return []  # It is already in the graph
+
+        index, position = self.corridor_of[n]  # Corridor holding n
+        cells = self.corridors[index]  # Its cells
+        to_first = cells[position::-1]  # From n back to the first junction
+        to_last = cells[position:]  # From n forward to the last junction
+        if leaving:  # Edges from n to the junctions
+            return [(cells[0], position, to_first), (cells[-1], len(cells) - 1 - position, to_last)]
+        return [(cells[0], position, to_first[::-1]), (cells[-1], len(cells) - 1 - position, to_last[::-1])]
+
+    def solve(self, start, end):
+        """
+        Find a shortest path by searching the contracted graph and expanding it back to cells.
+
+        :param start: start position
+        :type start: tuple
+        :param end: end position
+        :type end: tuple
+        :return: the path from start to end if it exists, False otherwise
+        :rtype: list or bool
+        """
+        global nodes_expanded  # This tells Python you want to modify the global variable
+        nodes_expanded = 0  # Reset the expansion counter
+
+        if not is_open(self.maze, *start) or not is_open(self.maze, *end):  # Start or end is a wall
+            return False  # No path exists
+
+        start_chain = self.lift(start)  # Start up to the kept part
+        end_chain = self.lift(end)  # End up to the kept part
+        on_end_chain = set(end_chain)  # Fast membership checks
+        for i, cell in enumerate(start_chain):  # First cell shared by both chains
+            if cell is not None and cell in on_end_chain:  # Both hang from the same branch
+                return start_chain[:i] + end_chain[:end_chain.index(cell) + 1][::-1]  # Path through the branch
+        if start_chain[-1] is None or end_chain[-1] is None:  # A branch that is not attached to anything else
+            return False  # No path exists
+
+        source = start_chain[-1]  # Kept cell the start hangs from
+        target = end_chain[-1]  # Kept cell the end hangs from
+        extra = {source: self.links(source, True)}  # Edges from the source into the graph
+        for junction, weight, cells in self.links(target, False):  # Edges from the graph into the target
+            extra.setdefault(junction, []).append((target, weight, cells))
+        if source in self.corridor_of and target in self.corridor_of and \
+                self.corridor_of[source][0] == self.corridor_of[target][0]:  # Both inside the same corridor
+            cells = self.corridors[self.corridor_of[source][0]]  # Its cells
+            a, b = self.corridor_of[source][1], self.corridor_of[target][1]  # Their positions
+            extra[source].append((target, abs(a - b), cells[a:b + 1] if a <= b else cells[b:a + 1][::-1]))
+
+        cost = {source: 0}  # Cheapest known cost to reach each node
+        parent = {source: None}  # (previous node, cells of the edge) for each node
+        heap = [(manhattan(source, target), source)]  # Open list of (f, node)
+        closed = set()  # Nodes already expanded
+
+        while heap:  # Keep looping while there are nodes to check
+            _, current = heapq.heappop(heap)  # Take the node with the lowest f
+            if current == target:  # Reached the kept cell the end hangs from
+                break  # Done searching
+            if current in closed:  # Skip stale heap entries
+                continue  # Go to next iteration
+            closed.add(current)  # Mark this node as expanded
+            nodes_expanded += 1  # Count this expansion
+
+            edges = list(extra.get(current, []))  # Edges to and from the start and end
+            for index, forward in self.adjacent.get(current, []):  # Contracted corridors
+                cells = self.corridors[index] if forward else self.corridors[index][::-1]  # Walk them from current
+                edges.append((cells[-1], len(cells) - 1, cells))  # Weight is the corridor length
+
+            for neighbor, weight, cells in edges:  # Relax every edge
+                new_cost = cost[current] + weight  # Cost through the current node
+                if new_cost < cost.get(neighbor, float("inf")):  # Found a cheaper way
+                    cost[neighbor] = new_cost  # Remember the new cost
+                    parent[neighbor] = (current, cells)  # Remember where we came from and how
+                    heapq.heappush(heap, (new_cost + manhattan(neighbor, target), neighbor))
+        else:
+            return False  # Heap is empty and we never found the target
+
+        path = [target]  # Expand the edges back into cells, from the target back to the source
+        current = target  # Start walking back from the target
+        while parent[current] is not None:  # Stop once we reach the source
+            current, cells = parent[current]  # Previous node and the cells of the edge
+            path += cells[-2::-1]  # Add the edge cells, the node we came from last
+        return start_chain[:-1] + path[::-1] + end_chain[-2::-1]  # Add the pruned branches at both ends
+
+
+def solve_maze(maze, start, end):
+    """
+    This function contracts the maze and uses the weighted graph once to find a path.
+
+    For repeated queries build a CorridorGraph once and call its solve method.
+
+    :param maze: a 2D list representing the maze
+    :type maze: list
+    :param start: start position
+    :type start: tuple
+    :param end: end position
+    :type end: tuple
+    :return: the path from start to end if it exists, False otherwise
+    :rtype: list or bool
+    """
+    return CorridorGraph(maze).solve(start, end)  # Build and query
+
+
+def main():
+    maze = [list("         "),
+            list("  *** *  "),
+            list("  *   *  "),
+            list("  ***** *"),
+            list("         ")]
+
+    graph = CorridorGraph(maze)
+    print(graph.solve((0, 0), (4, 8)))
+    print("junctions:", len(graph.adjacent), "expanded:", nodes_expanded)
+
+
+if __name__ == "__main__":
+    main()
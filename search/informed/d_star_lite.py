@@ -0,0 +1,241 @@
+import heapq
+
+from astar import DIRECTIONS, is_open, manhattan
+
+nodes_expanded = 0  # Number of positions expanded by the last call to plan
+
+
+class DStarLite:
+    """Incremental replanner (D* Lite) that keeps its search state between maze changes."""
+
+    def __init__(self, maze, start, goal):
+        """
+        Set up the planner, the first call to plan does the initial search.
+
+        The search runs backwards from the goal, so the cost-to-goal of every
+        expanded position stays valid while the agent moves and only positions
+        whose cost is affected by a changed cell are expanded again.
+
+        :param maze: a 2D list representing the maze, it is updated in place by update_cells
+        :type maze: list
+        :param start: current position of the agent
+        :type start: tuple
+        :param goal: goal position
+        :type goal: tuple
+        """
+        self.maze = maze  # Maze being planned on
+        self.start = start  # Current position of the agent
+        self.goal = goal  # Goal position
+        self.last_start = start  # Agent position at the last maze change
+        self.km = 0  # Key modifier, grows as the agent moves so old keys stay valid lower bounds
+        self.g = {}  # Cost-to-goal found by the last expansion of each position
+        self.rhs = {goal: 0}  # One-step lookahead cost-to-goal of each position
+        self.queue = []  # Heap of (key, position) for inconsistent positions
+        self.queued = {goal: self.calculate_key(goal)}  # Current key of every queued position
+        heapq.heappush(self.queue, (self.queued[goal], goal))  # The goal is the first inconsistent position
+
+    def get_g(self, n):
+        """
+        Return the cost-to-goal of a position, infinite if it was never reached.
+
+        :param n: position in the maze
+        :type n: tuple
+        :return: g value of n
+        :rtype: float
+        """
+        return self.g.get(n, float("inf"))  # Unknown positions are infinitely far
+
+    def get_rhs(self, n):
+        """
+        Return the lookahead cost-to-goal of a position, infinite if it was never reached.
+
+        :param n: position in the maze
+        :type n: tuple
+        :return: rhs value of n
+        :rtype: float
+        """
+        return self.rhs.get(n, float("inf"))  # Unknown positions are infinitely far
+
+    def calculate_key(self, n):
+        """
+        Return the priority of a position in the queue.
+
+        :param n: position in the maze
+        :type n: tuple
+        :return: (estimated total cost, cost-to-goal), compared in that order
+        :rtype: tuple
+        """
+        best = min(self.get_g(n), self.get_rhs(n))  # Best known cost-to-goal
+        return best + manhattan(self.start, n) + self.km, best  # Guided towards the agent
+
+    def cells_around(self, n):
+        """
+        Return the in-bounds positions next to a position, walls included.
+
+        :param n: position in the maze
+        :type n: tuple
+        :return: neighbor positions inside the maze
+        :rtype: list
+        """
+        row, col = n  # Get current row and column from the tuple
+        return [(row + dr, col + dc) for dr, dc in DIRECTIONS  # Step in all 4 directions
+                if 0 <= row + dr < len(self.maze) and 0 <= col + dc < len(self.maze[0])]  # Stay in bounds
+
+    def cost(self, a, b):
+        """
+        Return the cost of stepping between two neighbor positions.
+
+        :param a: first position
+        :type a: tuple
+        :param b: second position
+        :type b: tuple
+        :return: 1, or infinite if either position is a wall
+        :rtype: float
+        """
+        if is_open(self.maze, *a) and is_open(self.maze, *b):  # Both cells can be stepped on
+            return 1  # Every step costs 1
+        return float("inf")  # Walls cannot be crossed
+
+    def update_vertex(self, n):
+        """
+        Recompute the lookahead cost of a position and queue it if it became inconsistent.
+
+        :param n: position in the maze
+        :type n: tuple
+        """
+        if n != self.goal:  # The goal always costs 0
+            self.rhs[n] = min((self.cost(n, s) + self.get_g(s) for s in self.cells_around(n)),
+                              default=float("inf"))  # Best step towards the goal
+
+        self.queued.pop(n, None)  # Old heap entry becomes stale
+        if self.get_g(n) != self.get_rhs(n):  # Inconsistent, it must be expanded
+            self.queued[n] = self.calculate_key(n)  # Remember its current key
+            heapq.heappush(self.queue, (self.queued[n], n))  # Queue it
+
+    def top_key(self):
+        """
+        Return the smallest key in the queue, dropping stale entries.
+
+        :return: smallest key, infinite if the queue is empty
+        :rtype: tuple
+        """
+        while self.queue and self.queued.get(self.queue[0][1]) != self.queue[0][0]:  # Stale entry on top
+            heapq.heappop(self.queue)  # Drop it
+        return self.queue[0][0] if self.queue else (float("inf"), float("inf"))  # Smallest valid key
+
+    def compute_shortest_path(self):
+        """
+        Expand inconsistent positions until the agent's cost-to-goal is correct.
+        """
+        global nodes_expanded  # This tells Python you want to modify the global variable
+
+        while (self.top_key() < self.calculate_key(self.start) or  # Something cheaper may still change
+               self.get_rhs(self.start) != self.get_g(self.start)):  # The agent itself is inconsistent
+            old_key, n = heapq.heappop(self.queue)  # Take the position with the smallest key
+            del self.queued[n]  # It is no longer queued
+            new_key = self.calculate_key(n)  # Key with the current agent position
+
+            if old_key < new_key:  # The key was out of date
+                self.queued[n] = new_key  # Queue it again with the right key
+                heapq.heappush(self.queue, (new_key, n))
+            elif self.get_g(n) > self.get_rhs(n):  # Cost went down
+                self.g[n] = self.rhs[n]  # Accept the cheaper cost
+                nodes_expanded += 1  # Count this expansion
+                for neighbor in self.cells_around(n):  # Neighbors may now be cheaper too
+                    self.update_vertex(neighbor)
+            else:  # Cost went up
+                self.g[n] = float("inf")  # Forget the old cost
+                nodes_expanded += 1  # Count this expansion
+                for neighbor in self.cells_around(n) + [n]:  # The position and its neighbors must be recomputed
+                    self.update_vertex(neighbor)
+
+    def plan(self):
+        """
+        Return the current shortest path, repairing only what changed since the last call.
+
+        :return: the path from the agent to the goal if it exists, False otherwise
+        :rtype: list or bool
+        """
+        global nodes_expanded  # This tells Python you want to modify the global variable
+        nodes_expanded = 0  # Reset the expansion counter
+
+        self.compute_shortest_path()  # Repair the search state
+        if self.get_g(self.start) == float("inf"):  # The agent cannot reach the goal
+            return False  # No path exists
+
+        path = [self.start]  # The path starts at the agent position
+        current = self.start  # Walk downhill from the agent
+        while current != self.goal:  # Stop at the goal
+            current = min(self.cells_around(current),
+                          key=lambda s: self.cost(current, s) + self.get_g(s))  # Cheapest step towards the goal
+            path.append(current)  # Add the position to the path
+
+        return path  # Return the full path
+
+    def move_start(self, start):
+        """
+        Tell the planner the agent moved, the search state stays valid.
+
+        :param start: new position of the agent
+        :type start: tuple
+        """
+        self.start = start  # Remember the new agent position
+
+    def update_cells(self, changes):
+        """
+        Apply a batch of cell changes and queue only the positions they affect.
+
+        :param changes: dictionary mapping positions to their new character ('*' for a wall)
+        :type changes: dict
+        """
+        self.km += manhattan(self.last_start, self.start)  # Old keys are now too large by at most this much
+        self.last_start = self.start  # Remember where the agent was at this change
+
+        for (row, col), value in changes.items():  # Every changed cell
+            self.maze[row][col] = value  # Update the maze
+
+        affected = set()  # Positions whose outgoing step costs changed
+        for cell in changes:  # Every changed cell
+            affected.add(cell)  # The cell itself
+            affected.update(self.cells_around(cell))  # And every position stepping onto it
+        for n in affected:  # Recompute only those
+            self.update_vertex(n)
+
+
+def solve_maze(maze, start, end):
+    """
+    This function uses D* Lite to find a path from start to end in a maze.
+
+    For mazes that change while the agent follows the path keep the DStarLite
+    object and call update_cells and plan instead of searching from scratch.
+
+    :param maze: a 2D list representing the maze
+    :type maze: list
+    :param start: start position
+    :type start: tuple
+    :param end: end position
+    :type end: tuple
+    :return: the path from start to end if it exists, False otherwise
+    :rtype: list or bool
+    """
+    return DStarLite(maze, start, end).plan()  # Plan once
+
+
+def main():
+    maze = []
+    for i in range(10):
+        maze.append(list(input()))
+
+    planner = DStarLite(maze, (0, 0), (9, 9))
+    path = planner.plan()
+    print(path)
+
+    if path and len(path) > 3:
+        planner.move_start(path[1])
+        planner.update_cells({path[3]: '*'})
+        print(planner.plan())
+        print(f"Replanning expanded {nodes_expanded} positions.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+from array import array
+from collections import OrderedDict, deque
+
+import astar
+from astar import DIRECTIONS, is_open
+
+UNREACHABLE = -1  # Distance stored for walls and cells that cannot reach the goal
+CACHE_SIZE = 32  # Maximum number of distance fields kept in memory
+
+field_cache = OrderedDict()  # Least recently used cache of (maze_id, goal) -> distance field
+
+
+def compute_distance_field(maze, goal):
+    """
+    This function computes the exact distance from every cell to the goal.
+
+    One reverse breadth-first search is run from the goal. Since every step
+    costs 1 this gives the true shortest distance, stored row by row in a
+    compact array of ints (cell (row, col) is at index row * columns + col).
+
+    :param maze: a 2D list representing the maze
+    :type maze: list
+    :param goal: goal position
+    :type goal: tuple
+    :return: distance of each cell to the goal, UNREACHABLE if there is no path
+    :rtype: array
+    """
+    cols = len(maze[0])  # Width of the maze
+    field = array('i', [UNREACHABLE]) * (len(maze) * cols)  # Start with every cell unreachable
+
+    if not is_open(maze, goal[0], goal[1]):  # The goal is a wall or outside the maze
+        return field  # Nothing can reach it
+
+    field[goal[0] * cols + goal[1]] = 0  # The goal is 0 steps from itself
+    queue = deque([goal])  # FIFO structure for breadth-first exploration
+
+    while queue:  # Continue until no more cells to explore
+        row, col = queue.popleft()  # Get oldest cell (FIFO behavior)
+        distance = field[row * cols + col] + 1  # Distance of its neighbors through this cell
+
+        for dr, dc in DIRECTIONS:  # Check all 4 directions
+            new_row = row + dr  # Calculate new row by adding direction change
+            new_col = col + dc  # Calculate new column by adding direction change
+            if is_open(maze, new_row, new_col) and field[new_row * cols + new_col] == UNREACHABLE:  # New open cell
+                field[new_row * cols + new_col] = distance  # First visit is the shortest distance
+                queue.append((new_row, new_col))  # Explore it later
+
+    return field  # Return the distance field
+
+
+def get_distance_field(maze_id, maze, goal):
+    """
+    This function returns the distance field of a goal, computing it only on a cache miss
+
+    :param maze_id: identifier of the maze, it must change whenever the maze changes
+    :type maze_id: hashable
+    :param maze: a 2D list representing the maze
+    :type maze: list
+    :param goal: goal position
+    :type goal: tuple
+    :return: distance of each cell to the goal, UNREACHABLE if there is no path
+    :rtype: array
+    """
+    key = (maze_id, goal)  # Fields are cached per maze and goal
+    if key in field_cache:  # Cache hit
+        field_cache.move_to_end(key)  # Mark as recently used
+        return field_cache[key]  # Return the cached field
+
+    field = compute_distance_field(maze, goal)  # Cache miss, run the reverse search once
+    field_cache[key] = field  # Remember it for later queries
+    if len(field_cache) > CACHE_SIZE:  # Over the memory cap
+        field_cache.popitem(last=False)  # Evict the least recently used field
+
+    return field  # Return the new field
+
+
+def solve_maze(maze_id, maze, start, end):
+    """
+    This function finds a shortest path by walking the cached distance field downhill.
+
+    After the field of end is cached, every query only costs the length of the path.
+
+    :param maze_id: identifier of the maze, it must change whenever the maze changes
+    :type maze_id: hashable
+    :param maze: a 2D list representing the maze
+    :type maze: list
+    :param start: start position
+    :type start: tuple
+    :param end: end position
+    :type end: tuple
+    :return: the path from start to end if it exists, False otherwise
+    :rtype: list or bool
+    """
+    field = get_distance_field(maze_id, maze, end)  # Distance of every cell to end
+    cols = len(maze[0])  # Width of the maze
+
+    if not is_open(maze, start[0], start[1]) or field[start[0] * cols + start[1]] == UNREACHABLE:  # No way to end
+        return False  # No path exists
+
+    path = [start]  # The path starts at the start position
+    row, col = start  # Get current row and column from the tuple
+    while (row, col) != end:  # Step until we reach the end
+        distance = field[row * cols + col]  # Steps left from the current cell
+        for dr, dc in DIRECTIONS:  # Look for a neighbor one step closer
+            if is_open(maze, row + dr, col + dc) and field[(row + dr) * cols + col + dc] == distance - 1:
+                row += dr  # Step one row downhill
+                col += dc  # Step one column downhill
+                break  # Take the first neighbor that is closer
+        path.append((row, col))  # Add the cell to the path
+
+    return path  # Return the full path
+
+
+def field_heuristic(field, cols):
+    """
+    This function wraps a distance field as a perfect heuristic for astar.solve_maze
+
+    :param field: distance field returned by get_distance_field
+    :type field: array
+    :param cols: width of the maze
+    :type cols: int
+    :return: function returning the exact distance of a position to the goal
+    :rtype: function
+    """
+    def heuristic(n):
+        distance = field[n[0] * cols + n[1]]  # Exact distance of this position
+        return float("inf") if distance == UNREACHABLE else distance  # Cells that cannot reach the goal are never picked
+
+    return heuristic  # Return the heuristic
+
+
+def main():
+    maze = []
+    for i in range(10):
+        maze.append(list(input()))
+
+    goal_pos = (9, 9)
+
+    for start in [(0, 0), (0, 9), (9, 0)]:
+        path = solve_maze("input", maze, start, goal_pos)
+        if path:
+            print(f"Path from {start} exists! Length {len(path) - 1}.")
+        else:
+            print(f"Path from {start} does not exist.")
+
+    field = get_distance_field("input", maze, goal_pos)
+    print(astar.solve_maze(maze, (0, 0), goal_pos, heuristic=field_heuristic(field, len(maze[0]))))
+
+
+if __name__ == "__main__":
+    main()
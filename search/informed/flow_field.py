@@ -0,0 +1,151 @@
+import numpy as np
+
+from astar import DIRECTIONS
+
+NO_MOVE = -1  # Direction stored for walls, the goal and cells that cannot reach it
+SMALL_FRONTIER = 32  # Wavefronts with fewer cells are expanded in a loop instead of with array calls
+
+
+def shifted(grid, dr, dc, fill):
+    """
+    This function returns, for every cell, the value of its neighbor in one direction
+
+    :param grid: 2D array
+    :type grid: numpy.ndarray
+    :param dr: row change towards the neighbor
+    :type dr: int
+    :param dc: column change towards the neighbor
+    :type dc: int
+    :param fill: value used where the neighbor is outside the grid
+    :type fill: any
+    :return: array where result[row, col] == grid[row + dr, col + dc]
+    :rtype: numpy.ndarray
+    """
+    rows, cols = grid.shape  # Size of the grid
+    result = np.full_like(grid, fill)  # Start with the fill value everywhere
+    result[max(0, -dr):rows - max(0, dr), max(0, -dc):cols - max(0, dc)] = \
+        grid[max(0, dr):rows + min(0, dr), max(0, dc):cols + min(0, dc)]  # Copy the overlapping part
+    return result  # Return the shifted grid
+
+
+def compute_flow_field(maze, goal):
+    """
+    This function computes the next step towards the goal for every cell at once.
+
+    A breadth-first wavefront grows from the goal one ring per step. The grid
+    gets a border of walls and is flattened, so the neighbors of a cell are
+    fixed index offsets and never fall outside it. A ring is an array of
+    cell indices and only its neighbors are gathered, so every ring costs
+    O(ring size) instead of O(grid size). Rings smaller than SMALL_FRONTIER,
+    like the single cell running down a maze corridor, are expanded in a
+    plain loop because NumPy calls cost more than they save there. Each cell
+    then points to a neighbor one step closer to the goal, so any number of
+    agents can read their next move in O(1).
+
+    :param maze: a 2D list representing the maze
+    :type maze: list
+    :param goal: goal position
+    :type goal: tuple
+    :return: (direction index into DIRECTIONS or NO_MOVE per cell, distance to goal or -1 per cell)
+    :rtype: tuple
+    """
+    rows, cols = len(maze), len(maze[0])  # Size of the maze
+    width = cols + 2  # Row length with a wall column on both sides
+    padded = np.zeros((rows + 2, width), dtype=bool)  # Open cells inside a border of walls
+    padded[1:-1, 1:-1] = np.array(maze) != '*'  # True where the cell is not a wall
+    unreached = padded.ravel()  # Open cells the wavefront has not reached yet, flat
+    distance = np.full(unreached.shape, -1, dtype=np.int32)  # Every cell starts unreached
+    offsets = [dr * width + dc for dr, dc in DIRECTIONS]  # Flat index change of every move
+    offset_array = np.array(offsets)  # The same, for gathering whole rings at once
+
+    start = (goal[0] + 1) * width + goal[1] + 1  # Flat index of the goal
+    if unreached[start]:  # The goal is open
+        unreached[start] = False  # The goal is reached
+        distance[start] = 0  # The goal is 0 steps from itself
+        frontier = [start]  # The wavefront starts at the goal
+    else:
+        frontier = []  # Nothing can reach a wall
+    step = 0  # Distance of the current wavefront
+
+    while len(frontier):  # Continue until the wavefront dies out
+        step += 1  # Next ring is one step further
+        if len(frontier) < SMALL_FRONTIER:  # Few cells, a loop is cheaper than array calls
+            ring = []  # Cells of the next ring
+            for cell in frontier:  # Every cell of the wavefront
+                for offset in offsets:  # Check all 4 directions
+                    if unreached[cell + offset]:  # New open cell
+                        unreached[cell + offset] = False  # Reached now
+                        ring.append(cell + offset)  # Part of the next ring
+        else:
+            touched = (np.asarray(frontier)[:, None] + offset_array).ravel()  # Neighbors of the whole wavefront
+            ring = np.unique(touched[unreached[touched]])  # New open cells, each once
+            unreached[ring] = False  # Reached now
+        distance[ring] = step  # They are one step further than the last ring
+        frontier = ring  # The next ring becomes the wavefront
+
+    distance = distance.reshape(rows + 2, width)[1:-1, 1:-1]  # Drop the border
+    direction = np.full(distance.shape, NO_MOVE, dtype=np.int8)  # Every cell starts without a move
+    for index, (dr, dc) in enumerate(DIRECTIONS):  # Pick a downhill neighbor for every cell
+        downhill = (shifted(distance, dr, dc, -1) == distance - 1) & (distance > 0)  # Neighbor one step closer
+        direction[downhill & (direction == NO_MOVE)] = index  # Keep the first direction found
+
+    return direction, distance  # Return the flow field
+
+
+def next_step(field, position):
+    """
+    This function returns the next position of an agent following a flow field
+
+    :param field: flow field returned by compute_flow_field
+    :type field: tuple
+    :param position: current position of the agent
+    :type position: tuple
+    :return: the next position, None at the goal or where the goal cannot be reached
+    :rtype: tuple
+    """
+    index = field[0][position]  # Direction stored for this cell
+    if index == NO_MOVE:  # Nowhere to go
+        return None  # Agent stays where it is
+    dr, dc = DIRECTIONS[index]  # Direction of the move
+    return position[0] + dr, position[1] + dc  # Step to the neighbor
+
+
+def solve_maze(maze, start, end):
+    """
+    This function finds a shortest path by following the flow field of end.
+
+    When many agents share the goal compute the field once with
+    compute_flow_field and call next_step for each agent instead.
+
+    :param maze: a 2D list representing the maze
+    :type maze: list
+    :param start: start position
+    :type start: tuple
+    :param end: end position
+    :type end: tuple
+    :return: the path from start to end if it exists, False otherwise
+    :rtype: list or bool
+    """
+    field = compute_flow_field(maze, end)  # One wavefront from the goal
+    if field[1][start] == -1:  # The start was never reached
+        return False  # No path exists
+
+    path = [start]  # The path starts at the start position
+    while path[-1] != end:  # Step until we reach the end
+        path.append(next_step(field, path[-1]))  # Follow the field
+    return path  # Return the full path
+
+
+def main():
+    maze = []
+    for i in range(10):
+        maze.append(list(input()))
+
+    field = compute_flow_field(maze, (9, 9))
+    agents = [(0, 0), (0, 9), (9, 0)]
+    print([next_step(field, agent) for agent in agents])
+    print(solve_maze(maze, (0, 0), (9, 9)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,425 @@
+import heapq
+import pickle
+from collections import deque
+
+from astar import DIRECTIONS, is_open, manhattan
+
+nodes_expanded = 0  # Number of abstract nodes expanded by the last search
+
+
+class HierarchicalMap:
+    """Cluster abstraction of a maze for hierarchical pathfinding (HPA*)."""
+
+    def __init__(self, maze, cluster_size=10):
+        """
+        Split the maze into square clusters and build the abstract graph.
+
+        :param maze: a 2D list representing the maze, it is updated in place by update_cells
+        :type maze: list
+        :param cluster_size: width and height of each cluster in cells
+        :type cluster_size: int
+        :raises ValueError: if cluster_size is smaller than 1
+        """
+        if cluster_size < 1:  # Clusters need at least one cell
+            raise ValueError("cluster_size must be at least 1")
+
+        self.maze = maze  # Maze the abstraction was built for
+        self.cluster_size = cluster_size  # Width and height of each cluster
+        self.cluster_rows = (len(maze) + cluster_size - 1) // cluster_size  # Number of cluster rows
+        self.cluster_cols = (len(maze[0]) + cluster_size - 1) // cluster_size  # Number of cluster columns
+        self.entrances = {}  # (cluster, neighbor cluster) -> list of (cell, cell across the border) pairs
+        self.intra = {}  # cluster -> {entrance cell: {other entrance cell: distance inside the cluster}}
+        self.partners = {}  # entrance cell -> cells across the border it connects to
+        self.dirty = set()  # Clusters whose part of the abstraction must be rebuilt
+
+        for cluster in self.clusters():  # Build every border once
+            for other in self.next_clusters(cluster):  # Only right and down, so each border is built once
+                self.entrances[(cluster, other)] = self.find_entrances(cluster, other)  # Entrances on this border
+
+        for cluster in self.clusters():  # Precompute every cluster
+            self.intra[cluster] = self.build_intra(cluster)  # Distances between its entrances
+        self.build_partners()  # Link entrances across borders
+
+    def clusters(self):
+        """
+        Return all clusters of the maze.
+
+        :return: every cluster as a (cluster row, cluster column) tuple
+        :rtype: list
+        """
+        return [(cr, cc) for cr in range(self.cluster_rows) for cc in range(self.cluster_cols)]  # All clusters
+
+    def cluster_of(self, n):
+        """
+        Return the cluster a position belongs to.
+
+        :param n: position in the maze
+        :type n: tuple
+        :return: (cluster row, cluster column)
+        :rtype: tuple
+        """
+        return n[0] // self.cluster_size, n[1] // self.cluster_size  # Integer division by the cluster size
+
+    def next_clusters(self, cluster):
+        """
+        Return the clusters to the right of and below a cluster.
+
+        :param cluster: (cluster row, cluster column)
+        :type cluster: tuple
+        :return: the existing right and down neighbor clusters
+        :rtype: list
+        """
+        cr, cc = cluster  # Get cluster row and column
+        result = []  # Initialize list of neighbor clusters
+        if cc + 1 < self.cluster_cols:  # There is a cluster to the right
+            result.append((cr, cc + 1))  # Add it
+        if cr + 1 < self.cluster_rows:  # There is a cluster below
+            result.append((cr + 1, cc))  # Add it
+        return result  # Return the neighbor clusters
+
+    def borders_of(self, cluster):
+        """
+        Return the keys of every border a cluster lies on.
+
+        :param cluster: (cluster row, cluster column)
+        :type cluster: tuple
+        :return: (cluster, neighbor cluster) keys into self.entrances
+        :rtype: list
+        """
+        cr, cc = cluster  # Get cluster row and column
+        keys = [(cluster, other) for other in self.next_clusters(cluster)]  # Borders to the right and below
+        if cc > 0:  # There is a cluster to the left
+            keys.append(((cr, cc - 1), cluster))  # Its right border is our left border
+        if cr > 0:  # There is a cluster above
+            keys.append(((cr - 1, cc), cluster))  # Its bottom border is our top border
+        return keys  # Return all border keys
+
+    def find_entrances(self, cluster, other):
+        """
+        Find the entrances on the border between a cluster and its right or down neighbor.
+
+        Every run of cells that are open on both sides of the border becomes one
+        entrance in its middle, or two entrances at its ends if the run is long.
+
+        :param cluster: (cluster row, cluster column)
+        :type cluster: tuple
+        :param other: the cluster to the right of or below cluster
+        :type other: tuple
+        :return: list of (cell in cluster, cell in other) pairs
+        :rtype: list
+        """
+        size = self.cluster_size  # Width and height of each cluster
+        if other[1] > cluster[1]:  # Border is vertical
+            col = other[1] * size  # First column of the right cluster
+            first = cluster[0] * size  # First row of the border
+            last = min(first + size, len(self.maze))  # One past the last row of the border
+            pairs = [((row, col - 1), (row, col)) for row in range(first, last)]  # Cells facing each other
+        else:  # Border is horizontal
+            row = other[0] * size  # First row of the lower cluster
+            first = cluster[1] * size  # First column of the border
+            last = min(first + size, len(self.maze[0]))  # One past the last column of the border
+            pairs = [((row - 1, col), (row, col)) for col in range(first, last)]  # Cells facing each other
+
+        entrances = []  # Initialize list of entrances
+        run = []  # Current run of pairs open on both sides
+        for pair in pairs + [None]:  # The extra None closes the last run
+            if pair is not None and is_open(self.maze, *pair[0]) and is_open(self.maze, *pair[1]):  # Crossing possible here
+                run.append(pair)  # Extend the run
+                continue  # Go to next iteration
+            if len(run) >= 6:  # Long run, two entrances keep paths close to optimal
+                entrances += [run[0], run[-1]]  # Use both ends
+            elif run:  # Short run
+                entrances.append(run[len(run) // 2])  # Use the middle
+            run = []  # Start a new run
+
+        return entrances  # Return the entrances
+
+    def bounds(self, cluster):
+        """
+        Return the cell range covered by a cluster.
+
+        :param cluster: (cluster row, cluster column)
+        :type cluster: tuple
+        :return: (first row, one past last row, first column, one past last column)
+        :rtype: tuple
+        """
+        size = self.cluster_size  # Width and height of each cluster
+        return (cluster[0] * size, min((cluster[0] + 1) * size, len(self.maze)),
+                cluster[1] * size, min((cluster[1] + 1) * size, len(self.maze[0])))  # Clip the last clusters
+
+    def local_search(self, cluster, source):
+        """
+        Run a breadth-first search from a position without leaving its cluster.
+
+        :param cluster: (cluster row, cluster column) to stay inside
+        :type cluster: tuple
+        :param source: position to search from
+        :type source: tuple
+        :return: dictionary mapping each reached position to the one it was reached from
+        :rtype: dict
+        """
+        row_lo, row_hi, col_lo, col_hi = self.bounds(cluster)  # Cells we may visit
+        parent = {source: None}  # Where each position was reached from
+        queue = deque([source])  # FIFO structure for breadth-first exploration
+
+        while queue:  # Continue until no more positions to explore
+            row, col = queue.popleft()  # Get oldest position (FIFO behavior)
+            for dr, dc in DIRECTIONS:  # Check all 4 directions
+                new = (row + dr, col + dc)  # Neighbor position
+                if (row_lo <= new[0] < row_hi and col_lo <= new[1] < col_hi and  # Inside the cluster
+                        new not in parent and is_open(self.maze, *new)):  # Not seen yet and not a wall
+                    parent[new] = (row, col)  # Remember where we came from
+                    queue.append(new)  # Explore it later
+
+        return parent  # Return the search tree
+
+    def local_distances(self, cluster, source, targets):
+        """
+        Return the distances inside a cluster from a position to some targets.
+
+        :param cluster: (cluster row, cluster column) to stay inside
+        :type cluster: tuple
+        :param source: position to search from
+        :type source: tuple
+        :param targets: positions we want the distance to
+        :type targets: iterable
+        :return: dictionary mapping each reachable target to its distance
+        :rtype: dict
+        """
+        parent = self.local_search(cluster, source)  # Search tree inside the cluster
+        return {target: len(trace(parent, target)) - 1 for target in targets if target in parent}  # Path lengths
+
+    def entrance_cells(self, cluster):
+        """
+        Return the entrance cells that lie inside a cluster.
+
+        :param cluster: (cluster row, cluster column)
+        :type cluster: tuple
+        :return: set of entrance cells
+        :rtype: set
+        """
+        cells = set()  # Initialize set of entrance cells
+        for key in self.borders_of(cluster):  # Every border of the cluster
+            for a, b in self.entrances[key]:  # Every entrance on that border
+                cells.add(a if self.cluster_of(a) == cluster else b)  # Keep the side inside the cluster
+        return cells  # Return the entrance cells
+
+    def build_intra(self, cluster):
+        """
+        Precompute the distances between all entrances of a cluster.
+
+        :param cluster: (cluster row, cluster column)
+        :type cluster: tuple
+        :return: {entrance cell: {other entrance cell: distance inside the cluster}}
+        :rtype: dict
+        """
+        cells = self.entrance_cells(cluster)  # Abstract nodes of this cluster
+        return {cell: {other: dist for other, dist in self.local_distances(cluster, cell, cells).items() if other != cell}
+                for cell in cells}  # One local search per entrance
+
+    def build_partners(self):
+        """
+        Link every entrance cell to the cells across the border it connects to.
+        """
+        self.partners = {}  # Start over, entrances are cheap to scan
+        for pairs in self.entrances.values():  # Every border
+            for a, b in pairs:  # Every entrance on that border
+                self.partners.setdefault(a, []).append(b)  # Crossing from a to b
+                self.partners.setdefault(b, []).append(a)  # Crossing from b to a
+
+    def update_cells(self, changes):
+        """
+        Change cells of the maze and mark the clusters they touch for rebuilding.
+
+        :param changes: dictionary mapping positions to their new character ('*' for a wall)
+        :type changes: dict
+        """
+        for (row, col), value in changes.items():  # Every changed cell
+            self.maze[row][col] = value  # Update the maze
+            self.dirty.add(self.cluster_of((row, col)))  # Its cluster must be rebuilt
+
+    def rebuild(self):
+        """
+        Rebuild the abstraction of the dirty clusters only.
+
+        The borders of a dirty cluster are searched again for entrances, and since
+        those entrances also belong to the neighbor clusters, their distances are
+        recomputed too. Every other cluster keeps its precomputed distances.
+        """
+        if not self.dirty:  # Nothing changed
+            return  # Keep everything
+
+        affected = set()  # Clusters whose entrances may have changed
+        for cluster in self.dirty:  # Every changed cluster
+            for key in self.borders_of(cluster):  # Every border of the cluster
+                self.entrances[key] = self.find_entrances(*key)  # Find its entrances again
+                affected.update(key)  # Both sides of the border are affected
+
+        for cluster in affected:  # Only clusters touched by the change
+            self.intra[cluster] = self.build_intra(cluster)  # Recompute their distances
+        self.build_partners()  # Link entrances across borders again
+        self.dirty = set()  # Everything is up to date
+
+    def save(self, filename):
+        """
+        Persist the abstraction to a file.
+
+        :param filename: path of the file to write
+        :type filename: str
+        """
+        self.rebuild()  # Never persist a stale abstraction
+        with open(filename, "wb") as f:  # Open the file for binary writing
+            pickle.dump(self, f)  # Store the whole object
+
+    @staticmethod
+    def load(filename):
+        """
+        Load an abstraction that was persisted with save.
+
+        :param filename: path of the file to read
+        :type filename: str
+        :return: the loaded abstraction
+        :rtype: HierarchicalMap
+        """
+        with open(filename, "rb") as f:  # Open the file for binary reading
+            return pickle.load(f)  # Restore the object
+
+    def solve(self, start, end):
+        """
+        Find a path by searching the abstract graph first and then refining it locally.
+
+        Start and end are linked to the entrances of their clusters, A* runs over
+        the small graph of entrances, and every abstract edge is then turned back
+        into cells with a search inside a single cluster. The path is close to
+        optimal but not always the shortest one.
+
+        :param start: start position
+        :type start: tuple
+        :param end: end position
+        :type end: tuple
+        :return: the path from start to end if it exists, False otherwise
+        :rtype: list or bool
+        """
+        global nodes_expanded  # This tells Python you want to modify the global variable
+        nodes_expanded = 0  # Reset the expansion counter
+
+        if not is_open(self.maze, *start) or not is_open(self.maze, *end):  # Start or end is a wall
+            return False  # No path exists
+        self.rebuild()  # Bring dirty clusters up to date
+
+        start_cluster = self.cluster_of(start)  # Cluster of the start
+        end_cluster = self.cluster_of(end)  # Cluster of the end
+        start_links = self.local_distances(start_cluster, start, self.entrance_cells(start_cluster))  # Start -> entrances
+        end_links = self.local_distances(end_cluster, end, self.entrance_cells(end_cluster))  # Entrances -> end
+        if start_cluster == end_cluster:  # Both in the same cluster
+            start_links.update(self.local_distances(start_cluster, start, [end]))  # They may connect directly
+
+        cost = {start: 0}  # Cheapest known cost to reach each abstract node
+        parent = {start: None}  # Where each abstract node was reached from
+        heap = [(manhattan(start, end), start)]  # Open list of (f, abstract node)
+        closed = set()  # Abstract nodes already expanded
+
+        while heap:  # Keep looping while there are abstract nodes to check
+            _, current = heapq.heappop(heap)  # Take the node with the lowest f
+            if current == end:  # If we reached the end position, we found a path!
+                return self.refine(trace(parent, end))  # Turn the abstract path back into cells
+            if current in closed:  # Skip stale heap entries
+                continue  # Go to next iteration
+
+            closed.add(current)  # Mark this node as expanded
+            nodes_expanded += 1  # Count this expansion
+
+            if current == start:  # The start connects through its own links
+                edges = list(start_links.items())  # Inside its cluster
+                edges += [(partner, 1) for partner in self.partners.get(current, [])]  # Across a border
+            else:
+                edges = list(self.intra[self.cluster_of(current)].get(current, {}).items())  # Inside the cluster
+                edges += [(partner, 1) for partner in self.partners.get(current, [])]  # Across a border
+                if current in end_links:  # This entrance reaches the end inside its cluster
+                    edges.append((end, end_links[current]))  # Link it to the end
+
+            for neighbor, step in edges:  # Relax every abstract edge
+                new_cost = cost[current] + step  # Cost through the current node
+                if new_cost < cost.get(neighbor, float("inf")):  # Found a cheaper way
+                    cost[neighbor] = new_cost  # Remember the new cost
+                    parent[neighbor] = current  # Remember where we came from
+                    heapq.heappush(heap, (new_cost + manhattan(neighbor, end), neighbor))
+
+        return False  # If we exit the while loop, heap is empty and we never found end
+
+    def refine(self, abstract_path):
+        """
+        Turn an abstract path into the full list of cells.
+
+        :param abstract_path: start, the entrances passed through, and end
+        :type abstract_path: list
+        :return: every cell from start to end
+        :rtype: list
+        """
+        path = [abstract_path[0]]  # The path starts at the start position
+        for a, b in zip(abstract_path, abstract_path[1:]):  # Every abstract edge
+            if self.cluster_of(a) != self.cluster_of(b):  # Crossing a border
+                path.append(b)  # The cells are next to each other
+            else:  # Edge inside a cluster
+                path += trace(self.local_search(self.cluster_of(a), a), b)[1:]  # Local path, without a itself
+        return path  # Return the full path
+
+
+def trace(parent, end):
+    """
+    This function rebuilds a path by following the parents back from the end
+
+    :param parent: dictionary mapping each position to the one it was reached from
+    :type parent: dict
+    :param end: end position
+    :type end: tuple
+    :return: every position from the search source to end
+    :rtype: list
+    """
+    path = []  # Positions from end back to the source
+    current = end  # Start walking back from the end
+    while current is not None:  # Stop once we passed the source
+        path.append(current)  # Add the position
+        current = parent[current]  # Move to the previous position
+    path.reverse()  # Put them in source to end order
+    return path  # Return the path
+
+
+def solve_maze(maze, start, end, cluster_size=10):
+    """
+    This function builds a hierarchical map and uses it once to find a path.
+
+    For repeated queries build a HierarchicalMap once and call its solve method.
+
+    :param maze: a 2D list representing the maze
+    :type maze: list
+    :param start: start position
+    :type start: tuple
+    :param end: end position
+    :type end: tuple
+    :param cluster_size: width and height of each cluster in cells
+    :type cluster_size: int
+    :return: the path from start to end if it exists, False otherwise
+    :rtype: list or bool
+    """
+    return HierarchicalMap(maze, cluster_size).solve(start, end)  # Build and query
+
+
+def main():
+    maze = []
+    for i in range(10):
+        maze.append(list(input()))
+
+    hierarchy = HierarchicalMap(maze, cluster_size=5)
+    path = hierarchy.solve((0, 0), (9, 9))
+    if path:
+        print(f"Path exists! Length {len(path) - 1}.")
+    else:
+        print("Path does not exist.")
+
+    hierarchy.update_cells({(0, 1): '*', (1, 0): '*'})
+    print(hierarchy.solve((0, 0), (9, 9)))
+
+
+if __name__ == "__main__":
+    main()
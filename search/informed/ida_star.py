@@ -0,0 +1,144 @@
+from collections import OrderedDict
+
+from astar import manhattan, neighbors
+
+nodes_expanded = 0  # Number of positions expanded by the last search (all iterations)
+
+
+def solve_maze(maze, start, end, cache_size=10000):
+    """
+    This function uses iterative-deepening A* (IDA*) to find a path from start to end in a maze.
+
+    Each iteration is a depth-first search that cuts off every branch whose
+    f = g + h is above a threshold. The next threshold is the smallest f that
+    was cut off, so the first path found is optimal. Only the current path is
+    kept in memory, plus a small transposition cache of the cheapest g each
+    position was reached with, which stops the worst re-expansions.
+
+    :param maze: a 2D list representing the maze
+    :type maze: list
+    :param start: start position
+    :type start: tuple
+    :param end: end position
+    :type end: tuple
+    :param cache_size: maximum number of positions in the transposition cache, 0 disables it
+    :type cache_size: int
+    :return: the path from start to end if it exists, False otherwise
+    :rtype: list or bool
+    """
+    global nodes_expanded  # This tells Python you want to modify the global variable
+    nodes_expanded = 0  # Reset the expansion counter
+
+    threshold = manhattan(start, end)  # First cutoff is the heuristic of the start
+
+    while True:  # Deepen until the goal is found or nothing was cut off
+        path, next_threshold = bounded_search(maze, start, end, threshold, cache_size)  # One depth-first pass
+        if path:  # Goal was reached within the threshold
+            return path  # Success! Return the path
+
+        if next_threshold == float("inf"):  # Nothing was cut off, every reachable position was seen
+            return False  # No path exists
+
+        threshold = next_threshold  # Allow the smallest f that was cut off
+
+
+def bounded_search(maze, start, end, threshold, cache_size):
+    """
+    This function runs one depth-first pass of IDA* below an f threshold
+
+    :param maze: a 2D list representing the maze
+    :type maze: list
+    :param start: start position
+    :type start: tuple
+    :param end: end position
+    :type end: tuple
+    :param threshold: largest f value allowed in this pass
+    :type threshold: int
+    :param cache_size: maximum number of positions in the transposition cache, 0 disables it
+    :type cache_size: int
+    :return: the path if found (None otherwise) and the smallest f above the threshold
+    :rtype: tuple
+    """
+    global nodes_expanded  # This tells Python you want to modify the global variable
+
+    if start == end:  # Already at the goal
+        return [start], threshold  # The path is just the start position
+
+    next_threshold = float("inf")  # Smallest f that was cut off in this pass
+    cache = OrderedDict()  # Least recently used cache of position -> cheapest g seen in this pass
+    path = [start]  # Current path, its length - 1 is the cost g
+    on_path = {start}  # Positions on the current path, to avoid walking in circles
+    stack = [iter(ordered_neighbors(maze, start, end))]  # One iterator of untried neighbors per path position
+    nodes_expanded += 1  # Count the expansion of start
+
+    while stack:  # Continue until every branch below the threshold was tried
+        neighbor = next(stack[-1], None)  # Next untried neighbor of the deepest position
+
+        if neighbor is None:  # All neighbors tried, go back
+            stack.pop()  # Drop the finished iterator
+            on_path.discard(path.pop())  # Take the position off the current path
+            continue  # Go to next iteration
+
+        if neighbor in on_path:  # Would walk in a circle
+            continue  # Skip it
+
+        g = len(path)  # Cost to reach the neighbor, every step costs 1
+        f = g + manhattan(neighbor, end)  # Estimated cost of a path through the neighbor
+        if f > threshold:  # Too expensive for this pass
+            next_threshold = min(next_threshold, f)  # Remember the cheapest cutoff for the next pass
+            continue  # Skip it
+
+        if neighbor == end:  # If we reached the end position, we found a path!
+            return path + [neighbor], threshold  # Success! Return the path
+
+        if cache_size:  # Transposition cache is enabled
+            seen = cache.get(neighbor)  # Cheapest g this position was already searched with
+            if seen is not None and seen <= g:  # Already searched with at least as much budget left
+                cache.move_to_end(neighbor)  # Mark as recently used
+                continue  # Skip the repeated subtree
+            cache[neighbor] = g  # Remember the new cheapest g
+            cache.move_to_end(neighbor)  # Mark as recently used
+            if len(cache) > cache_size:  # Over the memory cap
+                cache.popitem(last=False)  # Evict the least recently used position
+
+        path.append(neighbor)  # Step forward onto the neighbor
+        on_path.add(neighbor)  # Remember it is on the current path
+        stack.append(iter(ordered_neighbors(maze, neighbor, end)))  # Try its neighbors next
+        nodes_expanded += 1  # Count this expansion
+
+    return None, next_threshold  # Goal not reached in this pass
+
+
+def ordered_neighbors(maze, n, end):
+    """
+    This function returns the open neighbors of a position, closest to the goal first
+
+    :param maze: a 2D list representing the maze
+    :type maze: list
+    :param n: our current position
+    :type n: tuple
+    :param end: end position
+    :type end: tuple
+    :return: the open neighbors sorted by manhattan distance to end
+    :rtype: list
+    """
+    return sorted(neighbors(maze, n), key=lambda neighbor: manhattan(neighbor, end))  # Most promising first
+
+
+def main():
+    maze = []
+    for i in range(10):
+        maze.append(list(input()))
+
+    start = (0, 0)
+    goal_pos = (9, 9)
+
+    path = solve_maze(maze, start, goal_pos)
+    if path:
+        print(f"Path exists! Length {len(path) - 1}, expanded {nodes_expanded} positions.")
+    else:
+        print("Path does not exist.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+import heapq
+
+from astar import DIRECTIONS, is_open, manhattan
+
+nodes_expanded = 0  # Number of jump points expanded by the last search
+
+
+def solve_maze(maze, start, end):
+    """
+    This function uses Jump Point Search to find a path from start to end in a maze.
+
+    Instead of pushing every neighbour onto the open list, straight lines are
+    scanned until a cell with a forced neighbour (a wall corner) or the goal is
+    reached, and only those jump points are expanded. On a uniform 4-connected
+    grid this skips the many symmetric equal-cost paths that plain A* explores.
+
+    :param maze: a 2D list representing the maze
+    :type maze: list
+    :param start: start position
+    :type start: tuple
+    :param end: end position
+    :type end: tuple
+    :return: the path from start to end if it exists, False otherwise
+    :rtype: list or bool
+    """
+    global nodes_expanded  # This tells Python you want to modify the global variable
+    nodes_expanded = 0  # Reset the expansion counter
+
+    cost = {start: 0}  # Cheapest known cost to reach each jump point
+    parent = {start: None}  # Jump point we came from, used to rebuild the path
+    closed = set()  # Jump points that were already expanded
+    open_heap = [(manhattan(start, end), 0, start)]  # Heap of (f, -g, position), deeper nodes win ties
+
+    while open_heap:  # Keep looping while there are jump points to check
+        _, neg_cost, current = heapq.heappop(open_heap)  # Take the jump point with the lowest f
+
+        if current == end:  # If we reached the end position, we found a path!
+            return expand_path(parent, end)  # Turn the jump points back into single cells
+
+        if current in closed:  # Skip stale heap entries
+            continue  # Go to next iteration of while loop
+
+        closed.add(current)  # Mark this jump point as expanded
+        nodes_expanded += 1  # Count this expansion
+
+        for jump_point in successors(maze, current, parent[current], end):  # Check every jump point we can reach
+            new_cost = -neg_cost + manhattan(current, jump_point)  # Jumps are straight, so the cost is the distance
+            if jump_point not in closed and new_cost < cost.get(jump_point, float("inf")):  # Found a cheaper way
+                cost[jump_point] = new_cost  # Remember the new cost
+                parent[jump_point] = current  # Remember where we came from
+                heapq.heappush(open_heap, (new_cost + manhattan(jump_point, end), -new_cost, jump_point))
+
+    return False  # If we exit the while loop, heap is empty and we never found end
+
+
+def successors(maze, n, parent, end):
+    """
+    This function returns the jump points reachable from a position
+
+    :param maze: a 2D list representing the maze
+    :type maze: list
+    :param n: our current position
+    :type n: tuple
+    :param parent: the jump point we came from, None for the start
+    :type parent: tuple
+    :param end: end position
+    :type end: tuple
+    :return: the jump points found in the pruned directions
+    :rtype: list
+    """
+    if parent is None:  # The start has no travel direction yet
+        directions = DIRECTIONS  # Search in all 4 directions
+    else:
+        dr = (n[0] > parent[0]) - (n[0] < parent[0])  # Row direction we arrived with (-1, 0 or 1)
+        dc = (n[1] > parent[1]) - (n[1] < parent[1])  # Column direction we arrived with (-1, 0 or 1)
+        if dc != 0:  # Arrived moving horizontally
+            directions = [(0, dc), (1, 0), (-1, 0)]  # Keep going, or turn up or down
+        else:  # Arrived moving vertically
+            directions = [(dr, 0), (0, 1), (0, -1)]  # Keep going, or turn left or right
+
+    jump_points = []  # Initialize list of jump points
+    for direction in directions:  # Scan each pruned direction
+        jump_point = jump(maze, n, direction, end)  # Follow the line until something interesting happens
+        if jump_point is not None:  # A jump point was found on this line
+            jump_points.append(jump_point)  # Add it to the list
+
+    return jump_points  # Return all the jump points found
+
+
+def jump(maze, n, direction, end):
+    """
+    This function scans from a position in a straight line and returns the first jump point
+
+    :param maze: a 2D list representing the maze
+    :type maze: list
+    :param n: position to scan from
+    :type n: tuple
+    :param direction: (row change, column change) of the scan
+    :type direction: tuple
+    :param end: end position
+    :type end: tuple
+    :return: the jump point, None if the scan hits a wall or the border first
+    :rtype: tuple
+    """
+    row, col = n  # Get current row and column from the tuple
+    dr, dc = direction  # Get the scan direction
+
+    while True:  # Keep stepping until we find a jump point or a wall
+        row += dr  # Step one row in the scan direction
+        col += dc  # Step one column in the scan direction
+
+        if not is_open(maze, row, col):  # Hit a wall or the border
+            return None  # Nothing to find on this line
+
+        if (row, col) == end:  # The goal is always a jump point
+            return row, col  # Return the goal
+
+        if dc != 0:  # Scanning horizontally
+            if ((is_open(maze, row - 1, col) and not is_open(maze, row - 1, col - dc)) or  # Forced neighbour above
+                    (is_open(maze, row + 1, col) and not is_open(maze, row + 1, col - dc))):  # Forced neighbour below
+                return row, col  # This cell is a jump point
+        else:  # Scanning vertically
+            if ((is_open(maze, row, col - 1) and not is_open(maze, row - dr, col - 1)) or  # Forced neighbour left
+                    (is_open(maze, row, col + 1) and not is_open(maze, row - dr, col + 1))):  # Forced neighbour right
+                return row, col  # This cell is a jump point
+            if (jump(maze, (row, col), (0, 1), end) is not None or  # A jump point to the right
+                    jump(maze, (row, col), (0, -1), end) is not None):  # A jump point to the left
+                return row, col  # We have to turn here to reach it
+
+
+def expand_path(parent, end):
+    """
+    This function rebuilds the full cell path from the chain of jump points
+
+    :param parent: dictionary mapping each jump point to the one before it
+    :type parent: dict
+    :param end: end position
+    :type end: tuple
+    :return: every cell from start to end
+    :rtype: list
+    """
+    jump_points = []  # Jump points from end back to start
+    current = end  # Start walking back from the end
+    while current is not None:  # Stop once we passed the start
+        jump_points.append(current)  # Remember this jump point
+        current = parent[current]  # Move to the previous jump point
+    jump_points.reverse()  # Put them in start to end order
+
+    path = [jump_points[0]]  # The path starts at the start position
+    for target in jump_points[1:]:  # Walk each straight segment
+        row, col = path[-1]  # Segment begins where the path currently ends
+        dr = (target[0] > row) - (target[0] < row)  # Row step along the segment
+        dc = (target[1] > col) - (target[1] < col)  # Column step along the segment
+        while (row, col) != target:  # Step until the next jump point
+            row += dr  # Step one row
+            col += dc  # Step one column
+            path.append((row, col))  # Add the cell to the path
+
+    return path  # Return the full path
+
+
+def main():
+    maze = [list("     *   "),
+            list(" *** * * "),
+            list("   *   * "),
+            list("** ***** "),
+            list("         ")]
+
+    path = solve_maze(maze, (0, 0), (4, 8))
+    print(path)
+    print("jump points expanded:", nodes_expanded)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+from bidirectional_astar import solve_maze
+
+
+def test_wall_start_has_no_path():
+    assert solve_maze([list("  *  ")], (0, 2), (0, 0)) is False
+
+
+def test_wall_end_has_no_path():
+    assert solve_maze([list("  *  ")], (0, 0), (0, 2)) is False
+
+
+def test_path_around_a_wall():
+    maze = [list(" * "),
+            list("   ")]
+
+    assert solve_maze(maze, (0, 0), (0, 2)) == [(0, 0), (1, 0), (1, 1), (1, 2), (0, 2)]
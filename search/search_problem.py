@@ -0,0 +1,179 @@
+import os
+import sys
+from abc import ABC, abstractmethod
+
+INFORMED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "informed")  # Folder of astar.py
+if INFORMED_DIR not in sys.path:  # Not importable yet
+    sys.path.insert(0, INFORMED_DIR)  # Make the maze helpers importable
+
+from astar import manhattan, neighbors  # noqa: E402  Same neighbor and distance rules as the maze solvers
+
+
+class SearchProblem(ABC):
+    """Common interface every search domain implements so the shared engines can solve it."""
+
+    @abstractmethod
+    def initial_state(self):
+        """
+        Return the state the search starts from.
+
+        :return: the initial state, any hashable value
+        :rtype: hashable
+        """
+
+    @abstractmethod
+    def successors(self, state):
+        """
+        Return the states reachable in one step.
+
+        :param state: current state
+        :type state: hashable
+        :return: the next states
+        :rtype: iterable
+        """
+
+    @abstractmethod
+    def is_goal(self, state):
+        """
+        Check if a state solves the problem.
+
+        :param state: state to check
+        :type state: hashable
+        :return: True if the state is a goal
+        :rtype: bool
+        """
+
+    def cost(self, state, next_state):
+        """
+        Return the cost of stepping from a state to one of its successors.
+
+        :param state: current state
+        :type state: hashable
+        :param next_state: successor of state
+        :type next_state: hashable
+        :return: step cost, 1 unless the problem says otherwise
+        :rtype: float
+        """
+        return 1  # Every step costs the same by default
+
+    def heuristic(self, state):
+        """
+        Estimate the remaining cost from a state to the nearest goal.
+
+        :param state: state to estimate
+        :type state: hashable
+        :return: estimated remaining cost, 0 unless the problem says otherwise
+        :rtype: float
+        """
+        return 0  # No domain knowledge by default
+
+
+class GraphProblem(SearchProblem):
+    """Search problem over a graph given as a dictionary of neighbor lists, like the uninformed examples."""
+
+    def __init__(self, tree, start, goal):
+        """
+        Initialize the problem.
+
+        :param tree: the graph, node -> list of neighbor nodes
+        :type tree: dict
+        :param start: start node
+        :type start: str
+        :param goal: goal node
+        :type goal: str
+        """
+        self.tree = tree  # Store the graph
+        self.start = start  # Store the start node
+        self.goal = goal  # Store the goal node
+
+    def initial_state(self):
+        """
+        Return the start node.
+
+        :return: the start node
+        :rtype: str
+        """
+        return self.start  # Search starts at the start node
+
+    def successors(self, state):
+        """
+        Return the neighbors of a node.
+
+        :param state: current node
+        :type state: str
+        :return: its neighbor nodes, empty if the node has no entry in the graph
+        :rtype: list
+        """
+        return self.tree.get(state, [])  # Nodes without an entry have no neighbors
+
+    def is_goal(self, state):
+        """
+        Check if a node is the goal node.
+
+        :param state: node to check
+        :type state: str
+        :return: True if the node is the goal
+        :rtype: bool
+        """
+        return state == self.goal  # Only the goal node solves the problem
+
+
+class MazeProblem(SearchProblem):
+    """Search problem over a 2D character maze like the one used by astar.solve_maze ('*' is a wall)."""
+
+    def __init__(self, maze, start, end):
+        """
+        Initialize the problem.
+
+        :param maze: a 2D list representing the maze
+        :type maze: list
+        :param start: start position
+        :type start: tuple
+        :param end: end position
+        :type end: tuple
+        """
+        self.maze = maze  # Store the maze
+        self.start = start  # Store the start position
+        self.end = end  # Store the end position
+
+    def initial_state(self):
+        """
+        Return the start position.
+
+        :return: the start position
+        :rtype: tuple
+        """
+        return self.start  # Search starts at the start position
+
+    def successors(self, state):
+        """
+        Return the open positions next to a position.
+
+        :param state: current position
+        :type state: tuple
+        :return: the open positions right, down, left and up of it
+        :rtype: list
+        """
+        return neighbors(self.maze, state)  # Open positions right, down, left and up
+
+    def is_goal(self, state):
+        """
+        Check if a position is the end position.
+
+        :param state: position to check
+        :type state: tuple
+        :return: True if the position is the end
+        :rtype: bool
+        """
+        return state == self.end  # Only the end position solves the problem
+
+    def heuristic(self, state):
+        """
+        Estimate the steps left from a position to the end.
+
+        :param state: position to estimate
+        :type state: tuple
+        :return: the manhattan distance to the end, never more than the real number of steps
+        :rtype: int
+        """
+        return manhattan(state, self.end)  # Manhattan distance to the end
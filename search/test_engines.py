@@ -0,0 +1,62 @@
+from engines import SearchStats, astar, bfs, dfs, greedy, iddfs, ucs
+from search_problem import GraphProblem, MazeProblem
+
+TREE = {'A': ['B', 'C'], 'B': ['D', 'E'], 'C': ['F'], 'D': [], 'E': ['F'], 'F': []}
+MAZE = [list("    *"),
+        list(" ** *"),
+        list("    *"),
+        list("***  "),
+        list("     ")]
+MAZE_PATH = [(0, 0), (0, 1), (0, 2), (0, 3), (1, 3), (2, 3), (3, 3), (3, 4), (4, 4)]
+
+
+def test_depth_limited_dfs_finds_goal_reached_deep_first():
+    # N is first reached at depth 3 through Q and R and cut by the limit, the goal is only found
+    # when N is expanded again from the shallower path through P
+    tree = {'S': ['P', 'Q'], 'Q': ['R'], 'R': ['N'], 'P': ['N'], 'N': ['G']}
+
+    assert dfs(GraphProblem(tree, 'S', 'G'), max_depth=3) == ['S', 'P', 'N', 'G']
+    assert iddfs(GraphProblem(tree, 'S', 'G'), max_depth=3) == ['S', 'P', 'N', 'G']
+    assert dfs(GraphProblem(tree, 'S', 'G'), max_depth=2) is False
+
+
+def test_iddfs_only_counts_expanded_states():
+    # Limit 1 expands A, limit 2 expands A, B and C; D and E sit at the limit and are never expanded
+    stats = SearchStats()
+
+    assert iddfs(GraphProblem(TREE, 'A', 'F'), stats) == ['A', 'C', 'F']
+    assert stats.expanded == 4
+
+
+def test_engines_find_shortest_path_on_graph():
+    for engine in (bfs, ucs, greedy, astar):
+        assert engine(GraphProblem(TREE, 'A', 'F')) == ['A', 'C', 'F']
+        assert engine(GraphProblem(TREE, 'A', 'A')) == ['A']
+        assert engine(GraphProblem(TREE, 'D', 'F')) is False
+
+
+def test_engines_find_shortest_path_on_maze():
+    for engine in (bfs, ucs, greedy, astar):
+        assert engine(MazeProblem(MAZE, (0, 0), (4, 4))) == MAZE_PATH
+        assert engine(MazeProblem(MAZE, (0, 0), (0, 4))) is False  # End is a wall
+
+
+def test_search_stats_counts():
+    stats = SearchStats()
+    bfs(GraphProblem(TREE, 'A', 'F'), stats)
+    assert (stats.expanded, stats.generated, stats.max_frontier, stats.cut_off) == (3, 5, 3, False)
+
+    # The manhattan distance leads greedy straight to the end, UCS and A* spread out around the walls
+    expanded = {}
+    for engine in (ucs, greedy, astar):
+        stats = SearchStats()
+        engine(MazeProblem(MAZE, (0, 0), (4, 4)), stats)
+        expanded[engine] = stats.expanded
+    assert expanded == {ucs: 13, greedy: 8, astar: 13}
+
+
+def test_search_stats_max_expansions_cuts_search_off():
+    for engine in (bfs, dfs, iddfs, ucs, greedy, astar):
+        stats = SearchStats(max_expansions=2)
+        assert engine(MazeProblem(MAZE, (0, 0), (4, 4)), stats) is False
+        assert stats.cut_off
@@ -1,9 +1,12 @@
+from csr_graph import CSRGraph
+
+
 def dfs(tree, start, goal):
     """
     This function implements the depth first search
 
     :param tree: the graph
-    :type tree: dict
+    :type tree: dict or CSRGraph
     :param start:
     :type start: str
     :param goal:
@@ -32,6 +35,113 @@ def dfs(tree, start, goal):
 
     return False                          # No path found - goal unreachable
 
+def csr_dfs(graph, start, goal):
+    """
+    This function implements the depth first search over a CSR graph
+
+    Every node is pushed at most once: a bitset marks nodes as soon as they are
+    reached, and each stack frame is an iterator over the node's edge range
+    instead of a copy of its neighbors, so the stack never grows past the
+    number of nodes no matter how many edges there are.
+
+    :param graph: the graph
+    :type graph: CSRGraph
+    :param start: start node label
+    :type start: hashable
+    :param goal: goal node label
+    :type goal: hashable
+    :return: the path from start to goal if it exists, False otherwise
+    :rtype: list or bool
+    """
+    offsets, targets = graph.offsets, graph.targets  # CSR arrays
+    source = graph.index(start)  # Integer id of the start
+    target = graph.index(goal)  # Integer id of the goal
+    if source == target:  # Check if the start and goal are the same
+        return [start]  # Success
+
+    visited = bytearray((graph.node_count() + 7) // 8)  # One bit per node
+    visited[source >> 3] |= 1 << (source & 7)  # Mark the start as visited
+    path = [source]  # Nodes of the current branch
+    stack = [iter(range(offsets[source], offsets[source + 1]))]  # Untried edges of each node on the branch
+
+    while stack:  # Continue until no more nodes to explore
+        edge = next(stack[-1], None)  # Next untried edge of the deepest node
+        if edge is None:  # All edges tried
+            stack.pop()  # Drop the finished frame
+            path.pop()  # Go back
+            continue  # Go to next iteration
+
+        neighbor = targets[edge]  # Node the edge leads to
+        if visited[neighbor >> 3] & (1 << (neighbor & 7)):  # Skip already visited nodes
+            continue  # (prevents infinite loops)
+        visited[neighbor >> 3] |= 1 << (neighbor & 7)  # Mark it as visited
+
+        path.append(neighbor)  # Step forward
+        if neighbor == target:  # Check if we found the target
+            return [graph.label(i) for i in path]  # Success - path exists
+        stack.append(iter(range(offsets[neighbor], offsets[neighbor + 1])))  # Try its edges next
+
+    return False  # No path found - goal unreachable
+
+
+def csr_iddfs(graph, start, goal, max_depth=None):
+    """
+    This function implements iterative deepening depth first search over a CSR graph
+
+    Only the current branch is stored, so memory stays O(depth) and the path
+    returned has the fewest edges.
+
+    :param graph: the graph
+    :type graph: CSRGraph
+    :param start: start node label
+    :type start: hashable
+    :param goal: goal node label
+    :type goal: hashable
+    :param max_depth: deepest limit to try, the number of nodes if None
+    :type max_depth: int
+    :return: the shortest path from start to goal if it exists within max_depth, False otherwise
+    :rtype: list or bool
+    """
+    offsets, targets = graph.offsets, graph.targets  # CSR arrays
+    source = graph.index(start)  # Integer id of the start
+    target = graph.index(goal)  # Integer id of the goal
+    if source == target:  # Check if the start and goal are the same
+        return [start]  # Success
+    if max_depth is None:  # No limit given
+        max_depth = graph.node_count()  # A shortest path never has more edges than nodes
+
+    for limit in range(1, max_depth + 1):  # Deepen one edge at a time
+        path = [source]  # Nodes of the current branch
+        on_path = {source}  # Same nodes as a set, to avoid walking in circles
+        stack = [iter(range(offsets[source], offsets[source + 1]))]  # Untried edges of each node on the branch
+        deeper = False  # True if some branch was cut by the limit
+
+        while stack:  # Continue until every branch within the limit was tried
+            edge = next(stack[-1], None)  # Next untried edge of the deepest node
+            if edge is None:  # All edges tried
+                stack.pop()  # Drop the finished frame
+                on_path.discard(path.pop())  # Go back
+                continue  # Go to next iteration
+
+            neighbor = targets[edge]  # Node the edge leads to
+            if neighbor == target:  # Check if we found the target
+                return [graph.label(i) for i in path + [neighbor]]  # Success - path exists
+            if neighbor in on_path:  # Would walk in a circle
+                continue  # Skip it
+            if len(path) == limit:  # Branch is at the depth limit
+                deeper = True  # There may be more below
+                continue  # Do not go deeper
+
+            path.append(neighbor)  # Step forward
+            on_path.add(neighbor)  # Remember it is on the branch
+            stack.append(iter(range(offsets[neighbor], offsets[neighbor + 1])))  # Try its edges next
+
+        if not deeper:  # Nothing was cut by the limit, every reachable node was tried
+            return False  # No path found - goal unreachable
+
+    return False  # No path within max_depth
+
+
 def main():
     tree = {'A': ['B', 'C'],
             'B': ['D', 'E'],
@@ -40,6 +150,9 @@ def main():
             'E': ['F'],
             'F': []}
     print(dfs(tree, 'A', 'F'))
+    graph = CSRGraph.from_dict(tree)
+    print(csr_dfs(graph, 'A', 'F'))
+    print(csr_iddfs(graph, 'A', 'F'))
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,185 @@
+import numpy as np
+
+from csr_graph import CSRGraph
+
+ALPHA = 14  # Go bottom-up once the frontier has more than 1/ALPHA of the unexplored edges
+BETA = 24  # Go back top-down once the frontier has fewer than 1/BETA of the nodes
+
+
+def new_bits(n):
+    """
+    This function returns a bit array with n cleared bits
+
+    :param n: number of bits
+    :type n: int
+    :return: packed bits, bit i is bit i % 8 of byte i // 8
+    :rtype: numpy.ndarray
+    """
+    return np.zeros((n + 7) // 8, dtype=np.uint8)  # 8 bits per byte
+
+
+def test_bits(bits, idx):
+    """
+    This function checks many bits at once
+
+    :param bits: packed bits
+    :type bits: numpy.ndarray
+    :param idx: indices of the bits to check
+    :type idx: numpy.ndarray
+    :return: True where the bit is set
+    :rtype: numpy.ndarray
+    """
+    return ((bits[idx >> 3] >> (idx & 7).astype(np.uint8)) & 1).astype(bool)  # Pick the byte, then the bit
+
+
+def set_bits(bits, idx):
+    """
+    This function sets many bits at once
+
+    :param bits: packed bits, changed in place
+    :type bits: numpy.ndarray
+    :param idx: indices of the bits to set
+    :type idx: numpy.ndarray
+    """
+    np.bitwise_or.at(bits, idx >> 3, np.left_shift(1, idx & 7).astype(np.uint8))  # Repeated bytes are handled
+
+
+def gather(offsets, targets, nodes):
+    """
+    This function collects the CSR neighbors of many nodes in one vectorized step
+
+    :param offsets: CSR offsets
+    :type offsets: numpy.ndarray
+    :param targets: CSR targets
+    :type targets: numpy.ndarray
+    :param nodes: node ids to collect the neighbors of
+    :type nodes: numpy.ndarray
+    :return: (neighbor ids, the node each neighbor belongs to)
+    :rtype: tuple
+    """
+    starts = offsets[nodes]  # First edge of each node
+    counts = offsets[nodes + 1] - starts  # Number of edges of each node
+    total = int(counts.sum())  # Number of edges collected
+    if total == 0:  # No edges at all
+        return targets[:0], nodes[:0]  # Empty results of the right types
+    positions = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)  # Edge indices
+    return targets[positions], np.repeat(nodes, counts)  # Neighbors and their owners
+
+
+def transpose(offsets, targets, n):
+    """
+    This function builds the CSR arrays of the reversed graph
+
+    :param offsets: CSR offsets
+    :type offsets: numpy.ndarray
+    :param targets: CSR targets
+    :type targets: numpy.ndarray
+    :param n: number of nodes
+    :type n: int
+    :return: (offsets, sources) where sources[offsets[v]:offsets[v + 1]] are the nodes with an edge to v
+    :rtype: tuple
+    """
+    sources = np.repeat(np.arange(n, dtype=targets.dtype), np.diff(offsets))  # Source of every edge
+    order = np.argsort(targets, kind="stable")  # Group the edges by target
+    in_offsets = np.zeros(n + 1, dtype=np.int64)  # First in-edge of every node
+    np.cumsum(np.bincount(targets, minlength=n), out=in_offsets[1:])  # Count in-edges per node
+    return in_offsets, sources[order]  # Reversed graph
+
+
+def bfs_levels(graph, start, goal=None):
+    """
+    This function runs a level-synchronous breadth first search over a CSR graph.
+
+    Every level is expanded at once with array operations, and the frontier and
+    visited sets are packed bit arrays. When the frontier gets wide the search
+    switches bottom-up: instead of pushing along every frontier edge, each
+    unvisited node checks whether any of its in-neighbors is on the frontier,
+    which touches far fewer edges once most of the graph is visited.
+
+    :param graph: the graph
+    :type graph: CSRGraph
+    :param start: id of the start node
+    :type start: int
+    :param goal: id of a node to stop at once it is reached, None to explore everything
+    :type goal: int
+    :return: the level of every node, -1 where it was not reached
+    :rtype: numpy.ndarray
+    """
+    n = graph.node_count()  # Number of nodes
+    offsets = np.frombuffer(graph.offsets, dtype=np.int64)  # View of the CSR offsets, no copy
+    targets = np.frombuffer(graph.targets, dtype=np.int32)  # View of the CSR targets, no copy
+    degree = np.diff(offsets)  # Out-degree of every node
+    reversed_graph = None  # Built the first time the search goes bottom-up
+
+    level = np.full(n, -1, dtype=np.int32)  # Every node starts unreached
+    visited = new_bits(n)  # Nodes reached so far
+    frontier_nodes = np.array([start], dtype=np.int64)  # Nodes reached in the last level
+    set_bits(visited, frontier_nodes)  # The start is reached
+    level[start] = 0  # At level 0
+    unexplored_edges = int(degree.sum()) - int(degree[start])  # Edges of nodes not reached yet
+    bottom_up = False  # Start top-down
+    depth = 0  # Current level
+
+    while frontier_nodes.size:  # Continue until a level adds nothing
+        if goal is not None and level[goal] != -1:  # Goal reached
+            break  # Stop early
+
+        frontier_edges = int(degree[frontier_nodes].sum())  # Edges leaving the frontier
+        if not bottom_up and frontier_edges > unexplored_edges / ALPHA:  # Frontier is wide
+            bottom_up = True  # Switch to bottom-up
+        elif bottom_up and frontier_nodes.size < n / BETA:  # Frontier is narrow again
+            bottom_up = False  # Switch back to top-down
+        depth += 1  # Next level
+
+        if bottom_up:  # Unvisited nodes look for a parent on the frontier
+            if reversed_graph is None:  # Build the in-edges once
+                reversed_graph = transpose(offsets, targets, n)
+            frontier = new_bits(n)  # Bit array of the frontier
+            set_bits(frontier, frontier_nodes)  # Mark its nodes
+            unvisited = np.flatnonzero(~np.unpackbits(visited, count=n, bitorder="little").astype(bool))  # Candidates
+            parents, owners = gather(reversed_graph[0], reversed_graph[1], unvisited)  # Their in-neighbors
+            next_nodes = np.unique(owners[test_bits(frontier, parents)])  # Nodes with a parent on the frontier
+        else:  # Frontier nodes push to their neighbors
+            children, _ = gather(offsets, targets, frontier_nodes)  # Every edge leaving the frontier
+            next_nodes = np.unique(children[~test_bits(visited, children)]).astype(np.int64)  # Only new nodes
+
+        set_bits(visited, next_nodes)  # Mark the new level as visited
+        level[next_nodes] = depth  # Remember their level
+        unexplored_edges -= int(degree[next_nodes].sum())  # Their edges are no longer unexplored
+        frontier_nodes = next_nodes  # The new level is the next frontier
+
+    return level  # Return the levels
+
+
+def bfs(graph, start, goal):
+    """
+    This function checks if the goal can be reached from start with the bitmap breadth first search
+
+    :param graph: the graph, a dictionary of neighbor lists is converted first
+    :type graph: CSRGraph or dict
+    :param start: start node label
+    :type start: hashable
+    :param goal: goal node label
+    :type goal: hashable
+    :return: true if the goal is found, false otherwise
+    :rtype: bool
+    """
+    if isinstance(graph, dict):  # Same input as the list-based bfs
+        graph = CSRGraph.from_dict(graph)  # Convert it once
+    goal_id = graph.index(goal)  # Integer id of the goal
+    return bool(bfs_levels(graph, graph.index(start), goal_id)[goal_id] != -1)  # Reached means a path exists
+
+
+def main():
+    tree = {'A': ['B', 'C'],
+            'B': ['D', 'E'],
+            'C': ['F'],
+            'D': [],
+            'E': ['F'],
+            'F': []}
+    print(bfs(tree, 'A', 'F'))
+    print(bfs(tree, 'F', 'A'))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,12 @@
+from collections import deque
+
+
 def bfs(tree, start, goal):
     """
     This function implements the breadth first search
 
     :param tree: the graph
-    :type tree: dict
+    :type tree: dict or CSRGraph
     :param start:
     :type start: str
     :param goal:
@@ -12,10 +15,10 @@ def bfs(tree, start, goal):
     :rtype: bool
     """
     explored_set = set()  # Track visited nodes, prevents infinite loops
-    shallow = [start]  # FIFO structure for breadth-first exploration
+    shallow = deque([start])  # FIFO structure for breadth-first exploration
 
     while shallow:  # Continue until no more nodes to explore
-        current = shallow.pop(0)  # Get oldest node (FIFO behavior)
+        current = shallow.popleft()  # Get oldest node (FIFO behavior)
 
         if current in explored_set:  # Skip already visited nodes
             continue  # Go to next iteration
@@ -0,0 +1,142 @@
+from array import array
+
+
+class CSRGraph:
+    """Directed graph in compressed sparse row (CSR) form with integer node ids."""
+
+    def __init__(self, offsets, targets, labels=None, ids=None):
+        """
+        Initialize the graph from its CSR arrays.
+
+        The neighbors of node i are targets[offsets[i]:offsets[i + 1]], so the
+        whole graph is two flat integer arrays instead of a dict of lists.
+
+        :param offsets: array of node count + 1 edge offsets
+        :type offsets: array
+        :param targets: array of edge targets, grouped by source node
+        :type targets: array
+        :param labels: label of each node id, ids are their own labels if None
+        :type labels: list
+        :param ids: label -> id dictionary matching labels, built from labels if None
+        :type ids: dict
+        :raises ValueError: if the arrays do not describe a valid graph
+        """
+        if len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != len(targets):  # Offsets must cover every edge
+            raise ValueError("offsets must start at 0 and end at the number of edges")
+        if labels is not None and len(labels) != len(offsets) - 1:  # One label per node
+            raise ValueError("labels must have one entry per node")
+
+        self.offsets = offsets  # Where each node's neighbors start in targets
+        self.targets = targets  # Neighbor ids of every node, one after the other
+        self.labels = labels  # Label of each node id
+        if ids is None and labels is not None:  # No lookup given
+            ids = {label: i for i, label in enumerate(labels)}  # Build it from the labels
+        self.ids = ids  # Label -> id
+
+    @classmethod
+    def from_dict(cls, tree):
+        """
+        Build a CSR graph from a dictionary of neighbor lists like the ones bfs and dfs take.
+
+        :param tree: the graph, node -> list of neighbor nodes
+        :type tree: dict
+        :return: the same graph in CSR form
+        :rtype: CSRGraph
+        """
+        labels = list(tree)  # Every node with an entry
+        ids = {label: i for i, label in enumerate(labels)}  # Label -> id
+        for neighbors in tree.values():  # Nodes that only appear as neighbors
+            for neighbor in neighbors:
+                if neighbor not in ids:  # Not seen yet
+                    ids[neighbor] = len(labels)  # Give it the next id
+                    labels.append(neighbor)  # Remember its label
+
+        offsets = array('q', [0])  # First node starts at edge 0
+        targets = array('i')  # Edge targets
+        for label in labels:  # Nodes in id order
+            targets.extend(ids[neighbor] for neighbor in tree.get(label, []))  # Its neighbors
+            offsets.append(len(targets))  # Next node starts after them
+
+        return cls(offsets, targets, labels, ids)  # Return the graph
+
+    def node_count(self):
+        """
+        Return the number of nodes.
+
+        :return: number of nodes
+        :rtype: int
+        """
+        return len(self.offsets) - 1  # One offset more than nodes
+
+    def edge_count(self):
+        """
+        Return the number of edges.
+
+        :return: number of edges
+        :rtype: int
+        """
+        return len(self.targets)  # One target per edge
+
+    def index(self, label):
+        """
+        Return the integer id of a node label.
+
+        :param label: node label
+        :type label: hashable
+        :return: node id
+        :rtype: int
+        :raises KeyError: if the label is not in the graph
+        """
+        if self.ids is None:  # Ids are their own labels
+            if not 0 <= label < self.node_count():  # Outside the graph
+                raise KeyError(label)
+            return label  # Return the id
+        return self.ids[label]  # Look the label up
+
+    def label(self, i):
+        """
+        Return the label of a node id.
+
+        :param i: node id
+        :type i: int
+        :return: node label
+        :rtype: hashable
+        """
+        return i if self.labels is None else self.labels[i]  # Ids are their own labels if there are none
+
+    def neighbors(self, i):
+        """
+        Return the neighbor ids of a node id.
+
+        :param i: node id
+        :type i: int
+        :return: the neighbor ids
+        :rtype: array
+        """
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]  # Slice of the targets array
+
+    def __getitem__(self, label):
+        """
+        Return the neighbor labels of a node, so bfs and dfs can use the graph like a dict.
+
+        :param label: node label
+        :type label: hashable
+        :return: labels of the node's neighbors
+        :rtype: list
+        """
+        return [self.label(i) for i in self.neighbors(self.index(label))]  # Translate ids back to labels
+
+    def __contains__(self, label):
+        """
+        Check if a label is a node of the graph.
+
+        :param label: node label
+        :type label: hashable
+        :return: True if the graph has the node
+        :rtype: bool
+        """
+        try:
+            self.index(label)  # Look the label up
+        except (KeyError, TypeError):  # Unknown label
+            return False  # Not in the graph
+        return True  # Found it
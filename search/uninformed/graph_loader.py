@@ -0,0 +1,135 @@
+import os
+import sys
+from array import array
+
+import numpy as np
+
+from csr_graph import CSRGraph
+
+CHUNK_EDGES = 1 << 20  # Edges read at once from binary files
+
+
+def load_edge_list(filename, fmt=None, directed=True, skip_header=False):
+    """
+    This function streams an edge-list file into a compact CSR graph.
+
+    Text files have one "source<sep>target" edge per line ('#' starts a comment)
+    and their node labels are interned: each distinct label is stored once and
+    edges only hold 4-byte integer ids. Binary files are pairs of little-endian
+    int32 node ids and are used as ids directly. Edges are never kept as Python
+    objects, so memory is a few bytes per edge instead of a list entry per edge.
+
+    :param filename: path of the edge-list file
+    :type filename: str
+    :param fmt: 'tsv', 'csv', 'txt' (any whitespace) or 'bin', guessed from the extension if None
+    :type fmt: str
+    :param directed: if False every edge is also added in the other direction
+    :type directed: bool
+    :param skip_header: if True the first line of a text file is ignored
+    :type skip_header: bool
+    :return: the graph, usable by bfs and dfs directly
+    :rtype: CSRGraph
+    :raises ValueError: if the format is unknown or a line is not an edge
+    """
+    if fmt is None:  # Guess the format from the extension
+        fmt = os.path.splitext(filename)[1].lstrip('.').lower() or 'txt'
+    sources = array('i')  # Source id of every edge, in file order
+    targets = array('i')  # Target id of every edge, in file order
+
+    if fmt == 'bin':  # Packed int32 pairs
+        labels, ids = None, None  # Ids are their own labels
+        with open(filename, 'rb') as f:  # Open the file for binary reading
+            while True:  # Read one chunk at a time
+                chunk = array('i')  # Ids of this chunk
+                chunk.frombytes(f.read(CHUNK_EDGES * 8))  # Two 4-byte ids per edge
+                if not chunk:  # End of file
+                    break  # Done reading
+                if sys.byteorder == 'big':  # File is little-endian
+                    chunk.byteswap()  # Fix the byte order
+                sources.extend(chunk[0::2])  # Even positions are sources
+                targets.extend(chunk[1::2])  # Odd positions are targets
+        node_count = max(max(sources, default=-1), max(targets, default=-1)) + 1  # Largest id + 1
+    elif fmt in ('tsv', 'csv', 'txt'):  # Text edge list
+        separator = {'tsv': '\t', 'csv': ',', 'txt': None}[fmt]  # None splits on any whitespace
+        ids = {}  # Label -> id, in first-seen order
+        with open(filename, encoding='utf-8') as f:  # Open the file for reading
+            if skip_header:  # First line names the columns
+                next(f, None)  # Skip it
+            for number, line in enumerate(f, 2 if skip_header else 1):  # Stream the file, numbering lines from 1
+                line = line.split('#', 1)[0].strip()  # Drop comments and surrounding whitespace
+                if not line:  # Blank or comment-only line
+                    continue  # Go to next iteration
+                fields = line.split(separator)  # Split the edge
+                if len(fields) < 2:  # Not an edge
+                    raise ValueError(f"line {number} of {filename} is not an edge: {line!r}")
+                sources.append(ids.setdefault(fields[0].strip(), len(ids)))  # Intern the source label
+                targets.append(ids.setdefault(fields[1].strip(), len(ids)))  # Intern the target label
+        labels = list(ids)  # Insertion order is id order
+        node_count = len(labels)  # One node per distinct label
+    else:
+        raise ValueError(f"unknown edge-list format {fmt!r}")
+
+    if not directed:  # Add the reverse of every edge
+        sources, targets = sources + targets, targets + sources
+
+    offsets, csr_targets = build_csr(sources, targets, node_count)  # Group the edges by source
+    return CSRGraph(offsets, csr_targets, labels, ids)  # Return the graph
+
+
+def build_csr(sources, targets, node_count):
+    """
+    This function groups an edge list by source with a counting sort
+
+    The per-node edge counts come from bincount and their prefix sums are the
+    offsets. A stable argsort by source then puts every node's targets in
+    file order, all in NumPy instead of a Python loop per edge.
+
+    :param sources: source id of every edge
+    :type sources: array
+    :param targets: target id of every edge
+    :type targets: array
+    :param node_count: number of nodes
+    :type node_count: int
+    :return: (offsets, targets) CSR arrays
+    :rtype: tuple
+    """
+    source_ids = np.frombuffer(sources, dtype=np.int32)  # View of the source ids, no copy
+    target_ids = np.frombuffer(targets, dtype=np.int32)  # View of the target ids, no copy
+    offsets = np.zeros(node_count + 1, dtype=np.int64)  # First edge of every node
+    np.cumsum(np.bincount(source_ids, minlength=node_count), out=offsets[1:])  # Count the edges per node
+    order = np.argsort(source_ids, kind="stable")  # Group the edges by source, keeping file order
+    return array('q', offsets.tobytes()), array('i', target_ids[order].tobytes())  # Return the CSR arrays
+
+
+def save_binary(filename, edges):
+    """
+    This function writes integer edges in the binary format read by load_edge_list
+
+    :param filename: path of the file to write
+    :type filename: str
+    :param edges: (source id, target id) pairs
+    :type edges: iterable
+    """
+    data = array('i')  # Packed ids
+    for source, target in edges:  # Every edge
+        data.append(source)  # Source first
+        data.append(target)  # Then target
+    if sys.byteorder == 'big':  # File is little-endian
+        data.byteswap()  # Fix the byte order
+    with open(filename, 'wb') as f:  # Open the file for binary writing
+        data.tofile(f)  # Write the ids
+
+
+def main():
+    from breadth_first_search import bfs
+
+    with open("edges.tsv", "w", encoding="utf-8") as f:
+        f.write("A\tB\nA\tC\nB\tD\nB\tE\nC\tF\nE\tF\n")
+
+    graph = load_edge_list("edges.tsv")
+    print(graph.node_count(), graph.edge_count(), bfs(graph, 'A', 'F'))
+    os.remove("edges.tsv")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
-goal = ("x", "y")
+import heapq
+import itertools
 
-def solve_maze(maze, start, end):
+nodes_expanded = 0  # Number of positions expanded by the last search
+
+def solve_maze(maze, start, end, heuristic=None):
     """
     This function uses a GFS algorithm to find a path from start to end in a maze.
 
@@ -10,28 +13,32 @@ def solve_maze(maze, start, end):
     :type start: tuple
     :param end: end position
     :type end: tuple
+    :param heuristic: function estimating the distance from a position to end, defaults to h measured to end
+    :type heuristic: function
     :return: the path from start to end if it exists, False otherwise
-    :rtype: bool
+    :rtype: list or bool
     """
-    visited = []  # List to keep track of positions we've already checked
-    queue = [start]  # Queue of positions to check next (starts with just the start position)
+    global nodes_expanded  # This tells Python you want to modify the global variable
+    nodes_expanded = 0  # Reset the expansion counter
 
-    while queue:  # Keep looping while there are positions to check
-        best = 0  # Initialize best position index to 0
-        for i in range(len(queue)):  # Loop through all positions in queue
-            if h(queue[i]) < h(queue[best]):  # If current position is closer to end than best
-                best = i  # Update best position index
+    if heuristic is None:  # No heuristic given
+        heuristic = lambda n: h(n, end)  # Use the manhattan distance to end
 
-        current = queue.pop(best)  # Take the closest position to end from queue
+    order = itertools.count()  # Insertion counter, ties are taken in the order they were added
+    queue = [(heuristic(start), next(order), start)]  # Heap of positions to check next (starts with just the start position)
+    parent = {start: None}  # Where each position was reached from, also tells which positions were already queued
 
-        if current == end:  # If we reached the end position, we found a path!
-            return True  # Success! Path exists
-
-        if current in visited:  # If we already checked this position, skip it
+    while queue:  # Keep looping while there are positions to check
+        _, _, current = heapq.heappop(queue)  # Take the closest position to end from queue
 
-            continue  # Go to next iteration of while loop
+        if current == end:  # If we reached the end position, we found a path!
+            path = []  # Positions from end back to start
+            while current is not None:  # Stop once we passed the start
+                path.append(current)  # Add the position
+                current = parent[current]  # Move to the previous position
+            return path[::-1]  # Success! Return the path from start to end
 
-        visited.append(current)  # Mark this position as visited so we don't check it again
+        nodes_expanded += 1  # Count this expansion
         row, col = current  # Get current row and column from the tuple
 
         for dr, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:  # Check all 4 directions: right, down, left, up
@@ -41,27 +48,28 @@ def solve_maze(maze, start, end):
             if (0 <= new_row < len(maze) and  # New row is within maze bounds
                     0 <= new_col < len(maze[0]) and  # New column is within maze bounds
                     maze[new_row][new_col] != '*' and  # New position is not a wall
-                    (new_row, new_col) not in visited):  # We haven't been here before
+                    (new_row, new_col) not in parent):  # We haven't queued this position before
 
-                queue.append((new_row, new_col))  # Add this valid new position to our queue to check later
+                parent[(new_row, new_col)] = current  # Remember where we came from
+                heapq.heappush(queue, (heuristic((new_row, new_col)), next(order), (new_row, new_col)))  # Add it to our queue to check later
 
     return False  # If we exit the while loop, queue is empty and we never found end
 
 
-def h(n):
+def h(n, goal):
     """
     This function returns the manhattan distance between two positions
 
     :param n: our current position
     :type n: tuple
+    :param goal: position to measure to
+    :type goal: tuple
     :return: the manhattan distance between two positions
     :rtype: int
     """
     return abs(n[0] - goal[0]) + abs(n[1] - goal[1])  # Calculate Manhattan distance between two positions
 
 def main():
-    global goal
-
     maze = []
     for i in range(10):
         maze.append(list(input()))
@@ -69,13 +77,12 @@ def main():
     start = (0, 0)
     goal = (int(input()), int(input()))  # Get goal from input
 
-    if solve_maze(maze, start, goal):
+    path = solve_maze(maze, start, goal)
+    if path:
         print("Path exists!")
+        print(path)
     else:
         print("Path does not exist.")
 
 if __name__ == "__main__":
     main()
-
-if __name__ == "__main__":
-    main()
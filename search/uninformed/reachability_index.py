@@ -0,0 +1,253 @@
+import random
+from array import array
+
+from csr_graph import CSRGraph
+
+DEFAULT_MEMORY_BUDGET = 32 * 1024 * 1024  # Closure bytes allowed by default, about 16,000 components
+
+
+class ReachabilityIndex:
+    """Index built once per static graph that answers "is goal reachable from start" without a traversal."""
+
+    def __init__(self, graph, memory_budget=DEFAULT_MEMORY_BUDGET, labels=3, seed=0):
+        """
+        Build the index.
+
+        Strongly connected components are collapsed first, since every node of
+        a component reaches every other one, which leaves a DAG. If a full
+        transitive-closure bitset of that DAG (components^2 / 8 bytes) fits in
+        memory_budget it is stored and every query is one bit lookup. Otherwise
+        each component gets a few interval labels from random post-order
+        traversals: a component can only reach another if all of its intervals
+        contain the other's, so most negative queries are answered in O(labels)
+        and the rest fall back to a DFS pruned by the same test.
+
+        The default budget of 32 MiB keeps the closure to graphs of up to
+        about 16,000 components; it grows with the square of the component
+        count, so a graph with a million components would need about 125 GB.
+        Pass None only when the closure is known to fit.
+
+        :param graph: the graph, a dictionary of neighbor lists is converted first
+        :type graph: CSRGraph or dict
+        :param memory_budget: bytes the closure bitsets may use, None to always build the closure
+        :type memory_budget: int
+        :param labels: number of interval labels to use when the closure does not fit
+        :type labels: int
+        :param seed: random seed for the interval traversals
+        :type seed: int
+        """
+        if isinstance(graph, dict):  # Same input as bfs and dfs
+            graph = CSRGraph.from_dict(graph)  # Convert it once
+        self.graph = graph  # Graph the index was built for
+        self.component = self.strongly_connected_components()  # Component id of every node
+        self.count = max(self.component, default=-1) + 1  # Number of components
+
+        self.dag = [set() for _ in range(self.count)]  # Component -> components it has an edge to
+        for v in range(graph.node_count()):  # Every node
+            for w in graph.neighbors(v):  # Every edge leaving it
+                if self.component[v] != self.component[w]:  # Edge between two components
+                    self.dag[self.component[v]].add(self.component[w])  # Keep it once in the DAG
+        self.dag = [sorted(successors) for successors in self.dag]  # Lists are smaller than sets
+
+        self.row_bytes = (self.count + 7) // 8  # Bytes per closure bitset
+        if memory_budget is None or self.row_bytes * self.count <= memory_budget:  # The closure fits
+            self.kind = "closure"  # O(1) bit lookups
+            self.closure = self.build_closure()  # One bitset per component
+        else:
+            self.kind = "interval"  # Interval labels with a pruned fallback
+            self.intervals = [self.build_intervals(random.Random(seed + i)) for i in range(labels)]  # Labels
+
+    def strongly_connected_components(self):
+        """
+        Find the strongly connected components with an iterative Tarjan search.
+
+        Components are numbered in the order Tarjan finishes them, so every DAG
+        edge goes from a higher component id to a lower one.
+
+        :return: component id of every node
+        :rtype: array
+        """
+        offsets, targets = self.graph.offsets, self.graph.targets  # CSR arrays
+        n = self.graph.node_count()  # Number of nodes
+        order = array('i', [-1]) * n  # Discovery order of every node, -1 if not discovered
+        low = array('i', [0]) * n  # Lowest discovery order reachable through the DFS subtree
+        component = array('i', [-1]) * n  # Component of every node
+        on_stack = bytearray(n)  # 1 while the node is on the Tarjan stack
+        stack = []  # Nodes whose component is not decided yet
+        counter = 0  # Next discovery order
+        count = 0  # Next component id
+
+        for root in range(n):  # Start a DFS from every undiscovered node
+            if order[root] != -1:  # Already discovered
+                continue  # Go to next iteration
+            order[root] = low[root] = counter  # Discover the root
+            counter += 1  # Next discovery order
+            stack.append(root)  # Put it on the Tarjan stack
+            on_stack[root] = 1  # Remember it is there
+            work = [[root, offsets[root]]]  # DFS frames of [node, next edge]
+
+            while work:  # Continue until the DFS from root is done
+                frame = work[-1]  # Deepest frame
+                v = frame[0]  # Its node
+                if frame[1] < offsets[v + 1]:  # Edges left to try
+                    w = targets[frame[1]]  # Node the next edge leads to
+                    frame[1] += 1  # Move past this edge
+                    if order[w] == -1:  # Not discovered yet, go deeper
+                        order[w] = low[w] = counter  # Discover it
+                        counter += 1  # Next discovery order
+                        stack.append(w)  # Put it on the Tarjan stack
+                        on_stack[w] = 1  # Remember it is there
+                        work.append([w, offsets[w]])  # Explore it next
+                    elif on_stack[w]:  # Edge back into the current component
+                        low[v] = min(low[v], order[w])  # v reaches an older node
+                    continue  # Go to next iteration
+
+                work.pop()  # All edges of v tried
+                if work:  # Pass the low value up to the parent
+                    low[work[-1][0]] = min(low[work[-1][0]], low[v])
+                if low[v] == order[v]:  # v is the root of a component
+                    while True:  # Pop the whole component
+                        w = stack.pop()  # Next node of the component
+                        on_stack[w] = 0  # It leaves the stack
+                        component[w] = count  # It belongs to this component
+                        if w == v:  # Reached the root
+                            break  # Component done
+                    count += 1  # Next component id
+
+        return component  # Return the component ids
+
+    def build_closure(self):
+        """
+        Compute the transitive closure of the component DAG as packed bitsets.
+
+        :return: row c holds bit d set if component c reaches component d
+        :rtype: bytearray
+        """
+        reach = [0] * self.count  # Closure of every component as a Python int bitset
+        for c in range(self.count):  # Successors always have lower ids, so they are done first
+            bits = 1 << c  # A component reaches itself
+            for successor in self.dag[c]:  # Everything a successor reaches
+                bits |= reach[successor]  # Is reached too
+            reach[c] = bits  # Remember the closure
+
+        closure = bytearray()  # All rows, one after the other
+        for bits in reach:  # Every component in id order
+            closure += bits.to_bytes(self.row_bytes, "little")  # Fixed-size row
+        return closure  # Return the bitsets
+
+    def build_intervals(self, rng):
+        """
+        Label every component with an interval from one random post-order traversal of the DAG.
+
+        :param rng: random generator that shuffles the child order
+        :type rng: random.Random
+        :return: (low, post) arrays, component c covers [low[c], post[c]]
+        :rtype: tuple
+        """
+        post = array('i', [-1]) * self.count  # Post-order rank of every component
+        low = array('i', [0]) * self.count  # Smallest rank below every component
+        rank = 0  # Next post-order rank
+        roots = list(range(self.count))  # Start from every component, finished ones are skipped
+        rng.shuffle(roots)  # Random start order
+
+        for root in roots:  # Every possible start
+            if post[root] != -1:  # Already labeled
+                continue  # Go to next iteration
+            post[root] = -2  # Mark as in progress
+            children = self.dag[root][:]  # Copy so the shuffle does not change the DAG
+            rng.shuffle(children)  # Random child order
+            work = [(root, iter(children))]  # DFS frames of (component, untried children)
+
+            while work:  # Continue until this traversal is done
+                c, untried = work[-1]  # Deepest frame
+                child = next(untried, None)  # Next child
+                if child is not None:  # Child left to try
+                    if post[child] == -1:  # Not visited yet, go deeper
+                        post[child] = -2  # Mark as in progress
+                        children = self.dag[child][:]  # Copy so the shuffle does not change the DAG
+                        rng.shuffle(children)  # Random child order
+                        work.append((child, iter(children)))  # Explore it next
+                    continue  # Go to next iteration
+
+                work.pop()  # All children of c done
+                post[c] = rank  # Post-order rank
+                low[c] = min([rank] + [low[d] for d in self.dag[c]])  # Interval covers every descendant
+                rank += 1  # Next rank
+
+        return low, post  # Return the labels
+
+    def may_reach(self, a, b):
+        """
+        Check the interval labels of two components.
+
+        :param a: source component
+        :type a: int
+        :param b: target component
+        :type b: int
+        :return: False if a certainly cannot reach b, True if it might
+        :rtype: bool
+        """
+        for low, post in self.intervals:  # Every label
+            if not (low[a] <= low[b] and post[b] <= post[a]):  # b's interval is not inside a's
+                return False  # Reaching b would put it inside
+        return True  # Every label allows it
+
+    def reachable(self, start, goal):
+        """
+        Check if goal can be reached from start.
+
+        :param start: start node label
+        :type start: hashable
+        :param goal: goal node label
+        :type goal: hashable
+        :return: true if the goal is reachable, false otherwise
+        :rtype: bool
+        """
+        a = self.component[self.graph.index(start)]  # Component of the start
+        b = self.component[self.graph.index(goal)]  # Component of the goal
+        if a == b:  # Same component
+            return True  # Every node reaches every other one
+
+        if self.kind == "closure":  # One bit lookup
+            return bool(self.closure[a * self.row_bytes + (b >> 3)] & (1 << (b & 7)))
+
+        if not self.may_reach(a, b):  # Labels rule it out
+            return False  # Certainly unreachable
+        seen = {a}  # Components visited by the fallback
+        stack = [a]  # LIFO structure for depth-first exploration
+        while stack:  # Continue until no more components to explore
+            for child in self.dag[stack.pop()]:  # Every DAG edge
+                if child == b:  # Found the goal component
+                    return True  # Success - path exists
+                if child not in seen and self.may_reach(child, b):  # Only branches that may lead to b
+                    seen.add(child)  # Mark as visited
+                    stack.append(child)  # Explore it later
+        return False  # No path found - goal unreachable
+
+    def memory_bytes(self):
+        """
+        Return the approximate memory used by the query structures.
+
+        :return: bytes used by the component ids and the closure or the labels
+        :rtype: int
+        """
+        size = self.component.itemsize * len(self.component)  # Component id per node
+        if self.kind == "closure":  # Bitsets
+            return size + len(self.closure)
+        return size + sum(low.itemsize * len(low) * 2 for low, _ in self.intervals)  # Two ints per label
+
+
+def main():
+    tree = {'A': ['B', 'C'],
+            'B': ['D', 'E'],
+            'C': ['F'],
+            'D': ['B'],
+            'E': ['F'],
+            'F': []}
+    for budget in [None, 0]:
+        index = ReachabilityIndex(tree, memory_budget=budget)
+        print(index.kind, index.reachable('A', 'F'), index.reachable('D', 'E'), index.reachable('F', 'A'))
+
+
+if __name__ == "__main__":
+    main()